@@ -3,24 +3,314 @@
 로컬 CI/CD 설정 파일을 파싱하고 명령어를 안전하게 실행합니다.
 """
 import os
+import copy
+import uuid
 import yaml
+import logging
 import time
+import shlex
+import stat
+import signal
+import selectors
+import threading
+import functools
 import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional, Union
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Optional, Union, Mapping, Callable
 
 from utils.logger import setup_logger
 
+# libyaml C 바인딩이 있으면 사용하고, 없으면 순수 파이썬 로더로 대체
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # 로거 설정
 logger = setup_logger(__name__)
 
 # CI/CD 설정 파일 기본 이름
 CI_CONFIG_FILE = '.local_ci.yaml'
 
+# 동시에 실행할 최대 단계 수 (단계는 하위 프로세스를 기다리는 I/O 작업이므로 CPU 수와 무관하게 제한)
+MAX_PARALLEL_STEPS = 8
+
+# 파싱된 CI/CD 설정 캐시 (절대 경로 -> (mtime_ns, 파일 크기, 설정))
+_CI_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_CI_CONFIG_CACHE_MAX = 100
+_CI_CONFIG_CACHE_LOCK = threading.Lock()
+
+# 추출된 명령어 목록 캐시 (절대 경로 -> (mtime_ns, 파일 크기, 불변 명령어 목록))
+_CI_COMMANDS_CACHE: "OrderedDict[str, Tuple[int, int, Tuple[Mapping[str, Any], ...]]]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: str, st: os.stat_result) -> Optional[Any]:
+    """
+    파일 상태가 일치하는 캐시 항목을 반환합니다.
+    
+    Args:
+        cache (OrderedDict): 조회할 캐시
+        key (str): 캐시 키 (절대 경로)
+        st (os.stat_result): 현재 파일 상태
+    
+    Returns:
+        Optional[Any]: 캐시된 값 또는 None (없거나 오래된 경우)
+    """
+    with _CI_CONFIG_CACHE_LOCK:
+        entry = cache.get(key)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            cache.move_to_end(key)
+            return entry[2]
+    return None
+
+
+def _cache_put(cache: OrderedDict, key: str, st: os.stat_result, value: Any) -> None:
+    """
+    캐시에 값을 저장하고 최대 크기를 넘으면 가장 오래된 항목을 제거합니다.
+    
+    Args:
+        cache (OrderedDict): 저장할 캐시
+        key (str): 캐시 키 (절대 경로)
+        st (os.stat_result): 값을 읽을 때의 파일 상태
+        value (Any): 저장할 값
+    """
+    with _CI_CONFIG_CACHE_LOCK:
+        cache[key] = (st.st_mtime_ns, st.st_size, value)
+        cache.move_to_end(key)
+        if len(cache) > _CI_CONFIG_CACHE_MAX:
+            cache.popitem(last=False)
+
+
+class _LineStream:
+    """파이프에서 읽은 바이트를 줄 단위로 나누어 로거와 콜백에 전달하는 클래스"""
+    
+    def __init__(self, callback: Optional[Callable[[str], None]] = None,
+                 stop_marker: Optional[bytes] = None):
+        """
+        줄 스트림 초기화
+        
+        Args:
+            callback (Optional[Callable[[str], None]], optional): 줄마다 호출할 콜백
+            stop_marker (Optional[bytes], optional): 이 표식이 나타나면 이후 출력은 무시
+        """
+        self.callback = callback
+        self.stop_marker = stop_marker
+        self._pending = bytearray()
+        self._stopped = False
+    
+    def feed(self, chunk: bytes) -> None:
+        """읽은 바이트를 추가하고 완성된 줄을 전달"""
+        if self._stopped:
+            return
+        
+        self._pending += chunk
+        while True:
+            newline = self._pending.find(b'\n')
+            if newline == -1:
+                return
+            
+            line = bytes(self._pending[:newline + 1])
+            del self._pending[:newline + 1]
+            
+            if self.stop_marker is not None:
+                marker_pos = line.find(self.stop_marker)
+                if marker_pos != -1:
+                    if marker_pos:
+                        self._emit(line[:marker_pos])
+                    self._stopped = True
+                    self._pending.clear()
+                    return
+            
+            self._emit(line)
+    
+    def flush(self) -> None:
+        """줄바꿈 없이 남은 출력을 전달"""
+        if self._pending and not self._stopped:
+            self._emit(bytes(self._pending))
+        self._pending.clear()
+    
+    def _emit(self, data: bytes) -> None:
+        """한 줄을 디코딩하여 로거와 콜백에 전달"""
+        text = data.decode('utf-8', errors='replace')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", text.rstrip('\n'))
+        if self.callback:
+            self.callback(text)
+
+
+def _read_pipes(pipes: Dict[int, Tuple[bytearray, _LineStream]], deadline: float,
+                is_complete: Optional[Callable[[], bool]] = None) -> bool:
+    """
+    여러 파이프를 논블로킹으로 동시에 읽어 버퍼에 누적하고 줄 단위로 스트리밍합니다.
+    
+    Args:
+        pipes (Dict[int, Tuple[bytearray, _LineStream]]): 파일 디스크립터 -> (버퍼, 줄 스트림)
+        deadline (float): time.monotonic() 기준 마감 시각
+        is_complete (Optional[Callable[[], bool]], optional): 
+            읽기 완료 조건 (없으면 모든 파이프가 EOF일 때 완료)
+    
+    Returns:
+        bool: 완료 조건 충족 여부 (is_complete가 있는데 먼저 EOF에 도달하면 False)
+    
+    Raises:
+        TimeoutError: 마감 시각 초과 시
+    """
+    with selectors.DefaultSelector() as selector:
+        for fd in pipes:
+            os.set_blocking(fd, False)
+            selector.register(fd, selectors.EVENT_READ)
+        
+        while True:
+            if is_complete is not None and is_complete():
+                return True
+            
+            if not selector.get_map():
+                for _, stream in pipes.values():
+                    stream.flush()
+                return is_complete is None
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            
+            for key, _ in selector.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                buffer, stream = pipes[key.fd]
+                if chunk:
+                    buffer += chunk
+                    stream.feed(chunk)
+                else:
+                    selector.unregister(key.fd)
+
+
+class _PersistentShell:
+    """
+    파이프라인의 여러 단계가 공유하는 장기 실행 셸 프로세스
+    단계마다 새 프로세스를 생성하는 대신 하나의 셸에 명령어를 전달하고,
+    종료 표식으로 각 단계의 출력과 반환 코드를 구분합니다.
+    """
+    
+    def __init__(self):
+        """셸 초기화 (프로세스는 첫 실행 시 생성)"""
+        self.process = None
+        self._token = uuid.uuid4().hex
+        self._counter = 0
+    
+    def _ensure_process(self) -> None:
+        """셸 프로세스가 없거나 종료되었으면 새로 생성"""
+        if self.process is not None and self.process.poll() is None:
+            return
+        
+        self.process = subprocess.Popen(
+            ['/bin/sh'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,  # 타임아웃 시 프로세스 그룹 전체를 종료하기 위함
+        )
+    
+    def run(self, command: str, cwd: str, timeout: float,
+            line_callback: Optional[Callable[[str], None]] = None) -> Tuple[int, str, str]:
+        """
+        셸에서 명령어를 실행하고 결과를 반환합니다.
+        각 명령어는 서브셸에서 실행되므로 디렉토리 이동이나 변수 설정이 다음 단계에 영향을 주지 않습니다.
+        
+        Args:
+            command (str): 실행할 셸 명령어
+            cwd (str): 작업 디렉토리
+            timeout (float): 타임아웃 (초)
+            line_callback (Optional[Callable[[str], None]], optional): 출력 줄마다 호출할 콜백
+        
+        Returns:
+            Tuple[int, str, str]: (반환 코드, 표준 출력, 표준 오류)
+        
+        Raises:
+            subprocess.TimeoutExpired: 타임아웃 초과 시 (셸은 종료됨)
+        """
+        self._ensure_process()
+        self._counter += 1
+        marker = f"__CI_STEP_END_{self._token}_{self._counter}__"
+        script = (
+            f"( cd {shlex.quote(cwd)} && eval {shlex.quote(command)} ) </dev/null\n"
+            f"printf '%s %s\\n' {marker} $?\n"
+            f"printf '%s\\n' {marker} >&2\n"
+        )
+        self.process.stdin.write(script.encode('utf-8'))
+        self.process.stdin.flush()
+        
+        marker_bytes = marker.encode('ascii')
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        pipes = {
+            self.process.stdout.fileno(): (stdout_buf, _LineStream(line_callback, marker_bytes)),
+            self.process.stderr.fileno(): (stderr_buf, _LineStream(line_callback, marker_bytes)),
+        }
+        
+        def is_complete() -> bool:
+            stdout_end = stdout_buf.find(marker_bytes)
+            return (stdout_end != -1 and stdout_buf.find(b'\n', stdout_end) != -1
+                    and stderr_buf.find(marker_bytes) != -1)
+        
+        try:
+            completed = _read_pipes(pipes, time.monotonic() + timeout, is_complete)
+        except TimeoutError:
+            self.kill()
+            raise subprocess.TimeoutExpired(command, timeout)
+        
+        if not completed:
+            self.close()
+            raise RuntimeError("셸 프로세스가 예기치 않게 종료되었습니다.")
+        
+        stdout_end = stdout_buf.find(marker_bytes)
+        line_end = stdout_buf.find(b'\n', stdout_end)
+        return_code = int(stdout_buf[stdout_end + len(marker_bytes):line_end].strip())
+        stdout = stdout_buf[:stdout_end].decode('utf-8', errors='replace')
+        stderr = stderr_buf[:stderr_buf.find(marker_bytes)].decode('utf-8', errors='replace')
+        return return_code, stdout, stderr
+    
+    def kill(self) -> None:
+        """셸과 셸이 실행한 모든 하위 프로세스를 강제 종료"""
+        if self.process is None:
+            return
+        
+        if self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        self.close()
+    
+    def close(self) -> None:
+        """셸 입력을 닫고 프로세스 종료를 기다림"""
+        if self.process is None:
+            return
+        
+        process, self.process = self.process, None
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            process.wait()
+        
+        process.stdout.close()
+        process.stderr.close()
+
 
 def load_ci_config(repo_path: str) -> Tuple[bool, Union[Dict[str, Any], str]]:
     """
     리포지토리의 CI/CD 설정 파일을 로드합니다.
+    파일의 수정 시각과 크기가 바뀌지 않았다면 캐시된 설정의 복사본을 반환합니다.
     
     Args:
         repo_path (str): 리포지토리 경로
@@ -31,17 +321,35 @@ def load_ci_config(repo_path: str) -> Tuple[bool, Union[Dict[str, Any], str]]:
     """
     config_path = os.path.join(repo_path, CI_CONFIG_FILE)
     
-    if not os.path.exists(config_path):
+    try:
+        # 존재 확인을 따로 하지 않고 stat 한 번으로 확인 (결과는 캐시 검증에도 사용)
+        st = os.stat(config_path)
+    except FileNotFoundError:
         error_msg = f"CI/CD 설정 파일을 찾을 수 없습니다: {config_path}"
         logger.warning(error_msg)
         return False, error_msg
+    except OSError as e:
+        error_msg = f"CI/CD 설정 파일 로드 중 오류 발생: {str(e)}"
+        logger.error(error_msg)
+        return False, error_msg
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        cache_key = os.path.abspath(config_path)
+        
+        cached = _cache_get(_CI_CONFIG_CACHE, cache_key, st)
+        if cached is not None:
+            # 호출자가 설정을 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return True, copy.deepcopy(cached)
+        
+        # 파일 전체를 bytes로 한 번에 읽고, UTF-8 디코딩은 YAML 파서에 맡김
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        config = yaml.load(data, Loader=_SafeLoader)
         
-        logger.info(f"CI/CD 설정 파일을 로드했습니다: {config_path}")
-        return True, config
+        _cache_put(_CI_CONFIG_CACHE, cache_key, st, config)
+        
+        logger.info("CI/CD 설정 파일을 로드했습니다: %s", config_path)
+        return True, copy.deepcopy(config)
     except yaml.YAMLError as e:
         error_msg = f"CI/CD 설정 파일 파싱 중 오류 발생: {str(e)}"
         logger.error(error_msg)
@@ -52,10 +360,36 @@ def load_ci_config(repo_path: str) -> Tuple[bool, Union[Dict[str, Any], str]]:
         return False, error_msg
 
 
+def load_many_ci_configs(repo_paths: List[str], 
+                         max_workers: int = 8) -> Dict[str, Tuple[bool, Union[Dict[str, Any], str]]]:
+    """
+    여러 리포지토리의 CI/CD 설정 파일을 한 번에 로드합니다.
+    변경되지 않은 설정은 캐시에서 반환되고, 나머지 파일은 동시에 읽어 파일 I/O 대기 시간을 겹칩니다.
+    
+    Args:
+        repo_paths (List[str]): 리포지토리 경로 목록
+        max_workers (int, optional): 동시에 읽을 최대 파일 수
+    
+    Returns:
+        Dict[str, Tuple[bool, Union[Dict[str, Any], str]]]: 
+            리포지토리 경로 -> (성공 여부, CI/CD 설정 또는 오류 메시지)
+    """
+    if len(repo_paths) <= 1:
+        return {repo_path: load_ci_config(repo_path) for repo_path in repo_paths}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(repo_paths))) as executor:
+        return dict(zip(repo_paths, executor.map(load_ci_config, repo_paths)))
+
+
 def get_command_list(config: Dict[str, Any]) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
     """
     CI/CD 설정에서 실행할 명령어 목록을 추출합니다.
     
+    각 명령어의 'depends_on'에는 먼저 끝나야 하는 단계의 인덱스가 담깁니다.
+    - depends_on이 지정된 단계: 지정한 이전 단계 이름들에 의존
+    - parallel: true인 단계: 직전의 일반(비병렬) 단계에만 의존하여 다른 병렬 단계와 동시에 실행
+    - 그 외 단계: 앞선 모든 단계에 의존 (기존의 순차 실행과 동일)
+    
     Args:
         config (Dict[str, Any]): CI/CD 설정
     
@@ -72,6 +406,8 @@ def get_command_list(config: Dict[str, Any]) -> Tuple[bool, Union[List[Dict[str,
             return False, "CI/CD 설정에 실행 단계가 정의되지 않았습니다."
         
         commands = []
+        name_to_idx = {}  # 단계 이름 -> 인덱스 (같은 이름이 여러 번 나오면 None)
+        last_barrier = None  # 직전의 일반(비병렬) 단계 인덱스
         for idx, step in enumerate(steps):
             if 'name' not in step:
                 return False, f"단계 {idx+1}에 이름이 없습니다."
@@ -79,15 +415,51 @@ def get_command_list(config: Dict[str, Any]) -> Tuple[bool, Union[List[Dict[str,
             if 'run' not in step:
                 return False, f"단계 '{step['name']}'에 실행 명령어가 없습니다."
             
-            commands.append({
+            parallel = bool(step.get('parallel', False))
+            if 'depends_on' in step:
+                dep_names = step['depends_on']
+                if isinstance(dep_names, str):
+                    dep_names = [dep_names]
+                
+                depends_on = []
+                for dep_name in dep_names:
+                    if dep_name not in name_to_idx:
+                        return False, f"단계 '{step['name']}'의 의존 단계 '{dep_name}'이(가) 앞에 정의되지 않았습니다."
+                    if name_to_idx[dep_name] is None:
+                        return False, f"단계 '{step['name']}'의 의존 단계 '{dep_name}'의 이름이 중복됩니다."
+                    depends_on.append(name_to_idx[dep_name])
+                depends_on = tuple(depends_on)
+            elif parallel:
+                depends_on = (last_barrier,) if last_barrier is not None else ()
+            else:
+                depends_on = tuple(range(idx))
+            
+            command_info = {
                 'name': step['name'],
                 'command': step['run'],
                 'working_dir': step.get('working_dir', ''),
                 'allow_failure': step.get('allow_failure', False),
                 'timeout': step.get('timeout', 300),  # 기본 5분 타임아웃
-            })
+                'parallel': parallel,
+                'depends_on': depends_on,
+            }
+            
+            # 단계별 설정을 미리 묶어 둔 실행 함수 (실행 시 dict 조회 없이 호출)
+            command_info['_runner'] = functools.partial(
+                _execute_step,
+                command_info['name'],
+                command_info['command'],
+                command_info['working_dir'],
+                command_info['allow_failure'],
+                command_info['timeout'],
+            )
+            commands.append(command_info)
+            
+            name_to_idx[step['name']] = None if step['name'] in name_to_idx else idx
+            if not parallel:
+                last_barrier = idx
         
-        logger.info(f"{len(commands)}개의 CI/CD 명령어를 추출했습니다.")
+        logger.info("%d개의 CI/CD 명령어를 추출했습니다.", len(commands))
         return True, commands
     except Exception as e:
         error_msg = f"CI/CD 명령어 목록 추출 중 오류 발생: {str(e)}"
@@ -95,32 +467,109 @@ def get_command_list(config: Dict[str, Any]) -> Tuple[bool, Union[List[Dict[str,
         return False, error_msg
 
 
-def execute_command(command_info: Dict[str, Any], repo_path: str) -> Tuple[bool, Dict[str, Any]]:
+def get_ci_commands(repo_path: str) -> Tuple[bool, Union[Tuple[Mapping[str, Any], ...], str]]:
+    """
+    리포지토리의 CI/CD 설정을 로드하고 실행할 명령어 목록을 추출합니다.
+    추출 결과는 불변 구조로 캐시되므로 설정 파일이 바뀌지 않았다면 복사 없이 반환됩니다.
+    
+    Args:
+        repo_path (str): 리포지토리 경로
+    
+    Returns:
+        Tuple[bool, Union[Tuple[Mapping[str, Any], ...], str]]: 
+            (성공 여부, 읽기 전용 명령어 목록 또는 오류 메시지)
+    """
+    config_path = os.path.join(repo_path, CI_CONFIG_FILE)
+    
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        st = None
+    
+    cache_key = os.path.abspath(config_path)
+    if st is not None:
+        cached = _cache_get(_CI_COMMANDS_CACHE, cache_key, st)
+        if cached is not None:
+            return True, cached
+    
+    success, config = load_ci_config(repo_path)
+    if not success:
+        return False, config
+    
+    success, commands = get_command_list(config)
+    if not success:
+        return False, commands
+    
+    frozen = tuple(MappingProxyType(command) for command in commands)
+    if st is not None:
+        _cache_put(_CI_COMMANDS_CACHE, cache_key, st, frozen)
+    return True, frozen
+
+
+def execute_command(command_info: Dict[str, Any], repo_path: str,
+                    shell: Optional[_PersistentShell] = None,
+                    log_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, Dict[str, Any]]:
     """
     단일 CI/CD 명령어를 안전하게 실행합니다.
+    출력은 메모리에 한꺼번에 모으지 않고 도착하는 대로 줄 단위로 로그에 기록됩니다.
     
     Args:
         command_info (Dict[str, Any]): 명령어 정보
         repo_path (str): 리포지토리 경로
+        shell (Optional[_PersistentShell], optional): 
+            명령어를 실행할 공유 셸 (없으면 새 프로세스에서 실행)
+        log_callback (Optional[Callable[[str], None]], optional): 출력 줄마다 호출할 콜백
     
     Returns:
         Tuple[bool, Dict[str, Any]]: 
             (성공 여부, 결과 정보)
     """
-    name = command_info['name']
-    command = command_info['command']
-    working_dir = command_info.get('working_dir', '')
-    allow_failure = command_info.get('allow_failure', False)
-    timeout = command_info.get('timeout', 300)
+    return _execute_step(
+        command_info['name'],
+        command_info['command'],
+        command_info.get('working_dir', ''),
+        command_info.get('allow_failure', False),
+        command_info.get('timeout', 300),
+        repo_path,
+        shell=shell,
+        log_callback=log_callback,
+    )
+
+
+def _execute_step(name: str, command: str, working_dir: str, allow_failure: bool, timeout: int,
+                  repo_path: str, shell: Optional[_PersistentShell] = None,
+                  log_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, Dict[str, Any]]:
+    """
+    execute_command의 실제 구현으로, 명령어 정보를 개별 인자로 받습니다.
+    get_command_list가 단계마다 앞의 다섯 인자를 functools.partial로 묶어 '_runner'로 저장합니다.
     
+    Args:
+        name (str): 단계 이름
+        command (str): 실행할 명령어
+        working_dir (str): 리포지토리 기준 작업 디렉토리 (빈 문자열이면 리포지토리 루트)
+        allow_failure (bool): 실패 허용 여부
+        timeout (int): 타임아웃 (초)
+        repo_path (str): 리포지토리 경로
+        shell (Optional[_PersistentShell], optional): 명령어를 실행할 공유 셸
+        log_callback (Optional[Callable[[str], None]], optional): 출력 줄마다 호출할 콜백
+    
+    Returns:
+        Tuple[bool, Dict[str, Any]]: 
+            (성공 여부, 결과 정보)
+    """
     # 작업 디렉토리 설정
     if working_dir:
         cwd = os.path.join(repo_path, working_dir)
     else:
         cwd = repo_path
     
-    # 작업 디렉토리 존재 확인
-    if not os.path.exists(cwd):
+    # 작업 디렉토리 존재 확인 (stat 한 번으로 존재 여부와 디렉토리 여부를 함께 확인)
+    try:
+        cwd_is_dir = stat.S_ISDIR(os.stat(cwd).st_mode)
+    except OSError:
+        cwd_is_dir = False
+    
+    if not cwd_is_dir:
         error_msg = f"작업 디렉토리가 존재하지 않습니다: {cwd}"
         logger.error(error_msg)
         return False, {
@@ -132,31 +581,49 @@ def execute_command(command_info: Dict[str, Any], repo_path: str) -> Tuple[bool,
             'duration': 0,
         }
     
-    logger.info(f"CI/CD 명령어 실행 시작: {name}")
+    logger.info("CI/CD 명령어 실행 시작: %s", name)
     start_time = time.time()
+    process = None
     
     try:
-        # 명령어 실행 (shell=True는 보안상 권장되지 않으나, 복잡한 셸 명령어를 실행하기 위해 필요)
+        # 명령어 실행 (셸 실행은 보안상 권장되지 않으나, 복잡한 셸 명령어를 실행하기 위해 필요)
         # 실제 애플리케이션에서는 사용자에게 명령어를 보여주고 확인을 받은 후 실행해야 함
-        process = subprocess.Popen(
-            command,
-            cwd=cwd,
-            shell=True,  # 주의: 신뢰할 수 있는 명령어만 실행
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            universal_newlines=True,
-            bufsize=1,
-        )
+        if shell is not None:
+            return_code, stdout, stderr = shell.run(command, cwd, timeout, log_callback)
+        else:
+            process = subprocess.Popen(
+                command,
+                cwd=cwd,
+                shell=True,  # 주의: 신뢰할 수 있는 명령어만 실행
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            deadline = time.monotonic() + timeout
+            try:
+                _read_pipes({
+                    process.stdout.fileno(): (stdout_buf, _LineStream(log_callback)),
+                    process.stderr.fileno(): (stderr_buf, _LineStream(log_callback)),
+                }, deadline)
+                return_code = process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except TimeoutError:
+                raise subprocess.TimeoutExpired(command, timeout)
+            finally:
+                process.stdout.close()
+                process.stderr.close()
+            
+            stdout = stdout_buf.decode('utf-8', errors='replace')
+            stderr = stderr_buf.decode('utf-8', errors='replace')
         
-        stdout, stderr = process.communicate(timeout=timeout)
         duration = time.time() - start_time
         
-        success = process.returncode == 0 or allow_failure
+        success = return_code == 0 or allow_failure
         result = {
             'name': name,
             'success': success,
-            'return_code': process.returncode,
+            'return_code': return_code,
             'stdout': stdout,
             'stderr': stderr,
             'duration': duration,
@@ -164,20 +631,21 @@ def execute_command(command_info: Dict[str, Any], repo_path: str) -> Tuple[bool,
         }
         
         log_level = logger.info if success else logger.error
-        log_level(f"CI/CD 명령어 '{name}' 실행 완료: {'성공' if success else '실패'} ({duration:.2f}초)")
+        log_level("CI/CD 명령어 '%s' 실행 완료: %s (%.2f초)", name, '성공' if success else '실패', duration)
         
         return success, result
     except subprocess.TimeoutExpired:
         duration = time.time() - start_time
         error_msg = f"명령어 실행 타임아웃 ({timeout}초)"
-        logger.error(f"CI/CD 명령어 '{name}' {error_msg}")
+        logger.error("CI/CD 명령어 '%s' %s", name, error_msg)
         
-        # 프로세스 강제 종료
-        try:
-            process.kill()
-            _, _ = process.communicate()
-        except:
-            pass
+        # 프로세스 강제 종료 (공유 셸은 run()에서 이미 종료됨)
+        if process is not None:
+            try:
+                process.kill()
+                process.wait()
+            except:
+                pass
         
         return allow_failure, {
             'name': name,
@@ -191,7 +659,7 @@ def execute_command(command_info: Dict[str, Any], repo_path: str) -> Tuple[bool,
     except Exception as e:
         duration = time.time() - start_time
         error_msg = f"명령어 실행 중 오류 발생: {str(e)}"
-        logger.error(f"CI/CD 명령어 '{name}' {error_msg}")
+        logger.error("CI/CD 명령어 '%s' %s", name, error_msg)
         
         return allow_failure, {
             'name': name,
@@ -204,39 +672,135 @@ def execute_command(command_info: Dict[str, Any], repo_path: str) -> Tuple[bool,
         }
 
 
-def run_ci_cd_pipeline(repo_path: str) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
+def _run_step(command_info: Mapping[str, Any], repo_path: str,
+              shell: Optional[_PersistentShell] = None,
+              log_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, Dict[str, Any]]:
+    """
+    파이프라인의 한 단계를 실행하고 시작/종료 메시지를 콜백에 전달합니다.
+    
+    Args:
+        command_info (Mapping[str, Any]): 명령어 정보
+        repo_path (str): 리포지토리 경로
+        shell (Optional[_PersistentShell], optional): 명령어를 실행할 공유 셸
+        log_callback (Optional[Callable[[str], None]], optional): 로그 콜백
+    
+    Returns:
+        Tuple[bool, Dict[str, Any]]: (성공 여부, 결과 정보)
+    """
+    if log_callback:
+        log_callback(f"▶ {command_info['name']}\n")
+    
+    runner = command_info.get('_runner')
+    if runner is not None:
+        success, result = runner(repo_path, shell=shell, log_callback=log_callback)
+    else:
+        success, result = execute_command(
+            command_info, repo_path, shell=shell, log_callback=log_callback
+        )
+    
+    if log_callback:
+        status = '성공' if success else '실패'
+        log_callback(f"{command_info['name']}: {status} ({result['duration']:.2f}초)\n\n")
+    
+    return success, result
+
+
+def _run_steps_parallel(commands: Tuple[Mapping[str, Any], ...], repo_path: str,
+                        log_callback: Optional[Callable[[str], None]] = None
+                        ) -> Tuple[bool, List[Dict[str, Any]]]:
+    """
+    단계 간 의존 관계에 따라 준비된 단계들을 스레드 풀에서 동시에 실행합니다.
+    실패가 허용되지 않은 단계가 실패하면 새 단계를 시작하지 않고 실행 중인 단계만 기다립니다.
+    
+    Args:
+        commands (Tuple[Mapping[str, Any], ...]): 명령어 목록
+        repo_path (str): 리포지토리 경로
+        log_callback (Optional[Callable[[str], None]], optional): 로그 콜백
+    
+    Returns:
+        Tuple[bool, List[Dict[str, Any]]]: (성공 여부, 실행된 단계의 결과 목록)
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(commands)
+    started = set()
+    finished = set()
+    running = {}
+    pipeline_success = True
+    
+    max_workers = min(len(commands), MAX_PARALLEL_STEPS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            if pipeline_success:
+                for idx, command_info in enumerate(commands):
+                    if idx in started or not finished.issuperset(command_info['depends_on']):
+                        continue
+                    started.add(idx)
+                    future = executor.submit(_run_step, command_info, repo_path, None, log_callback)
+                    running[future] = idx
+            
+            if not running:
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = running.pop(future)
+                success, result = future.result()
+                results[idx] = result
+                finished.add(idx)
+                
+                # 명령어가 실패하고 allow_failure가 False이면 파이프라인 중단
+                if not success and not commands[idx].get('allow_failure', False):
+                    pipeline_success = False
+    
+    return pipeline_success, [result for result in results if result is not None]
+
+
+def run_ci_cd_pipeline(repo_path: str, 
+                       log_callback: Optional[Callable[[str], None]] = None
+                       ) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
     """
     리포지토리의 CI/CD 파이프라인을 실행합니다.
     
     Args:
         repo_path (str): 리포지토리 경로
+        log_callback (Optional[Callable[[str], None]], optional): 
+            단계 시작/종료 메시지와 출력 줄마다 호출할 콜백 (작업 스레드에서 호출됨)
     
     Returns:
         Tuple[bool, Union[List[Dict[str, Any]], str]]: 
             (성공 여부, 결과 목록 또는 오류 메시지)
     """
-    # CI/CD 설정 로드
-    success, config = load_ci_config(repo_path)
-    if not success:
-        return False, config
-    
-    # 명령어 목록 추출
-    success, commands = get_command_list(config)
+    # CI/CD 설정 로드 및 명령어 목록 추출
+    success, commands = get_ci_commands(repo_path)
     if not success:
         return False, commands
     
-    # 각 명령어 실행
+    # 병렬 단계나 의존 관계가 지정된 경우 의존 관계에 따라 동시에 실행
+    is_sequential = all(
+        tuple(command_info['depends_on']) == tuple(range(idx))
+        for idx, command_info in enumerate(commands)
+    )
+    if not is_sequential:
+        pipeline_success, results = _run_steps_parallel(commands, repo_path, log_callback)
+        logger.info("CI/CD 파이프라인 실행 완료: %s", '성공' if pipeline_success else '실패')
+        return pipeline_success, results
+    
+    # 각 명령어 실행 (POSIX 환경에서는 단계마다 프로세스를 만들지 않고 하나의 셸을 공유)
     results = []
     pipeline_success = True
+    shell = _PersistentShell() if os.name == 'posix' else None
     
-    for command_info in commands:
-        success, result = execute_command(command_info, repo_path)
-        results.append(result)
-        
-        # 명령어가 실패하고 allow_failure가 False이면 파이프라인 중단
-        if not success and not command_info.get('allow_failure', False):
-            pipeline_success = False
-            break
+    try:
+        for command_info in commands:
+            success, result = _run_step(command_info, repo_path, shell, log_callback)
+            results.append(result)
+            
+            # 명령어가 실패하고 allow_failure가 False이면 파이프라인 중단
+            if not success and not command_info.get('allow_failure', False):
+                pipeline_success = False
+                break
+    finally:
+        if shell is not None:
+            shell.close()
     
-    logger.info(f"CI/CD 파이프라인 실행 완료: {'성공' if pipeline_success else '실패'}")
+    logger.info("CI/CD 파이프라인 실행 완료: %s", '성공' if pipeline_success else '실패')
     return pipeline_success, results 
\ No newline at end of file
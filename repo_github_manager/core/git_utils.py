@@ -3,8 +3,9 @@ Git 명령어 실행 유틸리티 모듈
 로컬 Git 명령어를 안전하게 실행하고 결과를 처리합니다.
 """
 import os
+import time
+import logging
 import subprocess
-import shutil
 from pathlib import Path
 from typing import Tuple, List, Dict, Any, Optional, Union
 
@@ -14,6 +15,13 @@ from utils.config_manager import get_clone_base_path
 # 로거 설정
 logger = setup_logger(__name__)
 
+# check_git_repo 결과 캐시 (절대 경로 -> (.git 수정 시각, Git 리포지토리 여부))
+_REPO_CHECK_CACHE: Dict[str, Tuple[int, bool]] = {}
+
+# get_repo_state 결과 캐시 (절대 경로 -> (조회 시각, (브랜치 목록, 현재 브랜치)))
+_REPO_STATE_CACHE: Dict[str, Tuple[float, Tuple[List[str], Optional[str]]]] = {}
+_REPO_STATE_TTL = 1.0  # 초
+
 
 def run_git_command(command: List[str], cwd: Optional[str] = None, 
                     timeout: int = 60) -> Tuple[bool, Union[str, Dict[str, Any]]]:
@@ -29,6 +37,9 @@ def run_git_command(command: List[str], cwd: Optional[str] = None,
         Tuple[bool, Union[str, Dict[str, Any]]]: 
             (성공 여부, 결과 또는 오류 메시지)
     """
+    # 로그에 쓸 명령어 문자열은 INFO 로그가 켜져 있을 때만 미리 한 번 만듦
+    cmd_str = ' '.join(command) if logger.isEnabledFor(logging.INFO) else None
+    
     try:
         # 보안을 위해 shell=True 사용하지 않음
         result = subprocess.run(
@@ -42,14 +53,15 @@ def run_git_command(command: List[str], cwd: Optional[str] = None,
         )
         
         if result.returncode == 0:
-            logger.info(f"Git 명령어 실행 성공: {' '.join(command)}")
+            if cmd_str is not None:
+                logger.info("Git 명령어 실행 성공: %s", cmd_str)
             return True, result.stdout.strip()
         else:
             error_msg = f"Git 명령어 실행 실패: {result.stderr.strip()}"
             logger.error(error_msg)
             return False, error_msg
     except subprocess.TimeoutExpired:
-        error_msg = f"Git 명령어 실행 타임아웃 ({timeout}초): {' '.join(command)}"
+        error_msg = f"Git 명령어 실행 타임아웃 ({timeout}초): {cmd_str or ' '.join(command)}"
         logger.error(error_msg)
         return False, error_msg
     except FileNotFoundError:
@@ -83,26 +95,34 @@ def clone_repository(url: str, path: Optional[str] = None,
         base_path = get_clone_base_path()
         path = os.path.join(base_path, repo_name)
     
-    # 경로가 이미 존재하는지 확인
-    if os.path.exists(path):
+    # 대상 디렉토리를 부모 디렉토리와 함께 생성 (이미 존재하면 FileExistsError)
+    try:
+        os.makedirs(path)
+    except FileExistsError:
         error_msg = f"경로가 이미 존재합니다: {path}"
         logger.error(error_msg)
         return False, error_msg
     
-    # 부모 디렉토리 생성
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    
-    # 클론 명령어 구성
+    # 클론 명령어 구성 (git은 비어 있는 기존 디렉토리에 클론할 수 있음)
     command = ['git', 'clone', url, path]
     if branch:
         command.extend(['--branch', branch])
     
-    return run_git_command(command)
+    success, result = run_git_command(command)
+    if not success:
+        # 클론 실패 시 미리 만든 빈 디렉토리 정리
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
+    
+    return success, result
 
 
 def check_git_repo(path: str) -> bool:
     """
     지정된 경로가 유효한 Git 리포지토리인지 확인합니다.
+    경로에 .git이 있으면 결과를 캐시하고, .git의 수정 시각이 바뀔 때만 다시 확인합니다.
     
     Args:
         path (str): 확인할 경로
@@ -110,17 +130,97 @@ def check_git_repo(path: str) -> bool:
     Returns:
         bool: Git 리포지토리 여부
     """
-    if not os.path.exists(path):
-        logger.warning(f"경로가 존재하지 않습니다: {path}")
-        return False
+    cache_key = os.path.abspath(path)
+    try:
+        git_mtime = os.stat(os.path.join(path, '.git')).st_mtime_ns
+    except OSError:
+        # .git이 없을 때만 경로 자체의 존재 여부를 확인
+        if not os.path.exists(path):
+            logger.warning("경로가 존재하지 않습니다: %s", path)
+            return False
+        git_mtime = None  # 하위 디렉토리 등 .git이 없는 경로는 캐시하지 않음
+    
+    if git_mtime is not None:
+        cached = _REPO_CHECK_CACHE.get(cache_key)
+        if cached and cached[0] == git_mtime:
+            return cached[1]
     
     success, result = run_git_command(['git', 'rev-parse', '--is-inside-work-tree'], cwd=path)
-    return success and result.strip() == 'true'
+    is_repo = success and result.strip() == 'true'
+    
+    if git_mtime is not None:
+        _REPO_CHECK_CACHE[cache_key] = (git_mtime, is_repo)
+    return is_repo
+
+
+def invalidate_repo_check(path: str) -> None:
+    """
+    지정된 경로의 Git 리포지토리 확인 결과 캐시를 제거합니다.
+    
+    Args:
+        path (str): 캐시를 제거할 경로
+    """
+    _REPO_CHECK_CACHE.pop(os.path.abspath(path), None)
+
+
+def get_repo_state(path: str) -> Tuple[bool, Union[Tuple[List[str], Optional[str]], str]]:
+    """
+    로컬 브랜치 목록과 현재 체크아웃된 브랜치를 한 번의 Git 명령어로 가져옵니다.
+    연속된 호출에 대비해 결과를 짧은 시간 동안 캐시합니다.
+    
+    Args:
+        path (str): 리포지토리 경로
+    
+    Returns:
+        Tuple[bool, Union[Tuple[List[str], Optional[str]], str]]: 
+            (성공 여부, (브랜치 목록, 현재 브랜치) 또는 오류 메시지)
+            현재 브랜치를 알 수 없는 경우(detached HEAD 등) 현재 브랜치는 None
+    """
+    cache_key = os.path.abspath(path)
+    cached = _REPO_STATE_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _REPO_STATE_TTL:
+        branches, current_branch = cached[1]
+        return True, (list(branches), current_branch)
+    
+    if not check_git_repo(path):
+        return False, f"유효한 Git 리포지토리가 아닙니다: {path}"
+    
+    # %(HEAD)는 현재 브랜치에만 '*'를 출력하므로 목록과 현재 브랜치를 함께 얻을 수 있음
+    success, result = run_git_command(
+        ['git', 'for-each-ref', '--format=%(refname:short)%09%(HEAD)', 'refs/heads'], cwd=path
+    )
+    if not success:
+        return False, result
+    
+    branches = []
+    current_branch = None
+    for line in result.split('\n'):
+        if not line.strip():
+            continue
+        branch, _, head_mark = line.partition('\t')
+        branch = branch.strip()
+        branches.append(branch)
+        if head_mark.strip() == '*':
+            current_branch = branch
+    
+    _REPO_STATE_CACHE[cache_key] = (time.monotonic(), (branches, current_branch))
+    return True, (list(branches), current_branch)
+
+
+def invalidate_repo_state(path: str) -> None:
+    """
+    지정된 경로의 브랜치 상태 캐시를 제거합니다.
+    
+    Args:
+        path (str): 캐시를 제거할 경로
+    """
+    _REPO_STATE_CACHE.pop(os.path.abspath(path), None)
 
 
 def get_branches(path: str) -> Tuple[bool, Union[List[str], str]]:
     """
     리포지토리의 로컬 브랜치 목록을 가져옵니다.
+    현재 브랜치도 필요하면 get_repo_state를 사용하세요 (이 함수는 호환성을 위해 유지됩니다).
     
     Args:
         path (str): 리포지토리 경로
@@ -129,20 +229,18 @@ def get_branches(path: str) -> Tuple[bool, Union[List[str], str]]:
         Tuple[bool, Union[List[str], str]]: 
             (성공 여부, 브랜치 목록 또는 오류 메시지)
     """
-    if not check_git_repo(path):
-        return False, f"유효한 Git 리포지토리가 아닙니다: {path}"
-    
-    success, result = run_git_command(['git', 'branch', '--format=%(refname:short)'], cwd=path)
+    success, result = get_repo_state(path)
     if not success:
         return False, result
     
-    branches = [branch.strip() for branch in result.split('\n') if branch.strip()]
+    branches, _ = result
     return True, branches
 
 
 def get_current_branch(path: str) -> Tuple[bool, str]:
     """
     현재 체크아웃된 브랜치 이름을 가져옵니다.
+    브랜치 목록도 필요하면 get_repo_state를 사용하세요 (이 함수는 호환성을 위해 유지됩니다).
     
     Args:
         path (str): 리포지토리 경로
@@ -150,9 +248,15 @@ def get_current_branch(path: str) -> Tuple[bool, str]:
     Returns:
         Tuple[bool, str]: (성공 여부, 브랜치 이름 또는 오류 메시지)
     """
-    if not check_git_repo(path):
-        return False, f"유효한 Git 리포지토리가 아닙니다: {path}"
+    success, result = get_repo_state(path)
+    if not success:
+        return False, result
+    
+    _, current_branch = result
+    if current_branch:
+        return True, current_branch
     
+    # 브랜치에 있지 않은 경우(detached HEAD 등) 기존 방식으로 확인
     success, result = run_git_command(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], cwd=path)
     return success, result.strip() if success else result
 
@@ -178,7 +282,9 @@ def checkout_branch(path: str, branch: str, create: bool = False) -> Tuple[bool,
         command.append('-b')
     command.append(branch)
     
-    return run_git_command(command, cwd=path)
+    result = run_git_command(command, cwd=path)
+    invalidate_repo_state(path)
+    return result
 
 
 def update_repo_remote(path: str, new_url: str) -> Tuple[bool, str]:
@@ -211,26 +317,31 @@ def rename_local_repo_folder(old_path: str, new_name: str) -> Tuple[bool, str]:
     Returns:
         Tuple[bool, str]: (성공 여부, 새 경로 또는 오류 메시지)
     """
+    # 새 경로 생성
+    parent_dir = os.path.dirname(old_path)
+    new_path = os.path.join(parent_dir, new_name)
+    
     try:
-        if not os.path.exists(old_path):
-            error_msg = f"경로가 존재하지 않습니다: {old_path}"
-            logger.error(error_msg)
-            return False, error_msg
+        # os.rename은 빈 디렉토리를 덮어쓸 수 있으므로 대상 경로만 미리 확인
+        if os.path.lexists(new_path):
+            raise FileExistsError(new_path)
         
-        # 새 경로 생성
-        parent_dir = os.path.dirname(old_path)
-        new_path = os.path.join(parent_dir, new_name)
-        
-        if os.path.exists(new_path):
-            error_msg = f"새 경로가 이미 존재합니다: {new_path}"
-            logger.error(error_msg)
-            return False, error_msg
-        
-        # 폴더 이름 변경
-        shutil.move(old_path, new_path)
-        logger.info(f"리포지토리 폴더 이름을 변경했습니다: {old_path} -> {new_path}")
+        # 폴더 이름 변경 (같은 부모 디렉토리 안이므로 rename 한 번으로 처리)
+        os.rename(old_path, new_path)
+        invalidate_repo_check(old_path)
+        invalidate_repo_check(new_path)
+        invalidate_repo_state(old_path)
+        logger.info("리포지토리 폴더 이름을 변경했습니다: %s -> %s", old_path, new_path)
         
         return True, new_path
+    except FileNotFoundError:
+        error_msg = f"경로가 존재하지 않습니다: {old_path}"
+        logger.error(error_msg)
+        return False, error_msg
+    except FileExistsError:
+        error_msg = f"새 경로가 이미 존재합니다: {new_path}"
+        logger.error(error_msg)
+        return False, error_msg
     except Exception as e:
         error_msg = f"리포지토리 폴더 이름 변경 중 오류 발생: {str(e)}"
         logger.error(error_msg)
@@ -3,18 +3,376 @@ GitHub API 클라이언트 모듈
 PyGithub을 사용하여 GitHub API에 접근하는 기능을 제공합니다.
 """
 import os
+import json
+import codecs
+import time
+import sqlite3
 import logging
-from typing import Dict, List, Any, Tuple, Optional, Union
+import itertools
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from dataclasses import dataclass, fields, asdict
+from typing import Dict, List, Any, Tuple, Optional, Union, Iterator, Callable
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import github
-from github import Github, Repository, GithubException
+from github import Github, Repository, GithubException, UnknownObjectException
 
 from utils.logger import setup_logger
-from utils.config_manager import load_github_pat
+from utils.config_manager import load_github_pats
+from utils.rate_limiter import RateLimiter, backoff_delay
+
+# orjson이 있으면 응답 JSON 파싱에 사용하고, 없으면 표준 json으로 대체
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # 로거 설정
 logger = setup_logger(__name__)
 
+# 목록 API 페이지 크기 (GitHub 최대값)
+PER_PAGE = 100
+
+# GitHub REST API 기본 URL
+REST_API_URL = "https://api.github.com"
+
+# GitHub GraphQL API 엔드포인트
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# REST 요청 타임아웃 (초)
+REST_TIMEOUT = 30
+
+# HTTP 연결 풀 크기
+HTTP_POOL_SIZE = 10
+
+# 리포지토리 변환 결과 캐시의 최대 항목 수
+REPO_PROJECTION_CACHE_MAX = 2000
+
+# README 캐시 최대 항목 수 (리포지토리 이름 -> (ETag, 내용))
+README_CACHE_MAX = 64
+
+# 조건부 요청용 ETag 캐시 최대 항목 수 (URL -> (ETag, 응답 JSON))
+ETAG_CACHE_MAX = 256
+
+# README를 내려받으며 전달할 때 한 번에 읽는 크기 (바이트)
+README_STREAM_CHUNK_SIZE = 8192
+
+# 동시에 보낼 최대 API 요청 수 (GitHub 2차 요청 한도 고려)
+MAX_CONCURRENT_REQUESTS = 8
+
+# 이 시간(초) 안에 반복된 리포지토리 목록 요청은 직전 결과를 재사용
+REPO_LIST_DEBOUNCE_SECONDS = 2.0
+
+# 조건부 요청용 ETag 캐시 파일 경로
+ETAG_CACHE_PATH = Path.home() / ".github_repo_manager" / "etags.json"
+
+# 리포지토리 목록 영구 캐시 (앱 시작 시 네트워크 조회 전에 바로 표시)
+REPO_CACHE_DB_PATH = Path.home() / ".github_repo_manager" / "repo_cache.db"
+
+# 영구 캐시에 저장된 리포지토리 목록의 유효 시간 (초)
+REPO_CACHE_TTL_SECONDS = 600
+
+# GraphQL 요청 타임아웃 (초)
+GRAPHQL_TIMEOUT = 30
+
+# 요청 한도에 걸린 요청의 최대 재시도 횟수
+MAX_RATE_LIMIT_RETRIES = 3
+
+# 요청 한도 초기화를 기다릴 최대 시간 (초, 넘으면 기다리지 않고 실패 처리)
+RATE_LIMIT_MAX_WAIT_SECONDS = 60
+
+# 리포지토리 목록 조회 쿼리 (REST /user/repos 기본 범위와 같은 소유 관계를 조회)
+REPOSITORIES_QUERY = """
+query($cursor: String, $first: Int!) {
+  viewer {
+    repositories(first: $first, after: $cursor,
+                 ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        name
+        nameWithOwner
+        description
+        url
+        sshUrl
+        isPrivate
+        isFork
+        defaultBranchRef { name }
+        primaryLanguage { name }
+        forkCount
+        stargazerCount
+        watchers { totalCount }
+        issues(states: OPEN) { totalCount }
+        createdAt
+        updatedAt
+        owner {
+          login
+          avatarUrl
+          ... on User { databaseId }
+          ... on Organization { databaseId }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _normalize_timestamp(value: Optional[str]) -> Optional[str]:
+    """
+    GraphQL 타임스탬프를 기존 REST 결과와 같은 형식으로 맞춥니다.
+    
+    Args:
+        value (Optional[str]): ISO 8601 타임스탬프 (예: 2024-01-01T00:00:00Z)
+    
+    Returns:
+        Optional[str]: 'Z' 접미사를 제거한 타임스탬프
+    """
+    if value and value.endswith("Z"):
+        return value[:-1]
+    return value
+
+
+class _MappingCompat:
+    """dict처럼 키로 필드에 접근할 수 있게 해주는 믹스인 (기존 dict 기반 코드 호환용)"""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        필드 값을 가져옵니다. 값이 없으면 기본값을 반환합니다.
+        
+        Args:
+            key (str): 필드 이름
+            default (Any): 필드가 없을 때 반환할 값
+        
+        Returns:
+            Any: 필드 값 또는 기본값
+        """
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
+    
+    def keys(self) -> List[str]:
+        """
+        필드 이름 목록을 반환합니다.
+        
+        Returns:
+            List[str]: 필드 이름 목록
+        """
+        return [field.name for field in fields(self)]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON 직렬화 등에 사용할 수 있도록 dict로 변환합니다.
+        
+        Returns:
+            Dict[str, Any]: 필드 이름과 값의 dict
+        """
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class OwnerInfo(_MappingCompat):
+    """리포지토리 소유자 정보"""
+    
+    login: str
+    id: Optional[int]
+    avatar_url: Optional[str]
+
+
+@dataclass(slots=True, frozen=True)
+class RepoInfo(_MappingCompat):
+    """리포지토리 정보 (값을 알 수 없는 선택 필드는 기본값 None)"""
+    
+    id: int
+    name: str
+    full_name: str
+    description: Optional[str]
+    html_url: str
+    clone_url: str
+    ssh_url: str
+    private: bool
+    fork: bool
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    owner: Optional[OwnerInfo] = None
+    default_branch: Optional[str] = None
+    language: Optional[str] = None
+    forks_count: Optional[int] = None
+    stargazers_count: Optional[int] = None
+    watchers_count: Optional[int] = None
+    open_issues_count: Optional[int] = None
+
+
+def _repo_info_from(data: Dict[str, Any]) -> RepoInfo:
+    """
+    GitHub REST API의 리포지토리 JSON을 RepoInfo로 변환합니다.
+    
+    Args:
+        data (Dict[str, Any]): 리포지토리 JSON (/repos/{owner}/{repo} 응답 형식)
+    
+    Returns:
+        RepoInfo: 리포지토리 정보
+    """
+    owner = data.get("owner")
+    return RepoInfo(
+        id=data["id"],
+        name=data["name"],
+        full_name=data["full_name"],
+        description=data.get("description"),
+        html_url=data["html_url"],
+        clone_url=data["clone_url"],
+        ssh_url=data["ssh_url"],
+        private=data["private"],
+        fork=data["fork"],
+        created_at=_normalize_timestamp(data.get("created_at")),
+        updated_at=_normalize_timestamp(data.get("updated_at")),
+        owner=OwnerInfo(
+            login=owner["login"],
+            id=owner.get("id"),
+            avatar_url=owner.get("avatar_url"),
+        ) if owner else None,
+        default_branch=data.get("default_branch"),
+        language=data.get("language"),
+        forks_count=data.get("forks_count"),
+        stargazers_count=data.get("stargazers_count"),
+        watchers_count=data.get("watchers_count"),
+        open_issues_count=data.get("open_issues_count"),
+    )
+
+
+def _repo_info_from_dict(data: Dict[str, Any]) -> RepoInfo:
+    """
+    RepoInfo.to_dict()로 직렬화한 dict를 다시 RepoInfo로 변환합니다.
+    
+    Args:
+        data (Dict[str, Any]): 직렬화된 리포지토리 정보
+    
+    Returns:
+        RepoInfo: 리포지토리 정보
+    """
+    owner = data.get("owner")
+    return RepoInfo(**{**data, "owner": OwnerInfo(**owner) if owner else None})
+
+
+def _repo_info_from_node(node: Dict[str, Any]) -> RepoInfo:
+    """
+    GraphQL 리포지토리 노드를 RepoInfo로 변환합니다.
+    
+    Args:
+        node (Dict[str, Any]): REPOSITORIES_QUERY 응답의 리포지토리 노드
+    
+    Returns:
+        RepoInfo: 리포지토리 정보
+    """
+    owner = node.get("owner")
+    default_branch = node.get("defaultBranchRef")
+    language = node.get("primaryLanguage")
+    return RepoInfo(
+        id=node["databaseId"],
+        name=node["name"],
+        full_name=node["nameWithOwner"],
+        description=node["description"],
+        html_url=node["url"],
+        clone_url=f"{node['url']}.git",
+        ssh_url=node["sshUrl"],
+        private=node["isPrivate"],
+        fork=node["isFork"],
+        created_at=_normalize_timestamp(node["createdAt"]),
+        updated_at=_normalize_timestamp(node["updatedAt"]),
+        default_branch=default_branch["name"] if default_branch else None,
+        language=language["name"] if language else None,
+        forks_count=node["forkCount"],
+        stargazers_count=node["stargazerCount"],
+        watchers_count=node["watchers"]["totalCount"],
+        open_issues_count=node["issues"]["totalCount"],
+        owner=OwnerInfo(
+            login=owner["login"],
+            id=owner.get("databaseId"),
+            avatar_url=owner["avatarUrl"],
+        ) if owner else None,
+    )
+
+
+def _repo_name_from_path(path: str) -> Optional[str]:
+    """
+    REST API 경로에서 리포지토리 이름을 추출합니다.
+    
+    Args:
+        path (str): API 경로 (예: /repos/owner/name/commits)
+    
+    Returns:
+        Optional[str]: 리포지토리 이름 (사용자명/리포지토리명 형식) 또는 None (리포지토리 경로가 아닌 경우)
+    """
+    parts = path.split("/", 4)
+    if len(parts) >= 4 and parts[1] == "repos":
+        return f"{parts[2]}/{parts[3]}"
+    return None
+
+
+def _is_repo_metadata_url(url: str) -> bool:
+    """
+    ETag 캐시 키가 리포지토리 정보(/repos/{owner}/{name}, 쿼리 없음) 요청인지 확인합니다.
+    
+    Args:
+        url (str): ETag 캐시 키 (요청 URL)
+    
+    Returns:
+        bool: 리포지토리 정보 요청 여부
+    """
+    if not url.startswith(REST_API_URL) or "?" in url:
+        return False
+    parts = url[len(REST_API_URL):].split("/")
+    return len(parts) == 4 and parts[1] == "repos"
+
+
+def _rate_limit_delay(response: requests.Response, attempt: int) -> Optional[float]:
+    """
+    요청 한도에 걸린 응답이면 다시 시도하기 전에 기다릴 시간을 계산합니다.
+    
+    Retry-After 헤더가 있으면 그 값을, 기본 한도(X-RateLimit-Remaining: 0)이면 X-RateLimit-Reset 시각까지,
+    보조 한도이면 지터를 더한 지수 백오프 시간을 사용합니다.
+    
+    Args:
+        response (requests.Response): 응답
+        attempt (int): 지금까지의 재시도 횟수
+    
+    Returns:
+        Optional[float]: 대기 시간 (초) 또는 None (요청 한도 응답이 아닌 경우)
+    """
+    if response.status_code not in (403, 429):
+        return None
+    
+    headers = response.headers
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    
+    if headers.get("X-RateLimit-Remaining") == "0":
+        return max(float(headers.get("X-RateLimit-Reset") or 0) - time.time(), 0.0) + 1
+    
+    if b"secondary rate limit" in response.content.lower():
+        return backoff_delay(attempt)
+    
+    return None
+
 
 class GitHubClient:
     """GitHub API 클라이언트 클래스"""
@@ -23,88 +381,489 @@ class GitHubClient:
         """GitHub 클라이언트 초기화"""
         self.github = None
         self.user = None
+        self._user_login: Optional[str] = None
+        self.token = None
+        self._repo_cache: Dict[str, Repository.Repository] = {}
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._repo_projection_cache: "OrderedDict[Tuple[Any, ...], RepoInfo]" = OrderedDict()
+        self._readme_cache: "OrderedDict[str, Tuple[str, Optional[str]]]" = OrderedDict()
+        self._readme_lock = threading.Lock()
         self.is_authenticated = False
         self.error_message = None
+        self._client_lock = threading.Lock()
+        self._tokens: List[str] = []
+        self._token_cycle = None
+        self._token_reset: Dict[int, float] = {}  # 토큰 인덱스 -> 요청 한도 초기화 시각
+        self._repo_token: Dict[str, int] = {}  # 리포지토리 이름 -> 마지막으로 성공한 토큰 인덱스
+        self._token_lock = threading.Lock()
+        self._session = self._create_session()
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        self._request_slots = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._rate_limiter = RateLimiter()
+        
+        # 리포지토리 목록 요청 디바운스 상태
+        self._repo_list_lock = threading.Lock()
+        self._repo_list_inflight: Optional[Future] = None
+        self._repo_list_result: Optional[List[RepoInfo]] = None
+        self._repo_list_at = 0.0
+        self._repo_list_restored = False
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        직접 HTTP 요청(GraphQL, README, 커밋/PR 조회)에 공유할 세션을 생성합니다.
+        
+        연결과 TLS 핸드셰이크를 재사용하고, 일시적인 서버 오류는 자동으로 재시도합니다.
+        인증 헤더는 initialize에서 세션 기본 헤더로 한 번만 설정합니다.
+        
+        Returns:
+            requests.Session: 설정된 세션
+        """
+        session = requests.Session()
+        session.headers["Accept"] = "application/vnd.github+json"
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("https://", adapter)
+        return session
+    
+    def _load_etag_cache(self) -> None:
+        """디스크에 저장된 ETag 캐시를 불러옵니다. 파일이 없거나 손상되었으면 빈 캐시로 시작합니다."""
+        cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        try:
+            with open(ETAG_CACHE_PATH, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            for url, entry in list(stored.items())[-ETAG_CACHE_MAX:]:
+                cache[url] = (entry[0], entry[1])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("ETag 캐시 로드 실패, 빈 캐시로 시작합니다: %s", e)
+            cache.clear()
+        
+        with self._etag_lock:
+            self._etag_cache = cache
+    
+    def _save_etag_cache(self) -> None:
+        """
+        ETag 캐시를 디스크에 저장합니다.
+        
+        커밋/PR 목록 페이지는 자주 바뀌고 양이 많으므로 리포지토리 정보(/repos/{owner}/{name}) 응답만 저장합니다.
+        """
+        with self._etag_lock:
+            stored = {
+                url: list(entry) for url, entry in self._etag_cache.items()
+                if _is_repo_metadata_url(url)
+            }
+        if not stored:
+            return
+        
+        try:
+            os.makedirs(ETAG_CACHE_PATH.parent, exist_ok=True)
+            tmp_path = ETAG_CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, ETAG_CACHE_PATH)
+        except Exception as e:
+            logger.warning("ETag 캐시 저장 실패: %s", e)
+    
+    def close(self) -> None:
+        """ETag 캐시를 저장하고 HTTP 세션과 PyGithub 연결을 닫습니다."""
+        self._save_etag_cache()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+        
+        with self._client_lock:
+            if self.github is not None and hasattr(self.github, "close"):
+                self.github.close()
+            self.github = None
+            self.user = None
+            self._user_login = None
+            self.is_authenticated = False
     
     def initialize(self) -> bool:
         """
         GitHub API 클라이언트 초기화
         
+        PAT만 로드하여 저장하고, 실제 클라이언트 생성과 인증은 첫 API 호출 시점으로 미룹니다.
+        
         Returns:
-            bool: 인증 성공 여부
+            bool: PAT 로드 성공 여부
         """
-        # GitHub PAT 로드
-        github_pat = load_github_pat()
+        # GitHub PAT 로드 (여러 개면 첫 번째가 기본 토큰)
+        tokens = load_github_pats()
+        github_pat = tokens[0] if tokens else None
         
         if not github_pat:
             self.error_message = "GitHub PAT를 찾을 수 없습니다. .env 파일을 확인하세요."
             logger.error(self.error_message)
             return False
         
-        try:
-            # PyGithub 인스턴스 생성
-            self.github = Github(github_pat)
-            
-            # 인증 테스트 (현재 로그인한 사용자 정보 가져오기)
-            self.user = self.github.get_user()
-            _ = self.user.login  # API 호출을 통해 인증 확인
-            
-            self.is_authenticated = True
-            logger.info(f"GitHub API 인증 성공 (사용자: {self.user.login})")
+        with self._client_lock:
+            self.token = github_pat
+            with self._token_lock:
+                self._tokens = list(tokens)
+                self._token_cycle = itertools.cycle(range(len(tokens)))
+                self._token_reset.clear()
+                self._repo_token.clear()
+            self._session.headers["Authorization"] = f"Bearer {github_pat}"
+            self.github = None
+            self.user = None
+            self._user_login = None
+            self.is_authenticated = False
+            self.error_message = None
+            self._repo_cache.clear()
+            self._load_etag_cache()
+        
+        with self._repo_list_lock:
+            self._repo_list_result = None
+            self._repo_list_restored = False
+        
+        return True
+    
+    def _ensure_client(self) -> bool:
+        """
+        PyGithub 클라이언트를 필요할 때 한 번만 생성하고 인증을 확인합니다.
+        
+        Returns:
+            bool: 인증 성공 여부
+        """
+        if self.is_authenticated:
             return True
         
-        except GithubException as e:
-            self.error_message = f"GitHub API 인증 실패: {e.data.get('message', str(e))}"
-            logger.error(self.error_message)
+        if self.token is None and not self.initialize():
             return False
         
-        except Exception as e:
-            self.error_message = f"GitHub API 인증 중 오류 발생: {str(e)}"
-            logger.error(self.error_message)
-            return False
+        with self._client_lock:
+            if self.is_authenticated:
+                return True
+            
+            try:
+                # 인증 테스트 (공유 세션으로 /user를 한 번 조회해 로그인 이름까지 확보)
+                response = self._session.get(f"{REST_API_URL}/user", timeout=REST_TIMEOUT)
+                if response.status_code != 200:
+                    try:
+                        message = _json_loads(response.content).get("message", response.reason)
+                    except ValueError:
+                        message = response.reason
+                    self.error_message = f"GitHub API 인증 실패: {message}"
+                    logger.error(self.error_message)
+                    return False
+                
+                self._user_login = _json_loads(response.content)["login"]
+                
+                # PyGithub 인스턴스 생성 (사용자 객체는 lazy로 만들어 추가 요청 없음)
+                self.github = Github(self.token, per_page=PER_PAGE)
+                self.user = self.github.get_user()
+                
+                self.is_authenticated = True
+                self.error_message = None
+                logger.info("GitHub API 인증 성공 (사용자: %s)", self._user_login)
+                return True
+            
+            except Exception as e:
+                self.error_message = f"GitHub API 인증 중 오류 발생: {str(e)}"
+                logger.error(self.error_message)
+                return False
+    
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        GitHub GraphQL API에 쿼리를 보냅니다.
+        
+        Args:
+            query (str): GraphQL 쿼리 문자열
+            variables (Optional[Dict[str, Any]]): 쿼리 변수
+        
+        Returns:
+            Dict[str, Any]: 응답의 data 필드
+        
+        Raises:
+            requests.RequestException: HTTP 요청 실패 시
+            RuntimeError: GraphQL 오류가 반환된 경우
+        """
+        response = self._send(
+            "POST", GRAPHQL_URL,
+            json={"query": query, "variables": variables or {}},
+            timeout=GRAPHQL_TIMEOUT
+        )
+        response.raise_for_status()
+        
+        payload = _json_loads(response.content)
+        if payload.get("errors"):
+            messages = ", ".join(error.get("message", "") for error in payload["errors"])
+            raise RuntimeError(f"GraphQL 오류: {messages}")
+        
+        return payload["data"]
     
-    def get_repositories(self) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
+    def _project_repo_node(self, node: Dict[str, Any]) -> RepoInfo:
+        """
+        GraphQL 리포지토리 노드를 RepoInfo로 변환합니다.
+        
+        (id, updatedAt)과 카운터 값이 같은 리포지토리는 바뀐 내용이 없으므로 이전에 만든 객체를 재사용합니다.
+        이슈 수처럼 updatedAt을 갱신하지 않고 바뀌는 값이 있어 카운터도 키에 포함합니다.
+        
+        Args:
+            node (Dict[str, Any]): REPOSITORIES_QUERY 응답의 리포지토리 노드
+        
+        Returns:
+            RepoInfo: 리포지토리 정보
+        """
+        key = (
+            node["databaseId"],
+            node["updatedAt"],
+            node["stargazerCount"],
+            node["forkCount"],
+            node["watchers"]["totalCount"],
+            node["issues"]["totalCount"],
+        )
+        cache = self._repo_projection_cache
+        
+        repo_info = cache.get(key)
+        if repo_info is not None:
+            cache.move_to_end(key)
+            return repo_info
+        
+        repo_info = _repo_info_from_node(node)
+        cache[key] = repo_info
+        if len(cache) > REPO_PROJECTION_CACHE_MAX:
+            cache.popitem(last=False)
+        return repo_info
+    
+    def get_repositories(self, refresh: bool = False) -> Tuple[bool, Union[List[RepoInfo], str]]:
         """
         현재 사용자의 리포지토리 목록을 가져옵니다.
         
+        새로고침이 연달아 들어오면 진행 중인 요청의 결과를 함께 기다리고,
+        REPO_LIST_DEBOUNCE_SECONDS 안에 성공한 결과가 있으면 다시 요청하지 않고 재사용합니다.
+        
+        Args:
+            refresh (bool): True이면 최근 결과를 무시하고 새로 요청
+        
         Returns:
-            Tuple[bool, Union[List[Dict[str, Any]], str]]: 
+            Tuple[bool, Union[List[RepoInfo], str]]: 
                 (성공 여부, 리포지토리 목록 또는 오류 메시지)
         """
-        if not self.is_authenticated:
-            return False, "GitHub API에 인증되지 않았습니다."
+        # 앱 시작 후 첫 요청은 디스크 캐시로 바로 응답하고 백그라운드에서 새로고침
+        if not refresh and not self._repo_list_restored:
+            restored = self._restore_repositories()
+            if restored is not None:
+                return True, restored
+        
+        with self._repo_list_lock:
+            if (not refresh and self._repo_list_result is not None
+                    and time.monotonic() - self._repo_list_at < REPO_LIST_DEBOUNCE_SECONDS):
+                return True, list(self._repo_list_result)
+            
+            inflight = self._repo_list_inflight
+            if inflight is None:
+                inflight = self._repo_list_inflight = Future()
+                is_owner = True
+            else:
+                is_owner = False
         
+        if not is_owner:
+            success, data = inflight.result()
+            return success, list(data) if success else data
+        
+        result = (False, "리포지토리 목록 가져오는 중 오류 발생")
         try:
-            # 리포지토리 목록 가져오기
-            repos = self.user.get_repos()
+            result = self._fetch_repositories()
+        finally:
+            with self._repo_list_lock:
+                if result[0]:
+                    self._repo_list_result = result[1]
+                    self._repo_list_at = time.monotonic()
+                self._repo_list_inflight = None
+            inflight.set_result(result)
+        
+        success, data = result
+        if success:
+            self._persist_repositories(data)
+        return success, list(data) if success else data
+    
+    def _restore_repositories(self) -> Optional[List[RepoInfo]]:
+        """
+        디스크 캐시에서 유효 시간 안의 리포지토리 목록을 복원하고 백그라운드 새로고침을 시작합니다.
+        앱 실행(초기화)마다 한 번만 시도합니다.
+        
+        Returns:
+            Optional[List[RepoInfo]]: 복원한 리포지토리 목록 (없거나 만료되었으면 None)
+        """
+        with self._repo_list_lock:
+            if self._repo_list_restored:
+                return None
+            self._repo_list_restored = True
+        
+        # 캐시는 사용자 로그인별로 저장되므로 인증을 먼저 확인
+        if not self._ensure_client() or not REPO_CACHE_DB_PATH.exists():
+            return None
+        
+        try:
+            with closing(sqlite3.connect(REPO_CACHE_DB_PATH)) as conn:
+                row = conn.execute(
+                    "SELECT payload, fetched_at FROM repos WHERE user = ?",
+                    (self._user_login,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("리포지토리 목록 캐시 로드 실패: %s", e)
+            return None
+        
+        if row is None or time.time() - row[1] >= REPO_CACHE_TTL_SECONDS:
+            return None
+        
+        try:
+            repos = [_repo_info_from_dict(item) for item in _json_loads(row[0])]
+        except (ValueError, TypeError) as e:
+            logger.warning("리포지토리 목록 캐시 형식이 올바르지 않습니다: %s", e)
+            return None
+        
+        with self._repo_list_lock:
+            if self._repo_list_result is None:
+                self._repo_list_result = repos
+                self._repo_list_at = time.monotonic()
+        
+        try:
+            self._executor.submit(self.get_repositories, True)
+        except RuntimeError:
+            # 클라이언트가 이미 닫힌 경우
+            pass
+        
+        logger.info("캐시된 리포지토리 %d개를 불러왔습니다. 백그라운드에서 새로고침합니다.", len(repos))
+        return list(repos)
+    
+    def _persist_repositories(self, repos: List[RepoInfo]) -> None:
+        """
+        리포지토리 목록을 사용자 로그인별로 디스크 캐시에 저장합니다.
+        
+        Args:
+            repos (List[RepoInfo]): 저장할 리포지토리 목록
+        """
+        if not self._user_login:
+            return
+        
+        try:
+            payload = json.dumps([repo.to_dict() for repo in repos]).encode("utf-8")
+            os.makedirs(REPO_CACHE_DB_PATH.parent, exist_ok=True)
+            with closing(sqlite3.connect(REPO_CACHE_DB_PATH)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS repos "
+                    "(user TEXT PRIMARY KEY, payload BLOB, fetched_at REAL)"
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO repos (user, payload, fetched_at) VALUES (?, ?, ?)",
+                    (self._user_login, payload, time.time())
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("리포지토리 목록 캐시 저장 실패: %s", e)
+    
+    def _update_cached_repository(self, repo_name: str, repo_info: Optional[RepoInfo]) -> None:
+        """
+        이름 변경/삭제 후 메모리와 디스크에 캐시된 리포지토리 목록에서 해당 항목을 바꾸거나 제거합니다.
+        
+        메모리에 목록이 없으면 디스크 캐시를 그대로 믿을 수 없으므로 사용자의 저장 행을 삭제합니다.
+        
+        Args:
+            repo_name (str): 변경 전 리포지토리 이름 (사용자명/리포지토리명 형식)
+            repo_info (Optional[RepoInfo]): 변경된 리포지토리 정보 (삭제한 경우 None)
+        """
+        with self._repo_list_lock:
+            current = self._repo_list_result
+            if current is not None:
+                if repo_info is None:
+                    current = [repo for repo in current if repo.full_name != repo_name]
+                else:
+                    current = [repo_info if repo.full_name == repo_name else repo for repo in current]
+                self._repo_list_result = current
+        
+        if current is not None:
+            self._persist_repositories(current)
+            return
+        
+        if not self._user_login or not REPO_CACHE_DB_PATH.exists():
+            return
+        
+        try:
+            with closing(sqlite3.connect(REPO_CACHE_DB_PATH)) as conn, conn:
+                conn.execute("DELETE FROM repos WHERE user = ?", (self._user_login,))
+        except sqlite3.Error as e:
+            logger.warning("리포지토리 목록 캐시 삭제 실패: %s", e)
+    
+    def _iter_repository_pages(self) -> Iterator[Tuple[int, List[RepoInfo]]]:
+        """
+        GraphQL로 PER_PAGE(100)개 단위 페이지를 커서 기반으로 가져오며 페이지마다 반환합니다.
+        
+        Returns:
+            Iterator[Tuple[int, List[RepoInfo]]]: (전체 리포지토리 수, 해당 페이지의 리포지토리 목록)
+        """
+        cursor = None
+        project = self._project_repo_node
+        while True:
+            data = self._graphql(REPOSITORIES_QUERY, {"cursor": cursor, "first": PER_PAGE})
+            repositories = data["viewer"]["repositories"]
             
             # 필요한 정보만 추출하여 반환
-            result = []
-            for repo in repos:
-                result.append({
-                    "id": repo.id,
-                    "name": repo.name,
-                    "full_name": repo.full_name,
-                    "description": repo.description,
-                    "html_url": repo.html_url,
-                    "clone_url": repo.clone_url,
-                    "ssh_url": repo.ssh_url,
-                    "private": repo.private,
-                    "fork": repo.fork,
-                    "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                    "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-                    "owner": {
-                        "login": repo.owner.login,
-                        "id": repo.owner.id,
-                        "avatar_url": repo.owner.avatar_url,
-                    } if repo.owner else None,
-                })
-            
-            logger.info(f"{len(result)}개의 리포지토리를 가져왔습니다.")
+            yield repositories["totalCount"], [project(node) for node in repositories["nodes"]]
+            
+            page_info = repositories["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+    
+    def iter_repositories(self) -> Iterator[RepoInfo]:
+        """
+        현재 사용자의 리포지토리를 페이지 단위로 받아오는 즉시 하나씩 반환합니다.
+        
+        전체 목록을 기다리지 않고 첫 페이지부터 화면에 표시할 때 사용합니다.
+        오류는 반환값 대신 예외로 전달됩니다.
+        
+        Returns:
+            Iterator[RepoInfo]: 리포지토리 정보
+        
+        Raises:
+            RuntimeError: 인증 실패 또는 GraphQL 오류
+            requests.RequestException: 네트워크 오류
+        """
+        if not self._ensure_client():
+            raise RuntimeError(self.error_message or "GitHub API에 인증되지 않았습니다.")
+        
+        for _, page in self._iter_repository_pages():
+            yield from page
+    
+    def _fetch_repositories(self) -> Tuple[bool, Union[List[RepoInfo], str]]:
+        """
+        GraphQL로 리포지토리 목록 전체를 요청합니다.
+        
+        Returns:
+            Tuple[bool, Union[List[RepoInfo], str]]: 
+                (성공 여부, 리포지토리 목록 또는 오류 메시지)
+        """
+        if not self._ensure_client():
+            return False, self.error_message or "GitHub API에 인증되지 않았습니다."
+        
+        try:
+            result: List[Optional[RepoInfo]] = []
+            count = 0
+            for total_count, page in self._iter_repository_pages():
+                # 첫 페이지의 전체 개수로 목록을 한 번에 할당
+                if count == 0 and not result:
+                    result = [None] * total_count
+                
+                # 조회 중 리포지토리가 늘어나면 슬라이스 대입이 목록을 확장
+                end = count + len(page)
+                result[count:end] = page
+                count = end
+            
+            # 조회 중 리포지토리가 줄어든 경우 남은 자리 제거
+            del result[count:]
+            
+            logger.info("%d개의 리포지토리를 가져왔습니다.", len(result))
             return True, result
         
-        except GithubException as e:
-            error_msg = f"리포지토리 목록 가져오기 실패: {e.data.get('message', str(e))}"
+        except requests.RequestException as e:
+            error_msg = f"리포지토리 목록 가져오기 실패: {str(e)}"
             logger.error(error_msg)
             return False, error_msg
         
@@ -113,7 +872,274 @@ class GitHubClient:
             logger.error(error_msg)
             return False, error_msg
     
-    def get_repository(self, repo_name: str) -> Tuple[bool, Union[Dict[str, Any], str]]:
+    def _next_token_index(self) -> int:
+        """
+        다음 요청에 사용할 토큰 인덱스를 라운드 로빈으로 고릅니다.
+        요청 한도에 도달한 토큰은 초기화 시각까지 건너뜁니다.
+        
+        Returns:
+            int: 토큰 인덱스
+        """
+        with self._token_lock:
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                idx = next(self._token_cycle)
+                if self._token_reset.get(idx, 0) <= now:
+                    return idx
+            
+            # 모든 토큰이 한도에 도달했으면 가장 먼저 초기화되는 토큰 사용
+            return min(range(len(self._tokens)), key=lambda i: self._token_reset.get(i, 0))
+    
+    def _token_order(self, repo_name: Optional[str]) -> Tuple[Optional[int], List[int]]:
+        """
+        리포지토리 요청에 시도할 토큰 순서를 정합니다.
+        
+        리포지토리에 마지막으로 성공한 토큰이 있고 요청 한도에 걸려 있지 않으면 그 토큰을 먼저 쓰고,
+        없으면 라운드 로빈으로 고른 토큰을 먼저 씁니다. 나머지 토큰은 기본 토큰부터 순서대로 이어 붙입니다.
+        
+        Args:
+            repo_name (Optional[str]): 리포지토리 이름 (사용자명/리포지토리명 형식)
+        
+        Returns:
+            Tuple[Optional[int], List[int]]: (고정된 토큰 인덱스 또는 None, 시도할 토큰 인덱스 목록)
+        """
+        first = None
+        with self._token_lock:
+            pinned = self._repo_token.get(repo_name) if repo_name else None
+            if pinned is not None and self._token_reset.get(pinned, 0) <= time.time():
+                first = pinned
+        if first is None:
+            first = self._next_token_index()
+        return pinned, [first] + [idx for idx in range(len(self._tokens)) if idx != first]
+    
+    def _send(self, method: str, url: str, on_wait: Optional[Callable[[float], None]] = None,
+              **kwargs) -> requests.Response:
+        """
+        속도 제한기를 거쳐 공유 세션(기본 토큰)으로 요청을 보내고, 요청 한도에 걸리면 기다렸다가 다시 시도합니다.
+        
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청 URL
+            on_wait (Optional[Callable[[float], None]]): 재시도 전에 대기 시간(초)을 받아 호출할 함수
+                (예: 진행 다이얼로그에 대기 안내 표시)
+            **kwargs: requests.Session.request에 전달할 추가 인자
+        
+        Returns:
+            requests.Response: 응답
+        """
+        kwargs.setdefault("timeout", REST_TIMEOUT)
+        
+        attempt = 0
+        while True:
+            with self._rate_limiter.acquire():
+                response = self._session.request(method, url, **kwargs)
+            
+            if not self._wait_for_rate_limit(response, attempt, method, url, on_wait):
+                return response
+            attempt += 1
+    
+    def _wait_for_rate_limit(self, response: requests.Response, attempt: int, method: str, url: str,
+                             on_wait: Optional[Callable[[float], None]] = None) -> bool:
+        """
+        요청 한도에 걸린 응답이면 다시 시도할 수 있을 때까지 기다립니다.
+        
+        최대 MAX_RATE_LIMIT_RETRIES번까지 기다리며, 대기 시간이 RATE_LIMIT_MAX_WAIT_SECONDS를 넘으면
+        기다리지 않습니다. 기다린 경우 응답은 닫습니다.
+        
+        Args:
+            response (requests.Response): 응답
+            attempt (int): 지금까지의 재시도 횟수
+            method (str): HTTP 메서드 (로그용)
+            url (str): 요청 URL (로그용)
+            on_wait (Optional[Callable[[float], None]]): 기다리기 전에 대기 시간(초)을 받아 호출할 함수
+        
+        Returns:
+            bool: 기다렸으면 True (다시 시도), 아니면 False (응답을 그대로 사용)
+        """
+        delay = _rate_limit_delay(response, attempt)
+        if delay is None or attempt >= MAX_RATE_LIMIT_RETRIES or delay > RATE_LIMIT_MAX_WAIT_SECONDS:
+            return False
+        
+        logger.warning("요청 한도에 도달했습니다. %.0f초 후 다시 시도합니다: %s %s", delay, method, url)
+        response.close()
+        if on_wait is not None:
+            on_wait(delay)
+        time.sleep(delay)
+        return True
+    
+    def _request(self, method: str, url: str, repo_name: Optional[str] = None,
+                 headers: Optional[Dict[str, str]] = None,
+                 on_wait: Optional[Callable[[float], None]] = None, **kwargs) -> requests.Response:
+        """
+        토큰 풀의 토큰으로 리포지토리 단위 REST 요청을 보냅니다.
+        
+        처음 요청하는 리포지토리는 라운드 로빈으로 고른 토큰을 쓰고, 성공하면 그 토큰을 리포지토리에 고정하여
+        이후 요청(과 토큰마다 다른 ETag)을 같은 토큰으로 보냅니다. 다른 계정의 비공개 리포지토리는 토큰에 따라
+        404/401이 올 수 있으므로, 고정된 토큰이 아닌 토큰의 404/401은 기본 토큰부터 나머지 토큰으로 다시 시도합니다.
+        요청 한도(403/429, X-RateLimit-Remaining: 0)에 걸린 토큰은 초기화 시각을 기록하고 다음 토큰으로 넘어갑니다.
+        모든 토큰이 요청 한도에 걸렸거나 보조 한도에 걸리면 _send와 같이 기다렸다가 다시 시도합니다.
+        계정마다 결과가 달라지는 viewer 기반 요청(GraphQL 목록, /user)은 기본 토큰을 쓰는 세션 헤더를
+        그대로 사용하므로 이 메서드를 거치지 않습니다.
+        
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청 URL
+            repo_name (Optional[str]): 요청 대상 리포지토리 이름 (사용자명/리포지토리명 형식)
+            headers (Optional[Dict[str, str]]): 추가 헤더
+            on_wait (Optional[Callable[[float], None]]): 재시도 전에 대기 시간(초)을 받아 호출할 함수
+            **kwargs: requests.Session.request에 전달할 추가 인자
+        
+        Returns:
+            requests.Response: 응답
+        """
+        if not self._tokens:
+            return self._send(method, url, on_wait=on_wait, headers=headers, **kwargs)
+        
+        kwargs.setdefault("timeout", REST_TIMEOUT)
+        
+        attempt = 0
+        while True:
+            response = self._request_with_token_pool(method, url, repo_name, headers, **kwargs)
+            if not self._wait_for_rate_limit(response, attempt, method, url, on_wait):
+                return response
+            attempt += 1
+    
+    def _request_with_token_pool(self, method: str, url: str, repo_name: Optional[str],
+                                 headers: Optional[Dict[str, str]], **kwargs) -> requests.Response:
+        """
+        토큰 풀의 토큰을 차례로 시도하여 요청을 한 번 보냅니다 (_request 참고).
+        
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청 URL
+            repo_name (Optional[str]): 요청 대상 리포지토리 이름 (사용자명/리포지토리명 형식)
+            headers (Optional[Dict[str, str]]): 추가 헤더
+            **kwargs: requests.Session.request에 전달할 추가 인자
+        
+        Returns:
+            requests.Response: 마지막으로 시도한 토큰의 응답
+        """
+        pinned, order = self._token_order(repo_name)
+        response = None
+        for idx in order:
+            if response is not None:
+                response.close()
+            
+            request_headers = dict(headers or {})
+            request_headers["Authorization"] = f"Bearer {self._tokens[idx]}"
+            with self._rate_limiter.acquire():
+                response = self._session.request(method, url, headers=request_headers, **kwargs)
+            status = response.status_code
+            
+            if status in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+                with self._token_lock:
+                    self._token_reset[idx] = float(response.headers.get("X-RateLimit-Reset") or 0)
+                logger.warning("토큰 %d의 요청 한도에 도달했습니다. 다른 토큰으로 재시도합니다.", idx)
+                continue
+            
+            if status in (401, 404) and idx != pinned:
+                # 이 토큰의 계정에서 보이지 않는 비공개 리포지토리일 수 있으므로 다른 토큰으로 확인
+                logger.debug("토큰 %d로 %s 응답 %d, 다른 토큰으로 재시도합니다.", idx, url, status)
+                continue
+            
+            if repo_name and status < 400:
+                with self._token_lock:
+                    self._repo_token[repo_name] = idx
+            return response
+        
+        return response
+    
+    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None,
+                  on_wait: Optional[Callable[[float], None]] = None) -> Any:
+        """
+        GitHub REST API에 조건부 GET 요청을 보냅니다.
+        
+        이전 응답의 ETag를 If-None-Match로 보내고, 304 응답이면 캐시된 JSON을 반환합니다.
+        304 응답은 본문이 없고 API 요청 한도도 차감되지 않습니다.
+        
+        Args:
+            path (str): API 경로 (예: /repos/owner/name/commits)
+            params (Optional[Dict[str, Any]]): 쿼리 파라미터
+            on_wait (Optional[Callable[[float], None]]): 요청 한도로 재시도하기 전에 대기 시간(초)을 받아 호출할 함수
+        
+        Returns:
+            Any: 응답 JSON
+        
+        Raises:
+            requests.RequestException: HTTP 요청 실패 시
+        """
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        url = f"{REST_API_URL}{path}"
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                self._etag_cache.move_to_end(cache_key)
+        
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = self._request("GET", url, repo_name=_repo_name_from_path(path),
+                                 params=params, headers=headers, on_wait=on_wait)
+        
+        if response.status_code == 304 and cached:
+            logger.debug("변경 없음 (304): %s", path)
+            return cached[1]
+        
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (etag, data)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > ETAG_CACHE_MAX:
+                    self._etag_cache.popitem(last=False)
+        
+        return data
+    
+    def _get_repo(self, repo_name: str) -> Repository.Repository:
+        """
+        리포지토리 객체를 가져옵니다. 한 번 조회한 객체는 캐시하여 재사용합니다.
+        
+        객체는 lazy 모드로 만들어 생성 시점에는 API를 호출하지 않습니다.
+        README 조회나 이름 변경처럼 이름만 있으면 되는 작업은 추가 GET 없이 바로 요청합니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+        
+        Returns:
+            Repository.Repository: PyGithub 리포지토리 객체
+        """
+        repo = self._repo_cache.get(repo_name)
+        if repo is None:
+            repo = self.github.get_repo(repo_name, lazy=True)
+            self._repo_cache[repo_name] = repo
+        return repo
+    
+    def invalidate_repository(self, repo_name: Optional[str] = None) -> None:
+        """
+        캐시된 리포지토리 객체를 무효화합니다.
+        
+        이름 변경이나 삭제처럼 리포지토리가 바뀌는 작업 뒤에 호출해야 합니다.
+        
+        Args:
+            repo_name (Optional[str]): 리포지토리 이름. None이면 전체 캐시를 비웁니다.
+        """
+        if repo_name is None:
+            self._repo_cache.clear()
+            with self._readme_lock:
+                self._readme_cache.clear()
+            with self._token_lock:
+                self._repo_token.clear()
+        else:
+            self._repo_cache.pop(repo_name, None)
+            with self._readme_lock:
+                self._readme_cache.pop(repo_name, None)
+            with self._token_lock:
+                self._repo_token.pop(repo_name, None)
+    
+    def get_repository(self, repo_name: str) -> Tuple[bool, Union[RepoInfo, str]]:
         """
         지정된 이름의 리포지토리 정보를 가져옵니다.
         
@@ -121,47 +1147,24 @@ class GitHubClient:
             repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
         
         Returns:
-            Tuple[bool, Union[Dict[str, Any], str]]: 
+            Tuple[bool, Union[RepoInfo, str]]: 
                 (성공 여부, 리포지토리 정보 또는 오류 메시지)
         """
-        if not self.is_authenticated:
-            return False, "GitHub API에 인증되지 않았습니다."
+        if not self._ensure_client():
+            return False, self.error_message or "GitHub API에 인증되지 않았습니다."
         
         try:
-            # 리포지토리 정보 가져오기
-            repo = self.github.get_repo(repo_name)
+            # 리포지토리 정보 가져오기 (변경이 없으면 304 응답으로 캐시된 JSON 사용)
+            data = self._get_json(f"/repos/{repo_name}")
             
             # 필요한 정보 추출
-            result = {
-                "id": repo.id,
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "html_url": repo.html_url,
-                "clone_url": repo.clone_url,
-                "ssh_url": repo.ssh_url,
-                "private": repo.private,
-                "fork": repo.fork,
-                "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-                "owner": {
-                    "login": repo.owner.login,
-                    "id": repo.owner.id,
-                    "avatar_url": repo.owner.avatar_url,
-                } if repo.owner else None,
-                "default_branch": repo.default_branch,
-                "language": repo.language,
-                "forks_count": repo.forks_count,
-                "stargazers_count": repo.stargazers_count,
-                "watchers_count": repo.watchers_count,
-                "open_issues_count": repo.open_issues_count,
-            }
+            result = _repo_info_from(data)
             
-            logger.info(f"리포지토리 '{repo_name}' 정보를 가져왔습니다.")
+            logger.info("리포지토리 '%s' 정보를 가져왔습니다.", repo_name)
             return True, result
         
-        except GithubException as e:
-            error_msg = f"리포지토리 정보 가져오기 실패: {e.data.get('message', str(e))}"
+        except requests.RequestException as e:
+            error_msg = f"리포지토리 정보 가져오기 실패: {str(e)}"
             logger.error(error_msg)
             return False, error_msg
         
@@ -169,6 +1172,344 @@ class GitHubClient:
             error_msg = f"리포지토리 정보 가져오는 중 오류 발생: {str(e)}"
             logger.error(error_msg)
             return False, error_msg
+    
+    def _get_repository_limited(self, repo_name: str) -> Tuple[bool, Union[RepoInfo, str]]:
+        """
+        동시 요청 수 제한 안에서 get_repository를 호출합니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+        
+        Returns:
+            Tuple[bool, Union[RepoInfo, str]]: get_repository의 결과
+        """
+        with self._request_slots:
+            return self.get_repository(repo_name)
+    
+    def get_repositories_bulk(self, repo_names: List[str]) -> Dict[str, Tuple[bool, Union[RepoInfo, str]]]:
+        """
+        여러 리포지토리의 정보를 동시에 가져옵니다.
+        
+        요청은 스레드 풀에서 병렬로 보내므로 전체 소요 시간은 가장 느린 요청 하나에 가까워집니다.
+        
+        Args:
+            repo_names (List[str]): 리포지토리 이름 목록 (사용자명/리포지토리명 형식)
+        
+        Returns:
+            Dict[str, Tuple[bool, Union[RepoInfo, str]]]: 
+                리포지토리 이름 -> (성공 여부, 리포지토리 정보 또는 오류 메시지)
+        """
+        if not repo_names:
+            return {}
+        
+        # 인증은 작업자 스레드로 나누기 전에 한 번만 수행
+        if not self._ensure_client():
+            error_msg = self.error_message or "GitHub API에 인증되지 않았습니다."
+            return {repo_name: (False, error_msg) for repo_name in repo_names}
+        
+        futures = {
+            self._executor.submit(self._get_repository_limited, repo_name): repo_name
+            for repo_name in repo_names
+        }
+        
+        results = {}
+        for future in as_completed(futures):
+            repo_name = futures[future]
+            try:
+                results[repo_name] = future.result()
+            except Exception as e:
+                results[repo_name] = (False, f"리포지토리 정보 가져오는 중 오류 발생: {str(e)}")
+        
+        return results
+    
+    def get_readme(self, repo_name: str) -> Tuple[bool, Optional[str]]:
+        """
+        리포지토리의 README 내용을 가져옵니다.
+        
+        base64 인코딩 응답 대신 raw 미디어 타입으로 요청하여 디코딩 과정 없이 본문을 받습니다.
+        최근 README는 ETag와 함께 LRU로 보관하여, 다시 요청할 때 304 응답이면 본문을 내려받지 않습니다.
+        raw 요청이 실패하면 PyGithub 경로로 다시 시도합니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+        
+        Returns:
+            Tuple[bool, Optional[str]]: 
+                (성공 여부, README 내용(없으면 None) 또는 오류 메시지)
+        """
+        return self.stream_readme(repo_name)
+    
+    def stream_readme(self, repo_name: str,
+                      chunk_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, Optional[str]]:
+        """
+        리포지토리의 README 내용을 가져오면서, 내려받는 대로 조각 단위로 chunk_callback에 전달합니다.
+        
+        chunk_callback은 호출한 스레드(작업자 스레드)에서 호출됩니다. 캐시된 내용(304)이나
+        PyGithub 경로로 가져온 내용은 한 번에 전달합니다. chunk_callback이 없으면 get_readme와 같습니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+            chunk_callback (Optional[Callable[[str], None]]): 디코딩된 README 조각을 받을 함수
+        
+        Returns:
+            Tuple[bool, Optional[str]]: 
+                (성공 여부, README 전체 내용(없으면 None) 또는 오류 메시지)
+        """
+        if not self._ensure_client():
+            return False, self.error_message or "GitHub API에 인증되지 않았습니다."
+        
+        with self._readme_lock:
+            cached = self._readme_cache.get(repo_name)
+        
+        headers = {"Accept": "application/vnd.github.raw+json"}
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        
+        streamed = False
+        try:
+            response = self._request(
+                "GET",
+                f"{REST_API_URL}/repos/{repo_name}/readme",
+                repo_name=repo_name,
+                headers=headers,
+                stream=chunk_callback is not None
+            )
+            
+            with closing(response):
+                if response.status_code == 304 and cached:
+                    with self._readme_lock:
+                        self._readme_cache.move_to_end(repo_name)
+                    if chunk_callback:
+                        chunk_callback(cached[1])
+                    return True, cached[1]
+                
+                if response.status_code == 200:
+                    if chunk_callback:
+                        # 멀티바이트 문자가 조각 경계에서 잘리지 않도록 점진적으로 디코딩
+                        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                        parts = []
+                        for chunk in response.iter_content(chunk_size=README_STREAM_CHUNK_SIZE):
+                            piece = decoder.decode(chunk)
+                            if piece:
+                                streamed = True
+                                parts.append(piece)
+                                chunk_callback(piece)
+                        piece = decoder.decode(b"", final=True)
+                        if piece:
+                            parts.append(piece)
+                            chunk_callback(piece)
+                        text = "".join(parts)
+                    else:
+                        response.encoding = "utf-8"
+                        text = response.text
+                    
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        with self._readme_lock:
+                            self._readme_cache[repo_name] = (etag, text)
+                            self._readme_cache.move_to_end(repo_name)
+                            if len(self._readme_cache) > README_CACHE_MAX:
+                                self._readme_cache.popitem(last=False)
+                    return True, text
+                
+                if response.status_code == 404:
+                    with self._readme_lock:
+                        self._readme_cache.pop(repo_name, None)
+                    return True, None
+            
+            logger.warning("README raw 요청 실패 (HTTP %d), PyGithub로 재시도합니다.", response.status_code)
+        
+        except requests.RequestException as e:
+            if streamed:
+                # 이미 일부를 전달했으므로 다시 시도하지 않음
+                error_msg = f"README 내려받는 중 오류 발생: {str(e)}"
+                logger.error(error_msg)
+                return False, error_msg
+            logger.warning("README raw 요청 중 오류 발생, PyGithub로 재시도합니다: %s", e)
+        
+        try:
+            readme = self._get_repo(repo_name).get_readme()
+            text = readme.decoded_content.decode("utf-8")
+            if chunk_callback:
+                chunk_callback(text)
+            return True, text
+        
+        except UnknownObjectException:
+            return True, None
+        
+        except GithubException as e:
+            error_msg = f"README 가져오기 실패: {e.data.get('message', str(e))}"
+            logger.error(error_msg)
+            return False, error_msg
+        
+        except Exception as e:
+            error_msg = f"README 가져오는 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+    
+    def rename_repository(self, repo_name: str, new_name: str,
+                          on_wait: Optional[Callable[[float], None]] = None) -> Tuple[bool, Union[RepoInfo, str]]:
+        """
+        리포지토리 이름을 변경합니다.
+        
+        변경 작업(이름 변경, 삭제)은 GraphQL 대신 REST API로 공유 세션을 통해 보내고,
+        응답의 리포지토리 JSON에서 바로 변경된 정보를 만듭니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+            new_name (str): 새 리포지토리 이름
+            on_wait (Optional[Callable[[float], None]]): 요청 한도로 재시도를 기다릴 때 대기 시간(초)을 받을 함수
+        
+        Returns:
+            Tuple[bool, Union[RepoInfo, str]]: 
+                (성공 여부, 변경된 리포지토리 정보 또는 오류 메시지)
+        """
+        if not self._ensure_client():
+            return False, self.error_message or "GitHub API에 인증되지 않았습니다."
+        
+        try:
+            response = self._send(
+                "PATCH", f"{REST_API_URL}/repos/{repo_name}",
+                on_wait=on_wait, json={"name": new_name}
+            )
+            
+            if not response.ok:
+                message = response.reason
+                if response.content:
+                    message = _json_loads(response.content).get("message", message)
+                error_msg = f"리포지토리 이름 변경 실패: {message}"
+                logger.error(error_msg)
+                return False, error_msg
+            
+            # 응답에 새 이름과 URL이 담긴 리포지토리 JSON이 그대로 오므로 추가 조회 불필요
+            repo_info = _repo_info_from(_json_loads(response.content))
+            
+            self.invalidate_repository(repo_name)
+            self._update_cached_repository(repo_name, repo_info)
+            
+            logger.info("리포지토리 '%s'의 이름을 '%s'으로 변경했습니다.", repo_name, new_name)
+            return True, repo_info
+        
+        except requests.RequestException as e:
+            error_msg = f"리포지토리 이름 변경 실패: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+        
+        except Exception as e:
+            error_msg = f"리포지토리 이름 변경 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+    
+    def delete_repository(self, repo_name: str,
+                          on_wait: Optional[Callable[[float], None]] = None) -> Tuple[bool, str]:
+        """
+        리포지토리를 삭제합니다.
+        
+        공유 세션으로 REST DELETE 요청을 보내므로 여러 작업자 스레드에서 동시에 호출해도
+        연결 풀을 함께 사용합니다. 삭제 권한은 계정마다 다르므로 토큰 풀 대신 기본 토큰을 사용합니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+            on_wait (Optional[Callable[[float], None]]): 요청 한도로 재시도를 기다릴 때 대기 시간(초)을 받을 함수
+        
+        Returns:
+            Tuple[bool, str]: (성공 여부, 결과 메시지 또는 오류 메시지)
+        """
+        if not self._ensure_client():
+            return False, self.error_message or "GitHub API에 인증되지 않았습니다."
+        
+        try:
+            response = self._send(
+                "DELETE", f"{REST_API_URL}/repos/{repo_name}", on_wait=on_wait
+            )
+            
+            if response.status_code != 204:
+                message = response.reason
+                if response.content:
+                    message = _json_loads(response.content).get("message", message)
+                error_msg = f"리포지토리 삭제 실패: {message}"
+                logger.error(error_msg)
+                return False, error_msg
+            
+            self.invalidate_repository(repo_name)
+            self._update_cached_repository(repo_name, None)
+            
+            logger.info("리포지토리 '%s'을(를) 삭제했습니다.", repo_name)
+            return True, f"리포지토리 '{repo_name}'이(가) 삭제되었습니다."
+        
+        except requests.RequestException as e:
+            error_msg = f"리포지토리 삭제 실패: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+        
+        except Exception as e:
+            error_msg = f"리포지토리 삭제 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+    
+    def get_commits(self, repo_name: str, branch: Optional[str] = None,
+                    max_count: int = 30, page: int = 1,
+                    on_wait: Optional[Callable[[float], None]] = None) -> List[Dict[str, Any]]:
+        """
+        리포지토리의 커밋 목록을 가져옵니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+            branch (Optional[str]): 브랜치 이름. None이면 기본 브랜치
+            max_count (int): 가져올 최대 커밋 수 (최대 100)
+            page (int): 페이지 번호 (1부터 시작)
+            on_wait (Optional[Callable[[float], None]]): 요청 한도로 재시도하기 전에 대기 시간(초)을 받아 호출할 함수
+        
+        Returns:
+            List[Dict[str, Any]]: 커밋 목록 (GitHub REST API 응답 형식)
+        
+        Raises:
+            RuntimeError: 인증에 실패한 경우
+            requests.RequestException: HTTP 요청 실패 시
+        """
+        if not self._ensure_client():
+            raise RuntimeError(self.error_message or "GitHub API에 인증되지 않았습니다.")
+        
+        commits = self._get_json(
+            f"/repos/{repo_name}/commits",
+            {"sha": branch, "per_page": min(max_count, PER_PAGE), "page": page},
+            on_wait=on_wait
+        )
+        
+        logger.info("리포지토리 '%s'의 커밋 %d개를 가져왔습니다.", repo_name, len(commits))
+        return commits
+    
+    def get_pull_requests(self, repo_name: str, state: str = "open",
+                          max_count: int = 30, page: int = 1,
+                          on_wait: Optional[Callable[[float], None]] = None) -> List[Dict[str, Any]]:
+        """
+        리포지토리의 풀 리퀘스트 목록을 가져옵니다.
+        
+        Args:
+            repo_name (str): 리포지토리 이름 (사용자명/리포지토리명 형식)
+            state (str): PR 상태 (open, closed, all)
+            max_count (int): 가져올 최대 PR 수 (최대 100)
+            page (int): 페이지 번호 (1부터 시작)
+            on_wait (Optional[Callable[[float], None]]): 요청 한도로 재시도하기 전에 대기 시간(초)을 받아 호출할 함수
+        
+        Returns:
+            List[Dict[str, Any]]: PR 목록 (GitHub REST API 응답 형식)
+        
+        Raises:
+            RuntimeError: 인증에 실패한 경우
+            requests.RequestException: HTTP 요청 실패 시
+        """
+        if not self._ensure_client():
+            raise RuntimeError(self.error_message or "GitHub API에 인증되지 않았습니다.")
+        
+        pull_requests = self._get_json(
+            f"/repos/{repo_name}/pulls",
+            {"state": state, "per_page": min(max_count, PER_PAGE), "page": page},
+            on_wait=on_wait
+        )
+        
+        logger.info("리포지토리 '%s'의 PR %d개를 가져왔습니다.", repo_name, len(pull_requests))
+        return pull_requests
 
 
 # 싱글톤 인스턴스
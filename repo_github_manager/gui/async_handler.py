@@ -2,10 +2,12 @@
 비동기 작업 처리 모듈
 백그라운드 스레드에서 시간이 오래 걸리는 작업을 실행하고 GUI에 결과를 전달합니다.
 """
-import threading
 import queue
+import threading
+import functools
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from typing import Callable, Dict, Any, Optional, Tuple, List, Union
 
 from utils.logger import setup_logger
@@ -13,6 +15,9 @@ from utils.logger import setup_logger
 # 로거 설정
 logger = setup_logger(__name__)
 
+# Tk 메인 스레드에서 완료 콜백 큐를 확인하는 주기 (밀리초)
+UI_POLL_INTERVAL_MS = 50
+
 
 class AsyncTask:
     """비동기 작업을 나타내는 클래스"""
@@ -41,6 +46,7 @@ class AsyncTask:
         self.start_time = None
         self.end_time = None
         self.is_cancelled = False
+        self.future: Optional[Future] = None
     
     def execute(self) -> None:
         """작업을 실행하고 결과 또는 오류를 저장"""
@@ -73,96 +79,157 @@ class AsyncTask:
 class AsyncHandler:
     """비동기 작업 처리기"""
     
-    def __init__(self, max_workers: int = 5):
+    def __init__(self, max_workers: int = 5, tk_root=None):
         """
         비동기 처리기 초기화
         
         Args:
             max_workers (int, optional): 최대 작업자 스레드 수
+            tk_root (optional): 콜백을 실행할 Tk 루트 위젯 (없으면 작업자 스레드에서 바로 호출)
         """
-        self.tasks_queue = queue.Queue()
-        self.results_queue = queue.Queue()
-        self.workers = []
         self.running = False
         self.max_workers = max_workers
         self.active_tasks = {}  # 작업 ID -> AsyncTask
         self.task_id_counter = 0
         self.lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._root = None
+        self._ui_queue: "queue.Queue[Tuple[Callable, Any]]" = queue.Queue()
+        self._poll_after_id = None
+        self._stop_event = threading.Event()
+        
+        if tk_root is not None:
+            self.set_tk_root(tk_root)
+    
+    def set_tk_root(self, tk_root) -> None:
+        """
+        완료 콜백을 전달할 Tk 루트 위젯을 설정합니다.
+        
+        설정하면 작업자 스레드는 콜백을 큐에 넣기만 하고, Tk 메인 스레드가 주기적으로 큐를 비우며
+        콜백을 실행하므로 콜백 안에서 위젯을 안전하게 다룰 수 있습니다.
+        메인 스레드에서 호출해야 합니다.
+        
+        Args:
+            tk_root: Tk 루트 위젯
+        """
+        if tk_root is self._root:
+            return
+        
+        self._cancel_ui_poll()
+        self._root = tk_root
+        if tk_root is not None:
+            self._poll_after_id = tk_root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+    
+    def _cancel_ui_poll(self) -> None:
+        """예약된 콜백 큐 확인을 취소"""
+        if self._root is not None and self._poll_after_id is not None:
+            try:
+                self._root.after_cancel(self._poll_after_id)
+            except Exception:
+                # 루트 위젯이 이미 파괴된 경우
+                pass
+        self._poll_after_id = None
+    
+    def _drain_ui_queue(self) -> None:
+        """Tk 메인 스레드에서 대기 중인 콜백을 모두 실행하고 다음 확인을 예약"""
+        while True:
+            try:
+                callback, value = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                callback(value)
+            except Exception as e:
+                logger.error(f"완료 콜백 실행 중 예기치 않은 오류 발생: {str(e)}")
+                logger.debug(traceback.format_exc())
+        
+        try:
+            self._poll_after_id = self._root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+        except Exception:
+            # 루트 위젯이 파괴되었으면 확인 중단
+            self._poll_after_id = None
+    
+    def _dispatch(self, callback: Callable, value: Any) -> None:
+        """
+        콜백을 Tk 메인 스레드로 넘겨 실행하거나, Tk 루트가 없으면 바로 실행합니다.
+        
+        Args:
+            callback (Callable): 실행할 콜백
+            value (Any): 콜백에 전달할 값
+        """
+        if self._root is not None:
+            self._ui_queue.put((callback, value))
+        else:
+            callback(value)
     
     def start(self) -> None:
-        """작업자 스레드를 시작"""
+        """작업자 스레드 풀을 시작"""
         if self.running:
             return
         
+        self._stop_event.clear()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="async_handler"
+        )
         self.running = True
         
-        # 작업자 스레드 생성
-        for _ in range(self.max_workers):
-            worker = threading.Thread(target=self._worker_loop, daemon=True)
-            worker.start()
-            self.workers.append(worker)
-        
-        # 결과 처리 스레드 생성
-        self.result_thread = threading.Thread(target=self._process_results, daemon=True)
-        self.result_thread.start()
-        
         logger.info(f"비동기 작업 처리기가 시작되었습니다. 작업자 수: {self.max_workers}")
     
-    def stop(self) -> None:
-        """모든 작업자 스레드 종료"""
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        대기 중인 작업을 취소하고 스레드 풀 종료
+        
+        실행 중인 작업은 최대 timeout초까지 기다리며, 중지 후 끝난 작업의 콜백은 실행하지 않습니다.
+        
+        Args:
+            timeout (float, optional): 실행 중인 작업을 기다릴 최대 시간 (초)
+        """
         self.running = False
+        self._stop_event.set()
         
-        # 대기 중인 모든 작업 취소
-        while not self.tasks_queue.empty():
-            try:
-                task = self.tasks_queue.get_nowait()
-                task.cancel()
-                self.tasks_queue.task_done()
-            except queue.Empty:
-                break
+        with self.lock:
+            tasks = list(self.active_tasks.values())
+        
+        for task in tasks:
+            task.cancel()
+        
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        
+        running = [task.future for task in tasks if task.future is not None and not task.future.done()]
+        if running:
+            _, not_done = wait(running, timeout=timeout)
+            if not_done:
+                logger.warning(f"{len(not_done)}개의 작업이 {timeout}초 안에 끝나지 않았습니다.")
         
         logger.info("비동기 작업 처리기가 중지되었습니다.")
     
-    def _worker_loop(self) -> None:
-        """작업자 스레드의 메인 루프"""
-        while self.running:
-            try:
-                task = self.tasks_queue.get(timeout=0.5)  # 0.5초 대기
-                
-                if not task.is_cancelled:
-                    task.execute()
-                    self.results_queue.put(task)
-                
-                self.tasks_queue.task_done()
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"작업자 스레드에서 예기치 않은 오류 발생: {str(e)}")
-                logger.debug(traceback.format_exc())
-    
-    def _process_results(self) -> None:
-        """결과 처리 스레드의 메인 루프"""
-        while self.running:
-            try:
-                task = self.results_queue.get(timeout=0.5)  # 0.5초 대기
-                
-                with self.lock:
-                    if task.task_id in self.active_tasks:
-                        del self.active_tasks[task.task_id]
-                
-                if task.error:
-                    if task.error_callback:
-                        task.error_callback(task.error)
-                else:
-                    if task.callback:
-                        task.callback(task.result)
-                
-                self.results_queue.task_done()
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"결과 처리 스레드에서 예기치 않은 오류 발생: {str(e)}")
-                logger.debug(traceback.format_exc())
+    def _on_task_done(self, task: AsyncTask, future: Future) -> None:
+        """
+        작업 완료 시 스레드 풀에서 호출되어 결과에 맞는 콜백을 실행
+        
+        Args:
+            task (AsyncTask): 완료된 작업
+            future (Future): 작업의 Future
+        """
+        with self.lock:
+            self.active_tasks.pop(task.task_id, None)
+        
+        if future.cancelled() or task.is_cancelled or self._stop_event.is_set():
+            return
+        
+        try:
+            if task.error:
+                if task.error_callback:
+                    self._dispatch(task.error_callback, task.error)
+            else:
+                if task.callback:
+                    self._dispatch(task.callback, task.result)
+        except Exception as e:
+            logger.error(f"작업 '{task.task_id}'의 콜백 실행 중 예기치 않은 오류 발생: {str(e)}")
+            logger.debug(traceback.format_exc())
     
     def submit_task(self, task_func: Callable, callback: Callable = None, 
                     error_callback: Callable = None, *args, **kwargs) -> str:
@@ -185,17 +252,46 @@ class AsyncHandler:
         with self.lock:
             task_id = f"task_{self.task_id_counter}"
             self.task_id_counter += 1
-        
-        task = AsyncTask(task_id, task_func, callback, error_callback, *args, **kwargs)
-        
-        with self.lock:
+            task = AsyncTask(task_id, task_func, callback, error_callback, *args, **kwargs)
             self.active_tasks[task_id] = task
         
-        self.tasks_queue.put(task)
+        task.future = self._pool.submit(task.execute)
+        task.future.add_done_callback(functools.partial(self._on_task_done, task))
         logger.debug(f"작업 '{task_id}'이(가) 제출되었습니다.")
         
         return task_id
     
+    def submit_batch(self, specs: List[Tuple]) -> List[str]:
+        """
+        여러 비동기 작업을 한 번에 제출
+        
+        잠금을 한 번만 잡고 연속된 작업 ID를 할당하므로 많은 작업을 제출할 때 submit_task 반복보다 가볍습니다.
+        
+        Args:
+            specs (List[Tuple]): (task_func, callback, error_callback, *args) 형식의 작업 명세 목록
+        
+        Returns:
+            List[str]: 제출 순서대로의 작업 ID 목록
+        """
+        if not specs:
+            return []
+        
+        if not self.running:
+            self.start()
+        
+        with self.lock:
+            base = self.task_id_counter
+            self.task_id_counter += len(specs)
+            tasks = [AsyncTask(f"task_{base + i}", *spec) for i, spec in enumerate(specs)]
+            self.active_tasks.update((task.task_id, task) for task in tasks)
+        
+        for task in tasks:
+            task.future = self._pool.submit(task.execute)
+            task.future.add_done_callback(functools.partial(self._on_task_done, task))
+        logger.debug(f"작업 {len(tasks)}개가 일괄 제출되었습니다.")
+        
+        return [task.task_id for task in tasks]
+    
     def cancel_task(self, task_id: str) -> bool:
         """
         지정된 ID의 작업을 취소 (아직 시작하지 않은 경우)
@@ -207,12 +303,17 @@ class AsyncHandler:
             bool: 취소 성공 여부
         """
         with self.lock:
-            if task_id in self.active_tasks:
-                task = self.active_tasks[task_id]
-                task.cancel()
-                logger.debug(f"작업 '{task_id}'이(가) 취소되었습니다.")
-                return True
-        return False
+            task = self.active_tasks.get(task_id)
+        
+        if task is None:
+            return False
+        
+        # Future.cancel()은 완료 콜백을 즉시 호출하므로 잠금 밖에서 취소
+        task.cancel()
+        if task.future is not None:
+            task.future.cancel()
+        logger.debug(f"작업 '{task_id}'이(가) 취소되었습니다.")
+        return True
     
     def get_active_tasks(self) -> Dict[str, Dict[str, Any]]:
         """
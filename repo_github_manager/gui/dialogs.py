@@ -3,6 +3,8 @@ UI 다이얼로그 모듈
 사용자 입력을 받거나 정보를 표시하는 다양한 다이얼로그 창을 제공합니다.
 """
 import os
+import time
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Optional, Callable, Dict, Any, List, Tuple
@@ -12,6 +14,9 @@ from utils.logger import setup_logger
 # 로거 설정
 logger = setup_logger(__name__)
 
+# 진행 다이얼로그 화면 갱신 최소 간격 (밀리초)
+PROGRESS_REFRESH_INTERVAL_MS = 30
+
 
 class InputDialog(tk.Toplevel):
     """사용자 입력을 받는 다이얼로그"""
@@ -109,6 +114,21 @@ class InputDialog(tk.Toplevel):
         # 컬럼 설정
         frame.columnconfigure(1, weight=1)
         
+        # 제출 시 사용할 필드 정보를 한 번만 계산
+        # (이름, 레이블, 필수 여부 검사 대상인지, 값 읽기 함수)
+        self._field_specs = []
+        for field in fields:
+            field_name = field.get("name", "")
+            widget = self.field_widgets.get(field_name)
+            if widget is None:
+                continue
+            
+            # Entry/Combobox만 빈 값 검사 (변수 기반 위젯은 항상 값이 있음)
+            check_required = field.get("required", False) and isinstance(widget, (ttk.Entry, ttk.Combobox))
+            self._field_specs.append(
+                (field_name, field.get("label", field_name), check_required, widget.get)
+            )
+        
         # 버튼 프레임
         button_frame = ttk.Frame(self)
         button_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
@@ -127,38 +147,16 @@ class InputDialog(tk.Toplevel):
     
     def submit(self) -> None:
         """입력 값 제출"""
-        # 필수 필드 확인
-        for field in self.fields:
-            field_name = field.get("name", "")
-            field_required = field.get("required", False)
-            
-            if field_required:
-                widget = self.field_widgets.get(field_name)
-                if widget is None:
-                    continue
-                
-                if isinstance(widget, (ttk.Entry, ttk.Combobox)):
-                    if not widget.get().strip():
-                        messagebox.showerror("오류", f"{field.get('label', field_name)}은(는) 필수 항목입니다.")
-                        return
-                elif isinstance(widget, (tk.BooleanVar, tk.StringVar)):
-                    # 변수 기반 위젯은 항상 값이 있음
-                    pass
-        
-        # 결과 수집
-        self.result = {}
-        for field in self.fields:
-            field_name = field.get("name", "")
-            widget = self.field_widgets.get(field_name)
-            
-            if widget is None:
-                continue
-            
-            if isinstance(widget, (ttk.Entry, ttk.Combobox)):
-                self.result[field_name] = widget.get()
-            elif isinstance(widget, (tk.BooleanVar, tk.StringVar)):
-                self.result[field_name] = widget.get()
+        # 필수 필드 확인과 결과 수집을 한 번에 처리
+        result = {}
+        for field_name, field_label, check_required, get_value in self._field_specs:
+            value = get_value()
+            if check_required and not value.strip():
+                messagebox.showerror("오류", f"{field_label}은(는) 필수 항목입니다.")
+                return
+            result[field_name] = value
         
+        self.result = result
         self.destroy()
     
     def cancel(self) -> None:
@@ -277,6 +275,7 @@ class ProgressDialog(tk.Toplevel):
         self.grab_set()
         
         self.is_cancelled = False
+        self._last_update_ms = 0
         
         # 메시지 레이블
         self.message_label = ttk.Label(self, text=message, wraplength=width-40)
@@ -309,7 +308,7 @@ class ProgressDialog(tk.Toplevel):
             message (str): 새 메시지
         """
         self.message_label.config(text=message)
-        self.update()
+        self._refresh()
     
     def set_progress(self, value: float) -> None:
         """
@@ -328,7 +327,22 @@ class ProgressDialog(tk.Toplevel):
             self.progressbar["mode"] = "determinate"
         
         self.progressbar["value"] = value
-        self.update()
+        self._refresh()
+    
+    def _refresh(self) -> None:
+        """
+        대기 중인 화면 갱신을 처리합니다.
+        
+        전체 이벤트 큐를 처리하는 update() 대신 update_idletasks()를 사용하고,
+        PROGRESS_REFRESH_INTERVAL_MS 안에 들어온 연속 갱신은 건너뜁니다.
+        건너뛴 값은 위젯에 이미 반영되어 있어 다음 갱신 때 함께 그려집니다.
+        """
+        now = int(time.monotonic() * 1000)
+        if now - self._last_update_ms < PROGRESS_REFRESH_INTERVAL_MS:
+            return
+        
+        self._last_update_ms = now
+        self.update_idletasks()
     
     def cancel(self) -> None:
         """취소 버튼 클릭"""
@@ -408,7 +422,8 @@ def show_progress_dialog(parent, title: str, message: str, task_func: Callable,
         except Exception as e:
             error = e
         finally:
-            parent.after(100, finish)
+            # 고정 지연 없이 이벤트 루프가 한가해지는 즉시 결과 처리
+            parent.after_idle(finish)
     
     def finish():
         dialog.close()
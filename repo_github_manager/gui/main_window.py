@@ -7,12 +7,20 @@ from tkinter import ttk, messagebox
 import sys
 import logging
 
-from utils.logger import setup_logger
-from utils.macos_utils import check_system_requirements
+from utils.logger import setup_logger, init_logging
+from core.github_client import github_client
+from gui.async_handler import async_handler
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 플랫폼별 기본 테마 (모듈 로드 시 한 번만 결정)
+_IS_MAC = sys.platform == 'darwin'
+_DEFAULT_THEME = 'aqua' if _IS_MAC else 'clam'
+
+# 아직 구현되지 않은 탭에 표시할 안내 문구
+_PLACEHOLDER_TEXT = "이 탭의 콘텐츠는 추후 구현될 예정입니다."
+
 
 class MainWindow(tk.Tk):
     """
@@ -20,84 +28,117 @@ class MainWindow(tk.Tk):
     GitHub 저장소 관리자의 기본 UI 레이아웃을 구현합니다.
     """
     
+    # 리포지토리 목록 컬럼 정의: (컬럼 ID, 제목, 너비, 정렬)
+    _COLUMNS = (
+        ("name", "이름", 150, tk.W),
+        ("description", "설명", 250, tk.W),
+        ("private", "비공개", 60, tk.CENTER),
+    )
+    
+    # 메뉴 바 정의: (메뉴 이름, [(항목 이름, 콜백 메서드 이름) 또는 None(구분선)])
+    _MENU_SPEC = (
+        ("파일", (("새 리포지토리", "_placeholder"), None, ("종료", "quit"))),
+        ("보기", (("리포지토리 목록 새로고침", "_placeholder"),)),
+        ("도움말", (("정보", "_show_about"),)),
+    )
+    
     def __init__(self):
         """메인 윈도우 초기화"""
         super().__init__()
         
-        # 시스템 요구사항 확인
-        self._check_requirements()
+        # 백그라운드 작업 완료 콜백은 이 창의 메인 스레드에서 실행
+        async_handler.set_tk_root(self)
+        
+        # 상태 표시줄 갱신 대기 상태 (유휴 시점에 한 번만 반영)
+        self._status_dirty = False
+        self._pending_status = None
         
         # 윈도우 기본 설정
         self.title("GitHub 저장소 관리자")
         self.geometry("1024x768")  # 기본 창 크기
         self.minsize(800, 600)     # 최소 창 크기
         
-        # macOS 스타일 설정
-        if sys.platform == 'darwin':
-            self.style = ttk.Style()
-            self.style.theme_use('aqua')
+        # 스타일 설정 (macOS는 aqua 테마)
+        self.style = ttk.Style()
+        if self.style.theme_use() != _DEFAULT_THEME:
+            self.style.theme_use(_DEFAULT_THEME)
         
         # UI 컴포넌트 초기화
         self._init_menu()
         self._init_main_layout()
         self._init_status_bar()
         
-        # 초기 상태 메시지
-        self.status_message("준비")
+        # 초기 상태 메시지 (mainloop가 그리므로 유휴 갱신 예약 없이 바로 설정)
+        self.status_label.config(text="준비")
+        
+        # 시스템 요구사항 확인은 창이 먼저 표시된 뒤 유휴 시점에 수행
+        self.after_idle(self._check_requirements)
         
         logger.info("메인 윈도우가 초기화되었습니다.")
     
     def _check_requirements(self):
         """시스템 요구사항 확인"""
+        # 창이 표시된 뒤에만 필요하므로 이 시점에 로드
+        from utils.macos_utils import check_system_requirements
+        
         requirements = check_system_requirements()
         
         if not requirements["is_macos"]:
-            messagebox.showerror(
+            self._exit_with_error(
                 "시스템 요구사항 오류",
                 "이 애플리케이션은 macOS에서만 실행할 수 있습니다."
             )
-            sys.exit(1)
         
         if not requirements["git_available"]:
-            messagebox.showerror(
+            self._exit_with_error(
                 "시스템 요구사항 오류",
                 "Git이 설치되어 있지 않습니다. Git을 설치한 후 다시 실행하세요."
             )
-            sys.exit(1)
         
         if not requirements["config_permission"]:
-            messagebox.showerror(
+            self._exit_with_error(
                 "권한 오류",
                 "애플리케이션 설정 디렉토리에 쓰기 권한이 없습니다."
             )
-            sys.exit(1)
         
         logger.info("시스템 요구사항 확인 완료")
     
+    def _exit_with_error(self, title, message):
+        """오류 메시지를 표시하고 이미 표시된 창을 정리한 뒤 종료"""
+        messagebox.showerror(title, message, parent=self)
+        self.destroy()
+        sys.exit(1)
+    
     def _init_menu(self):
         """메뉴 바 초기화"""
         self.menu_bar = tk.Menu(self)
         
-        # 파일 메뉴
-        file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        file_menu.add_command(label="새 리포지토리", command=self._placeholder)
-        file_menu.add_separator()
-        file_menu.add_command(label="종료", command=self.quit)
-        self.menu_bar.add_cascade(label="파일", menu=file_menu)
-        
-        # 보기 메뉴
-        view_menu = tk.Menu(self.menu_bar, tearoff=0)
-        view_menu.add_command(label="리포지토리 목록 새로고침", command=self._placeholder)
-        self.menu_bar.add_cascade(label="보기", menu=view_menu)
-        
-        # 도움말 메뉴
-        help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        help_menu.add_command(label="정보", command=self._show_about)
-        self.menu_bar.add_cascade(label="도움말", menu=help_menu)
+        for label, items in self._MENU_SPEC:
+            self.menu_bar.add_cascade(label=label, menu=self._build_menu(self.menu_bar, items))
         
         self.config(menu=self.menu_bar)
         logger.debug("메뉴 바가 초기화되었습니다.")
     
+    def _build_menu(self, parent, items):
+        """
+        메뉴 항목 정의로 메뉴를 생성
+        
+        Args:
+            parent: 부모 위젯
+            items: (항목 이름, 콜백 메서드 이름) 또는 None(구분선)의 목록
+        
+        Returns:
+            tk.Menu: 생성된 메뉴
+        """
+        menu = tk.Menu(parent, tearoff=0)
+        for item in items:
+            if item is None:
+                menu.add_separator()
+            else:
+                label, handler_name = item
+                menu.add_command(label=label, command=getattr(self, handler_name))
+        return menu
+    
     def _init_main_layout(self):
         """중앙 분할 영역 및 패널 초기화"""
         # 메인 프레임
@@ -126,7 +167,7 @@ class MainWindow(tk.Tk):
         """좌측 패널: 리포지토리 목록 영역 초기화"""
         # 검색 및 새로고침 영역
         control_frame = ttk.Frame(self.left_panel)
-        control_frame.pack(fill=tk.X, padx=5, pady=5)
+        control_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
         
         ttk.Label(control_frame, text="검색:").pack(side=tk.LEFT, padx=(0, 5))
         search_entry = ttk.Entry(control_frame)
@@ -136,25 +177,25 @@ class MainWindow(tk.Tk):
         refresh_button.pack(side=tk.RIGHT, padx=5)
         
         # 리포지토리 목록 트리뷰
-        columns = ("name", "description", "private")
-        self.repo_tree = ttk.Treeview(self.left_panel, columns=columns, show="headings")
+        columns = tuple(column[0] for column in self._COLUMNS)
+        self.repo_tree = ttk.Treeview(
+            self.left_panel, columns=columns, show="headings", selectmode="browse"
+        )
         
         # 컬럼 설정
-        self.repo_tree.heading("name", text="이름")
-        self.repo_tree.heading("description", text="설명")
-        self.repo_tree.heading("private", text="비공개")
-        
-        self.repo_tree.column("name", width=150, anchor=tk.W)
-        self.repo_tree.column("description", width=250, anchor=tk.W)
-        self.repo_tree.column("private", width=60, anchor=tk.CENTER)
+        for column, title, width, anchor in self._COLUMNS:
+            self.repo_tree.heading(column, text=title)
+            self.repo_tree.column(column, width=width, anchor=anchor)
         
         # 스크롤바
         scrollbar = ttk.Scrollbar(self.left_panel, orient=tk.VERTICAL, command=self.repo_tree.yview)
         self.repo_tree.configure(yscrollcommand=scrollbar.set)
         
-        # 위젯 배치
-        self.repo_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 5), pady=5)
+        # 위젯 배치 (grid: 트리뷰 영역만 창 크기에 맞춰 늘어남)
+        self.left_panel.rowconfigure(1, weight=1)
+        self.left_panel.columnconfigure(0, weight=1)
+        self.repo_tree.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 5), pady=5)
         
         logger.debug("좌측 패널이 초기화되었습니다.")
     
@@ -184,12 +225,56 @@ class MainWindow(tk.Tk):
         self.cicd_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.cicd_tab, text="CI/CD")
         
-        # 간단한 정보 메시지 추가 (실제 구현 전 임시)
-        for tab in [self.info_tab, self.branches_tab, self.commits_tab, self.pr_tab, self.cicd_tab]:
-            ttk.Label(tab, text="이 탭의 콘텐츠는 추후 구현될 예정입니다.").pack(pady=20)
+        # 탭 내용은 처음 선택될 때 생성
+        self._tab_builders = {
+            str(self.info_tab): self._build_info_tab,
+            str(self.branches_tab): self._build_branches_tab,
+            str(self.commits_tab): self._build_commits_tab,
+            str(self.pr_tab): self._build_pr_tab,
+            str(self.cicd_tab): self._build_cicd_tab,
+        }
+        self._tabs_built = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed(None)  # 처음 선택된 탭은 바로 생성
         
         logger.debug("우측 패널이 초기화되었습니다.")
     
+    def _on_tab_changed(self, event):
+        """탭 선택 이벤트 핸들러 (처음 선택된 탭의 내용 생성)"""
+        tab_id = self.notebook.select()
+        if tab_id in self._tabs_built:
+            return
+        
+        builder = self._tab_builders.get(tab_id)
+        if builder is not None:
+            self._tabs_built.add(tab_id)
+            builder()
+            logger.debug(f"탭 내용이 생성되었습니다: {tab_id}")
+    
+    def _build_placeholder_tab(self, tab):
+        """간단한 정보 메시지 추가 (실제 구현 전 임시)"""
+        ttk.Label(tab, text=_PLACEHOLDER_TEXT).pack(pady=20)
+    
+    def _build_info_tab(self):
+        """정보 탭 내용 생성"""
+        self._build_placeholder_tab(self.info_tab)
+    
+    def _build_branches_tab(self):
+        """브랜치 탭 내용 생성"""
+        self._build_placeholder_tab(self.branches_tab)
+    
+    def _build_commits_tab(self):
+        """커밋 탭 내용 생성"""
+        self._build_placeholder_tab(self.commits_tab)
+    
+    def _build_pr_tab(self):
+        """Pull Requests 탭 내용 생성"""
+        self._build_placeholder_tab(self.pr_tab)
+    
+    def _build_cicd_tab(self):
+        """CI/CD 탭 내용 생성"""
+        self._build_placeholder_tab(self.cicd_tab)
+    
     def _init_status_bar(self):
         """하단 상태 표시줄 영역 초기화"""
         self.status_bar = ttk.Frame(self)
@@ -198,26 +283,62 @@ class MainWindow(tk.Tk):
         self.status_label = ttk.Label(self.status_bar, text="준비")
         self.status_label.pack(side=tk.LEFT)
         
-        self.progress_bar = ttk.Progressbar(
-            self.status_bar, mode="indeterminate", length=100
-        )
-        # 기본적으로 진행 표시줄은 숨김
-        # 필요할 때만 표시됨
+        # 진행 표시줄은 처음 필요할 때 생성하고, 표시 중일 때만 애니메이션 실행
+        self.progress_bar = None
+        self._progress_visible = False
         
         logger.debug("상태 표시줄이 초기화되었습니다.")
     
     def status_message(self, message, show_progress=False):
-        """상태 메시지 표시"""
+        """
+        상태 메시지 표시
+        
+        연달아 호출되면 마지막 메시지만 유휴 시점에 한 번 반영합니다.
+        """
+        self._pending_status = (message, show_progress)
+        if not self._status_dirty:
+            self._status_dirty = True
+            self.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """대기 중인 상태 메시지를 상태 표시줄에 반영"""
+        self._status_dirty = False
+        message, show_progress = self._pending_status
+        
         self.status_label.config(text=message)
         
+        # 표시 여부가 바뀔 때만 배치와 애니메이션 타이머를 변경
+        if show_progress == self._progress_visible:
+            return
+        
         if show_progress:
-            self.progress_bar.start(10)
+            if self.progress_bar is None:
+                self.progress_bar = ttk.Progressbar(
+                    self.status_bar, mode="indeterminate", length=100
+                )
             self.progress_bar.pack(side=tk.RIGHT)
+            self.progress_bar.start(50)
         else:
             self.progress_bar.stop()
             self.progress_bar.pack_forget()
-        
-        self.update_idletasks()
+        self._progress_visible = show_progress
+    
+    def submit(self, task_func, on_done, on_error=None):
+        """
+        GitHub 통신 등 오래 걸리는 작업을 백그라운드 스레드에서 실행
+        
+        작업 결과는 메인 스레드에서 on_done(또는 예외 시 on_error)으로 전달되므로
+        콜백 안에서 위젯을 직접 변경해도 됩니다.
+        
+        Args:
+            task_func (Callable): 백그라운드에서 실행할 함수
+            on_done (Callable): 작업 결과를 받을 콜백
+            on_error (Callable, optional): 작업 중 발생한 예외를 받을 콜백
+        
+        Returns:
+            str: 작업 ID
+        """
+        return async_handler.submit_task(task_func, on_done, on_error)
     
     def _placeholder(self):
         """임시 함수 (실제 기능이 구현되기 전까지 사용)"""
@@ -234,16 +355,17 @@ class MainWindow(tk.Tk):
     
     def on_close(self):
         """애플리케이션 종료 이벤트 핸들러"""
+        if self.progress_bar is not None:
+            self.progress_bar.stop()
+        async_handler.stop()
+        github_client.close()
         self.destroy()
 
 
 def main():
     """애플리케이션 진입점"""
-    # 로깅 설정
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    # 로깅 설정 (utils.logger의 핸들러 구성을 단일 설정 지점으로 사용)
+    init_logging()
     
     # 애플리케이션 실행
     app = MainWindow()
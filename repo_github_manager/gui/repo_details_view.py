@@ -3,18 +3,26 @@
 우측 패널에 표시되는, 선택된 리포지토리의 상세 정보를 관리합니다.
 """
 import os
+import functools
+import subprocess
+import sys
+import threading
+import time
 import tkinter as tk
+from contextlib import contextmanager
 from tkinter import ttk, messagebox, scrolledtext
 import webbrowser
-from typing import Dict, Any, List, Optional, Tuple, Callable
+from typing import Dict, Any, List, Optional, Set, Tuple, Union, Callable
 
 from utils.logger import setup_logger
 from utils.config_manager import get_clone_base_path
+from utils.api_cache import api_cache
 from core.github_client import github_client
 from core.git_utils import clone_repository, update_repo_remote, rename_local_repo_folder
-from core.git_utils import get_branches, get_current_branch, checkout_branch
+from core.git_utils import get_repo_state, invalidate_repo_state, checkout_branch
 from core.ci_cd import run_ci_cd_pipeline
 from gui.async_handler import async_handler
+from gui.repo_list_view import TREE_RENDER_CHUNK, TREE_RENDER_THRESHOLD
 from gui.dialogs import (
     show_input_dialog, show_confirm_dialog, show_progress_dialog, show_directory_dialog
 )
@@ -22,6 +30,192 @@ from gui.dialogs import (
 # 로거 설정
 logger = setup_logger(__name__)
 
+# 여러 행을 Tcl 호출 한 번으로 트리뷰에 추가하는 apply 람다 (트리뷰 경로, 행 값 목록의 목록)
+_TREE_INSERT_ROWS_LAMBDA = "{tree rows} {foreach row $rows {$tree insert {} end -values $row}}"
+
+# 이 크기(문자 수) 이상의 README는 나누어 삽입하여 이벤트 루프가 멈추지 않도록 함
+README_CHUNK_THRESHOLD = 16 * 1024
+
+# README를 나누어 삽입할 때 한 번에 삽입할 크기 (문자 수)
+README_CHUNK_SIZE = 8 * 1024
+
+# 작업자 스레드에서 받은 텍스트(CI/CD 로그, README)를 모아서 화면에 반영하는 주기 (밀리초, 약 20Hz)
+TEXT_STREAM_FLUSH_MS = 50
+
+# 탭 전환 후 자동 새로고침을 시작하기까지 기다리는 시간 (밀리초)
+TAB_AUTOLOAD_DELAY_MS = 150
+
+# 커밋/PR 목록을 한 번에 불러오는 개수
+LIST_PAGE_SIZE = 25
+
+# 리포지토리 선택 시 미리 불러온 커밋/PR 첫 페이지를 재사용하는 시간 (초)
+PREFETCH_TTL_SECONDS = 60
+
+
+@contextmanager
+def _editable(widget: tk.Text):
+    """
+    읽기 전용 텍스트 위젯을 잠시 편집 가능 상태로 전환
+    
+    블록 안의 여러 편집을 상태 전환 한 쌍으로 묶습니다.
+    
+    Args:
+        widget (tk.Text): 대상 텍스트 위젯
+    """
+    widget.config(state=tk.NORMAL)
+    try:
+        yield widget
+    finally:
+        widget.config(state=tk.DISABLED)
+
+
+class _TextStream:
+    """작업자 스레드에서 받은 텍스트를 모아 메인 스레드에서 주기적으로 텍스트 위젯 끝에 추가"""
+    
+    def __init__(self, widget: tk.Text, follow: bool = False):
+        """
+        텍스트 스트림 초기화
+        
+        Args:
+            widget (tk.Text): 읽기 전용 텍스트 위젯
+            follow (bool, optional): 추가할 때마다 맨 아래로 스크롤할지 여부
+        """
+        self.widget = widget
+        self.follow = follow
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._after_id = None
+        self._replace = False
+    
+    def put(self, text: str) -> None:
+        """
+        텍스트를 버퍼에 추가 (어느 스레드에서나 호출 가능)
+        
+        Args:
+            text (str): 추가할 텍스트
+        """
+        with self._lock:
+            self._buffer.append(text)
+    
+    def start(self, replace: bool = False) -> None:
+        """
+        주기적인 반영을 시작 (메인 스레드)
+        
+        Args:
+            replace (bool, optional): 처음 반영할 때 기존 내용을 지울지 여부
+        """
+        self.cancel()
+        self._replace = replace
+        self._schedule()
+    
+    def stop(self) -> None:
+        """주기적인 반영을 멈추고 남은 텍스트를 반영 (메인 스레드)"""
+        self._cancel_timer()
+        self.flush()
+    
+    def cancel(self) -> None:
+        """주기적인 반영을 멈추고 남은 텍스트를 버림 (메인 스레드)"""
+        self._cancel_timer()
+        self._replace = False
+        with self._lock:
+            self._buffer.clear()
+    
+    def flush(self) -> None:
+        """버퍼에 쌓인 텍스트를 한 번의 삽입으로 반영"""
+        with self._lock:
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer.clear()
+        
+        self.append(text)
+    
+    def append(self, text: str) -> None:
+        """
+        텍스트를 위젯 끝에 바로 추가 (메인 스레드)
+        
+        Args:
+            text (str): 추가할 텍스트
+        """
+        with _editable(self.widget):
+            if self._replace:
+                self.widget.delete(1.0, tk.END)
+                self._replace = False
+            self.widget.insert(tk.END, text)
+            if self.follow:
+                self.widget.see(tk.END)  # 스크롤을 항상 맨 아래로
+    
+    def _schedule(self) -> None:
+        """다음 반영을 예약"""
+        self._after_id = self.widget.after(TEXT_STREAM_FLUSH_MS, self._on_timer)
+    
+    def _on_timer(self) -> None:
+        """버퍼에 쌓인 텍스트를 반영하고 다음 반영을 예약"""
+        self.flush()
+        self._schedule()
+    
+    def _cancel_timer(self) -> None:
+        """예약된 반영을 취소"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+
+def _commit_rows(commits: List[Dict[str, Any]]) -> List[Tuple]:
+    """
+    커밋 목록을 커밋 트리뷰의 행 값으로 변환
+    
+    Args:
+        commits (List[Dict[str, Any]]): 커밋 목록 (GitHub REST API 응답 형식)
+    
+    Returns:
+        List[Tuple]: (SHA, 메시지 첫 줄, 작성자, 날짜) 행 목록
+    """
+    rows = []
+    for commit in commits:
+        commit_info = commit.get("commit", {})
+        author = commit_info.get("author", {})
+        rows.append((
+            commit.get("sha", "")[:7],
+            commit_info.get("message", "").split("\n", 1)[0],
+            author.get("name", ""),
+            author.get("date", "")[:10]
+        ))
+    return rows
+
+
+def _pr_rows(prs: List[Dict[str, Any]]) -> List[Tuple]:
+    """
+    PR 목록을 PR 트리뷰의 행 값으로 변환
+    
+    Args:
+        prs (List[Dict[str, Any]]): PR 목록 (GitHub REST API 응답 형식)
+    
+    Returns:
+        List[Tuple]: (번호, 제목, 상태, 작성자, 업데이트 날짜) 행 목록
+    """
+    return [
+        (
+            pr.get("number", ""),
+            pr.get("title", ""),
+            pr.get("state", ""),
+            pr.get("user", {}).get("login", ""),
+            pr.get("updated_at", "")[:10]
+        )
+        for pr in prs
+    ]
+
+
+def _show_rate_limit_wait(dialog, seconds: float) -> None:
+    """
+    요청 한도로 재시도를 기다리는 동안 진행 다이얼로그에 남은 시간을 표시
+    
+    Args:
+        dialog: 진행 다이얼로그
+        seconds (float): 다시 시도하기까지 남은 시간 (초)
+    """
+    dialog.update_message(f"요청 한도에 도달했습니다. {seconds:.0f}초 후 다시 시도합니다...")
+
 
 class RepoDetailsView(ttk.Frame):
     """리포지토리 상세 정보를 표시하는 뷰"""
@@ -39,8 +233,16 @@ class RepoDetailsView(ttk.Frame):
         
         self.app = app
         self.current_repo = None
+        
+        # 비동기 작업 콜백이 Tk 메인 스레드에서 실행되도록 설정
+        async_handler.set_tk_root(self.winfo_toplevel())
         self.local_repo_path = None
         
+        # 클론 기본 경로와 그 아래 디렉토리 이름 (리포지토리 선택마다 디스크를 조회하지 않도록 캐시)
+        self._base_path = ""
+        self._local_repo_names: Set[str] = set()
+        self.refresh_local_cache()
+        
         # 상세 정보 탭 영역 생성
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True)
@@ -58,17 +260,51 @@ class RepoDetailsView(ttk.Frame):
         self.notebook.add(self.pr_tab, text="풀 리퀘스트")
         self.notebook.add(self.cicd_tab, text="CI/CD")
         
-        # 탭 내용 초기화
+        # 상태를 함께 바꾸는 버튼 (리포지토리 선택 시 / 로컬 리포지토리가 있을 때 활성화)
+        self._repo_action_buttons: List[ttk.Button] = []
+        self._local_action_buttons: List[ttk.Button] = []
+        
+        # 탭 내용 초기화 (기본으로 보이는 정보 탭만 바로 생성하고 나머지는 처음 선택될 때 생성)
         self._init_info_tab()
-        self._init_branches_tab()
-        self._init_commits_tab()
-        self._init_pr_tab()
-        self._init_cicd_tab()
+        self._tab_init_funcs = {
+            1: self._init_branches_tab,
+            2: self._init_commits_tab,
+            3: self._init_pr_tab,
+            4: self._init_cicd_tab,
+        }
+        self._tabs_initialized = {0}
+        
+        # 탭 생성 시 반영할 로컬 브랜치 정보
+        self._branches: List[str] = []
+        self._current_branch: Optional[str] = None
+        
+        # 진행 중인 README 표시 작업 식별자 (리포지토리가 바뀌면 이전 삽입 중단)
+        self._readme_load_id = 0
+        
+        # 예약된 탭 자동 새로고침 (빠르게 탭을 넘길 때는 마지막 탭만 로드)
+        self._tab_change_after_id = None
+        
+        # 커밋/PR 목록의 조회 조건과 다음 페이지 번호 (None이면 더 불러올 항목 없음)
+        self._commit_query: Optional[Tuple[str, str]] = None
+        self._commit_next_page: Optional[int] = None
+        self._pr_query: Optional[Tuple[str, str]] = None
+        self._pr_next_page: Optional[int] = None
+        
+        # 커밋/PR 트리뷰별 전체 행과 실제로 추가된 행 수 (보이는 부분만 트리뷰에 추가)
+        self._tree_rows: Dict[str, List[Tuple]] = {}
+        self._tree_rendered: Dict[str, int] = {}
+        self._tree_render_pending: Set[str] = set()
+        
+        # 리포지토리 선택 시 미리 불러온 첫 페이지 (조회 조건, 불러온 시각, 행 목록)
+        self._prefetch: Dict[str, Optional[Tuple[Tuple[str, str], float, List[Tuple]]]] = {
+            "commits": None, "prs": None
+        }
         
         # 탭 변경 이벤트 바인딩
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
-        # 초기 상태 설정
+        # 초기 상태 설정 (이미 비어 있으면 clear()는 아무것도 하지 않음)
+        self._is_cleared = False
         self.clear()
     
     def _init_info_tab(self):
@@ -142,6 +378,11 @@ class RepoDetailsView(ttk.Frame):
         )
         self.delete_button.pack(side=tk.LEFT, padx=5)
         
+        self._repo_action_buttons.extend((
+            self.open_url_button, self.clone_button, self.rename_button, self.delete_button
+        ))
+        self._local_action_buttons.append(self.open_local_button)
+        
         # README 영역
         readme_frame = ttk.LabelFrame(self.info_frame, text="README")
         readme_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -149,6 +390,9 @@ class RepoDetailsView(ttk.Frame):
         self.readme_text = scrolledtext.ScrolledText(readme_frame, wrap=tk.WORD)
         self.readme_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.readme_text.config(state=tk.DISABLED)  # 읽기 전용
+        
+        # 내려받는 대로 README를 표시하는 스트림
+        self._readme_stream = _TextStream(self.readme_text)
     
     def _init_branches_tab(self):
         """브랜치 탭 초기화"""
@@ -194,6 +438,10 @@ class RepoDetailsView(ttk.Frame):
             new_branch_control_frame, text="생성", command=self._on_create_branch_clicked
         )
         self.create_branch_button.pack(side=tk.LEFT, padx=5)
+        
+        self._local_action_buttons.extend((
+            self.checkout_button, self.refresh_branches_button, self.create_branch_button
+        ))
     
     def _init_commits_tab(self):
         """커밋 탭 초기화"""
@@ -214,6 +462,7 @@ class RepoDetailsView(ttk.Frame):
             control_frame, text="커밋 불러오기", command=self._on_refresh_commits_clicked
         )
         self.refresh_commits_button.pack(side=tk.LEFT, padx=5)
+        self._local_action_buttons.append(self.refresh_commits_button)
         
         # 커밋 트리뷰
         commit_list_frame = ttk.Frame(commits_frame)
@@ -237,12 +486,18 @@ class RepoDetailsView(ttk.Frame):
         
         # 스크롤바
         scrollbar = ttk.Scrollbar(commit_list_frame, orient=tk.VERTICAL, command=self.commits_tree.yview)
-        self.commits_tree.configure(yscrollcommand=scrollbar.set)
+        self.commits_tree.configure(yscrollcommand=self._tree_yscroll_handler(self.commits_tree, scrollbar))
         
         # 위젯 배치
         self.commits_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # 다음 페이지 불러오기 버튼
+        self.more_commits_button = ttk.Button(
+            commits_frame, text="더 불러오기", command=self._on_more_commits_clicked, state=tk.DISABLED
+        )
+        self.more_commits_button.pack(anchor=tk.E, padx=5, pady=(0, 5))
+        
         # 이벤트 바인딩
         self.commits_tree.bind("<Double-1>", self._on_commit_double_clicked)
     
@@ -268,6 +523,7 @@ class RepoDetailsView(ttk.Frame):
             control_frame, text="PR 불러오기", command=self._on_refresh_pr_clicked
         )
         self.refresh_pr_button.pack(side=tk.LEFT, padx=5)
+        self._repo_action_buttons.append(self.refresh_pr_button)
         
         # PR 트리뷰
         pr_list_frame = ttk.Frame(pr_frame)
@@ -293,12 +549,18 @@ class RepoDetailsView(ttk.Frame):
         
         # 스크롤바
         scrollbar = ttk.Scrollbar(pr_list_frame, orient=tk.VERTICAL, command=self.pr_tree.yview)
-        self.pr_tree.configure(yscrollcommand=scrollbar.set)
+        self.pr_tree.configure(yscrollcommand=self._tree_yscroll_handler(self.pr_tree, scrollbar))
         
         # 위젯 배치
         self.pr_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # 다음 페이지 불러오기 버튼
+        self.more_pr_button = ttk.Button(
+            pr_frame, text="더 불러오기", command=self._on_more_pr_clicked, state=tk.DISABLED
+        )
+        self.more_pr_button.pack(anchor=tk.E, padx=5, pady=(0, 5))
+        
         # 이벤트 바인딩
         self.pr_tree.bind("<Double-1>", self._on_pr_double_clicked)
     
@@ -316,6 +578,7 @@ class RepoDetailsView(ttk.Frame):
             control_frame, text="CI/CD 파이프라인 실행", command=self._on_run_cicd_clicked
         )
         self.run_cicd_button.pack(side=tk.LEFT, padx=5)
+        self._local_action_buttons.append(self.run_cicd_button)
         
         # 로그 영역
         log_frame = ttk.LabelFrame(cicd_frame, text="로그")
@@ -324,11 +587,20 @@ class RepoDetailsView(ttk.Frame):
         self.cicd_log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD)
         self.cicd_log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.cicd_log_text.config(state=tk.DISABLED)  # 읽기 전용
+        
+        # 작업자 스레드에서 받은 로그를 모아 주기적으로 한 번에 반영하는 스트림
+        self._cicd_stream = _TextStream(self.cicd_log_text, follow=True)
     
     def clear(self):
         """상세 뷰 초기화 (리포지토리 선택 해제 시)"""
+        if self._is_cleared:
+            return
+        self._is_cleared = True
+        
         self.current_repo = None
         self.local_repo_path = None
+        self._readme_load_id += 1  # 진행 중인 README 표시 중단
+        self._readme_stream.cancel()
         
         # 정보 탭 초기화
         self.name_label.config(text="")
@@ -337,42 +609,68 @@ class RepoDetailsView(ttk.Frame):
         self.url_label.config(text="")
         self.local_path_label.config(text="")
         
-        self.readme_text.config(state=tk.NORMAL)
-        self.readme_text.delete(1.0, tk.END)
-        self.readme_text.config(state=tk.DISABLED)
+        with _editable(self.readme_text):
+            self.readme_text.delete(1.0, tk.END)
+        
+        self._branches = []
+        self._current_branch = None
+        
+        self._commit_query = None
+        self._commit_next_page = None
+        self._pr_query = None
+        self._pr_next_page = None
+        self._prefetch = {"commits": None, "prs": None}
         
         # 브랜치 탭 초기화
-        self.branch_combobox.set("")
-        self.branch_combobox["values"] = []
-        self.new_branch_entry.delete(0, tk.END)
+        if 1 in self._tabs_initialized:
+            self.branch_combobox.set("")
+            self.new_branch_entry.delete(0, tk.END)
         
         # 커밋 탭 초기화
-        self.commit_branch_combobox.set("")
-        self.commit_branch_combobox["values"] = []
-        for item in self.commits_tree.get_children():
-            self.commits_tree.delete(item)
+        if 2 in self._tabs_initialized:
+            self.commit_branch_combobox.set("")
+            self._clear_tree(self.commits_tree)
+            self.more_commits_button.config(state=tk.DISABLED)
         
         # PR 탭 초기화
-        for item in self.pr_tree.get_children():
-            self.pr_tree.delete(item)
+        if 3 in self._tabs_initialized:
+            self._clear_tree(self.pr_tree)
+            self.more_pr_button.config(state=tk.DISABLED)
         
         # CI/CD 탭 초기화
-        self.cicd_log_text.config(state=tk.NORMAL)
-        self.cicd_log_text.delete(1.0, tk.END)
-        self.cicd_log_text.config(state=tk.DISABLED)
+        if 4 in self._tabs_initialized:
+            with _editable(self.cicd_log_text):
+                self.cicd_log_text.delete(1.0, tk.END)
         
         # 버튼 비활성화
-        self.clone_button.config(state=tk.DISABLED)
-        self.rename_button.config(state=tk.DISABLED)
-        self.delete_button.config(state=tk.DISABLED)
-        self.open_url_button.config(state=tk.DISABLED)
-        self.open_local_button.config(state=tk.DISABLED)
-        self.checkout_button.config(state=tk.DISABLED)
-        self.refresh_branches_button.config(state=tk.DISABLED)
-        self.create_branch_button.config(state=tk.DISABLED)
-        self.refresh_commits_button.config(state=tk.DISABLED)
-        self.refresh_pr_button.config(state=tk.DISABLED)
-        self.run_cicd_button.config(state=tk.DISABLED)
+        self._apply_repo_state()
+        self._apply_branches()
+    
+    def _apply_repo_state(self):
+        """현재 리포지토리/로컬 경로 상태에 맞게 생성된 탭의 버튼 상태를 한 번에 갱신"""
+        local_state = tk.NORMAL if self.local_repo_path else tk.DISABLED
+        repo_state = tk.NORMAL if self.current_repo else tk.DISABLED
+        
+        # 리포지토리가 선택되었을 때 활성화
+        for button in self._repo_action_buttons:
+            button.config(state=repo_state)
+        
+        # 로컬 리포지토리 있을 때만 활성화
+        for button in self._local_action_buttons:
+            button.config(state=local_state)
+    
+    def _apply_branches(self):
+        """로드된 브랜치 목록을 생성된 탭의 브랜치 콤보박스에 반영"""
+        comboboxes = []
+        if 1 in self._tabs_initialized:
+            comboboxes.append(self.branch_combobox)
+        if 2 in self._tabs_initialized:
+            comboboxes.append(self.commit_branch_combobox)
+        
+        for combobox in comboboxes:
+            combobox["values"] = self._branches
+            if self._current_branch:
+                combobox.set(self._current_branch)
     
     def show_repository(self, repo_data: Dict[str, Any]):
         """
@@ -382,6 +680,7 @@ class RepoDetailsView(ttk.Frame):
             repo_data (Dict[str, Any]): 리포지토리 정보
         """
         self.current_repo = repo_data
+        self._is_cleared = False
         self.notebook.select(0)  # 정보 탭으로 이동
         
         # 기본 정보 표시
@@ -390,104 +689,162 @@ class RepoDetailsView(ttk.Frame):
         self.private_label.config(text="예" if repo_data.get("private", False) else "아니오")
         self.url_label.config(text=repo_data.get("html_url", ""))
         
-        # 로컬 경로 확인
-        base_path = get_clone_base_path()
+        # 로컬 경로 확인 (캐시된 디렉토리 목록 사용)
         repo_name = repo_data.get("name", "")
-        potential_path = os.path.join(base_path, repo_name)
         
-        if os.path.exists(potential_path) and os.path.isdir(potential_path):
+        if repo_name and repo_name in self._local_repo_names:
+            potential_path = os.path.join(self._base_path, repo_name)
             self.local_repo_path = potential_path
             self.local_path_label.config(text=potential_path)
-            self.open_local_button.config(state=tk.NORMAL)
-            
-            # 로컬 리포지토리 있을 때만 활성화
-            self.checkout_button.config(state=tk.NORMAL)
-            self.refresh_branches_button.config(state=tk.NORMAL)
-            self.create_branch_button.config(state=tk.NORMAL)
-            self.refresh_commits_button.config(state=tk.NORMAL)
-            self.run_cicd_button.config(state=tk.NORMAL)
             
             # 브랜치 정보 로드
             self._load_local_branches()
         else:
             self.local_repo_path = None
             self.local_path_label.config(text="로컬에 없음")
-            self.open_local_button.config(state=tk.DISABLED)
         
         # 버튼 활성화
-        self.clone_button.config(state=tk.NORMAL)
-        self.rename_button.config(state=tk.NORMAL)
-        self.delete_button.config(state=tk.NORMAL)
-        self.open_url_button.config(state=tk.NORMAL)
-        self.refresh_pr_button.config(state=tk.NORMAL)
+        self._apply_repo_state()
         
         # README 로드
         self._load_readme()
+        
+        # 이전 리포지토리의 커밋/PR 목록을 비우고 첫 페이지를 미리 불러와 탭 전환 시 바로 표시
+        self._commit_query = self._pr_query = None
+        self._commit_next_page = self._pr_next_page = None
+        if 2 in self._tabs_initialized:
+            self._clear_tree(self.commits_tree)
+            self.more_commits_button.config(state=tk.DISABLED)
+        if 3 in self._tabs_initialized:
+            self._clear_tree(self.pr_tree)
+            self.more_pr_button.config(state=tk.DISABLED)
+        self._prefetch_lists(repo_data)
     
     def _load_readme(self):
         """README 내용 로드 (비동기)"""
-        self.readme_text.config(state=tk.NORMAL)
-        self.readme_text.delete(1.0, tk.END)
-        self.readme_text.insert(tk.END, "README 로드 중...")
-        self.readme_text.config(state=tk.DISABLED)
+        self._readme_load_id += 1
+        load_id = self._readme_load_id
+        self._readme_stream.cancel()
+        
+        with _editable(self.readme_text):
+            self.readme_text.delete(1.0, tk.END)
+            self.readme_text.insert(tk.END, "README 로드 중...")
+        
+        if not self.current_repo:
+            self._show_readme(load_id, (False, "리포지토리가 선택되지 않았습니다."))
+            return
+        repo_name = self.current_repo["full_name"]
+        
+        # 같은 리포지토리를 다시 선택하면 캐시된 README 사용
+        cached = api_cache.get((repo_name, "readme"))
+        if cached is not None:
+            self._show_readme(load_id, cached)
+            return
+        
+        def on_chunk(text):
+            # 작업자 스레드에서 호출됨 (다른 리포지토리가 선택되었으면 버림)
+            if load_id == self._readme_load_id:
+                self._readme_stream.put(text)
         
         def load_task():
-            if not self.current_repo:
-                return False, "리포지토리가 선택되지 않았습니다."
-            return github_client.get_readme(self.current_repo["full_name"])
+            return github_client.stream_readme(repo_name, on_chunk)
         
         def on_success(result):
+            if load_id != self._readme_load_id:
+                return  # 다른 리포지토리가 선택됨
+            
+            # 남은 조각을 반영 (내용은 조각으로 모두 표시되었으므로 없거나 실패한 경우만 다시 표시)
+            self._readme_stream.stop()
             success, data = result
-            self.readme_text.config(state=tk.NORMAL)
+            if success:
+                api_cache.set((repo_name, "readme"), result)  # 실패 결과는 저장하지 않음
+            if not (success and data):
+                self._show_readme(load_id, result)
+        
+        def on_error(error):
+            if load_id != self._readme_load_id:
+                return
+            
+            self._readme_stream.cancel()
+            with _editable(self.readme_text):
+                self.readme_text.delete(1.0, tk.END)
+                self.readme_text.insert(tk.END, f"README 로드 중 오류 발생: {str(error)}")
+        
+        # 첫 조각이 도착하면 "로드 중" 문구를 지우고 내려받는 대로 표시
+        self._readme_stream.start(replace=True)
+        async_handler.submit_task(load_task, on_success, on_error)
+    
+    def _show_readme(self, load_id: int, result: Tuple[bool, Optional[str]]):
+        """
+        가져온 README 결과를 한 번에 표시 (큰 README는 나누어 삽입)
+        
+        Args:
+            load_id (int): README 표시 작업 식별자
+            result (Tuple[bool, Optional[str]]): (성공 여부, README 내용 또는 오류 메시지)
+        """
+        if load_id != self._readme_load_id:
+            return  # 다른 리포지토리가 선택됨
+        
+        success, data = result
+        chunked = bool(success and data and len(data) >= README_CHUNK_THRESHOLD)
+        
+        with _editable(self.readme_text):
             self.readme_text.delete(1.0, tk.END)
             
-            if success and data:
+            if chunked:
+                # 큰 README는 줄바꿈 계산을 끈 채 나누어 삽입
+                self.readme_text.config(wrap=tk.NONE)
+            elif success and data:
                 self.readme_text.insert(tk.END, data)
             elif success and data is None:
                 self.readme_text.insert(tk.END, "README 파일이 없습니다.")
             else:
                 self.readme_text.insert(tk.END, f"README 로드 실패: {data}")
-            
-            self.readme_text.config(state=tk.DISABLED)
         
-        def on_error(error):
-            self.readme_text.config(state=tk.NORMAL)
-            self.readme_text.delete(1.0, tk.END)
-            self.readme_text.insert(tk.END, f"README 로드 중 오류 발생: {str(error)}")
-            self.readme_text.config(state=tk.DISABLED)
+        if chunked:
+            self._insert_readme_chunk(load_id, data, 0)
+    
+    def _insert_readme_chunk(self, load_id: int, data: str, offset: int):
+        """
+        README의 한 조각을 삽입하고 다음 조각을 유휴 시점에 예약
         
-        async_handler.submit_task(load_task, on_success, on_error)
+        Args:
+            load_id (int): README 표시 작업 식별자
+            data (str): README 전체 내용
+            offset (int): 이번에 삽입할 위치
+        """
+        if load_id != self._readme_load_id:
+            # 다른 리포지토리가 선택되어 중단 (줄바꿈 설정은 복원)
+            self.readme_text.config(wrap=tk.WORD)
+            return
+        
+        end = offset + README_CHUNK_SIZE
+        with _editable(self.readme_text):
+            self.readme_text.insert(tk.END, data[offset:end])
+        
+        if end < len(data):
+            self.after_idle(self._insert_readme_chunk, load_id, data, end)
+        else:
+            self.readme_text.config(wrap=tk.WORD)
     
     def _load_local_branches(self):
         """로컬 브랜치 정보 로드 (비동기)"""
         if not self.local_repo_path:
             return
         
+        local_repo_path = self.local_repo_path
+        
         def load_task():
-            # 브랜치 목록 가져오기
-            success, branches = get_branches(self.local_repo_path)
-            if not success:
-                return False, branches
-            
-            # 현재 브랜치 가져오기
-            success, current_branch = get_current_branch(self.local_repo_path)
-            if not success:
-                current_branch = None
-            
-            return True, (branches, current_branch)
+            # 브랜치 목록과 현재 브랜치를 Git 명령어 한 번으로 가져오기
+            return get_repo_state(local_repo_path)
         
         def on_success(result):
             success, data = result
             if success:
-                branches, current_branch = data
+                self._branches, self._current_branch = data
                 
                 # 브랜치 콤보박스 업데이트
-                self.branch_combobox["values"] = branches
-                self.commit_branch_combobox["values"] = branches
-                
-                if current_branch:
-                    self.branch_combobox.set(current_branch)
-                    self.commit_branch_combobox.set(current_branch)
+                self._apply_branches()
         
         def on_error(error):
             messagebox.showerror("오류", f"브랜치 정보 로드 중 오류 발생: {str(error)}")
@@ -498,12 +855,29 @@ class RepoDetailsView(ttk.Frame):
         """탭 변경 이벤트 핸들러"""
         selected_tab = self.notebook.index("current")
         
+        # 처음 선택된 탭의 내용 생성 후 현재 상태 반영
+        if selected_tab not in self._tabs_initialized:
+            self._tab_init_funcs[selected_tab]()
+            self._tabs_initialized.add(selected_tab)
+            self._apply_repo_state()
+            self._apply_branches()
+        
+        # 자동 새로고침은 탭 전환이 멈춘 뒤 한 번만 실행
+        if self._tab_change_after_id is not None:
+            self.after_cancel(self._tab_change_after_id)
+        self._tab_change_after_id = self.after(TAB_AUTOLOAD_DELAY_MS, self._do_tab_autoload)
+    
+    def _do_tab_autoload(self):
+        """현재 탭에 표시할 내용이 없으면 자동으로 새로고침"""
+        self._tab_change_after_id = None
+        selected_tab = self.notebook.index("current")
+        
         # 커밋 탭으로 이동 시 자동 새로고침
-        if selected_tab == 2 and self.local_repo_path and not self.commits_tree.get_children():
+        if selected_tab == 2 and self.local_repo_path and not self._tree_rows.get(str(self.commits_tree)):
             self._on_refresh_commits_clicked()
         
         # PR 탭으로 이동 시 자동 새로고침
-        if selected_tab == 3 and self.current_repo and not self.pr_tree.get_children():
+        if selected_tab == 3 and self.current_repo and not self._tree_rows.get(str(self.pr_tree)):
             self._on_refresh_pr_clicked()
     
     def _on_open_url_clicked(self):
@@ -518,11 +892,11 @@ class RepoDetailsView(ttk.Frame):
             if os.name == 'nt':  # Windows
                 os.startfile(self.local_repo_path)
             elif os.name == 'posix':  # macOS, Linux
-                import subprocess
+                # 파일 탐색기 종료를 기다리지 않도록 실행만 함
                 if sys.platform == 'darwin':  # macOS
-                    subprocess.run(['open', self.local_repo_path])
+                    subprocess.Popen(['open', self.local_repo_path])
                 else:  # Linux
-                    subprocess.run(['xdg-open', self.local_repo_path])
+                    subprocess.Popen(['xdg-open', self.local_repo_path])
     
     def _on_checkout_clicked(self):
         """브랜치 체크아웃 버튼 클릭 이벤트 핸들러"""
@@ -535,29 +909,57 @@ class RepoDetailsView(ttk.Frame):
             messagebox.showerror("오류", "브랜치를 선택하세요.")
             return
         
-        def task_func(dialog):
-            dialog.update_message(f"브랜치 '{branch}'로 체크아웃 중...")
-            success, result = checkout_branch(self.local_repo_path, branch)
-            return success, result
-        
-        def success_callback(result):
-            success, message = result
-            if success:
-                messagebox.showinfo("성공", f"브랜치 '{branch}'로 체크아웃되었습니다.")
-                self._load_local_branches()  # 브랜치 정보 새로고침
-            else:
-                messagebox.showerror("오류", f"브랜치 체크아웃 실패: {message}")
-        
-        def error_callback(error):
-            messagebox.showerror("오류", f"브랜치 체크아웃 중 오류 발생: {error}")
-        
         show_progress_dialog(
             self, "브랜치 체크아웃", f"브랜치 '{branch}'로 체크아웃 중...",
-            task_func, success_callback, error_callback
+            functools.partial(self._checkout_task, branch=branch),
+            functools.partial(self._on_checkout_done, branch),
+            self._on_checkout_error
         )
     
+    def _checkout_task(self, dialog, branch: str) -> Tuple[bool, str]:
+        """
+        브랜치 체크아웃 작업 (작업자 스레드)
+        
+        Args:
+            dialog: 진행 대화상자
+            branch (str): 체크아웃할 브랜치
+        
+        Returns:
+            Tuple[bool, str]: (성공 여부, 결과 메시지)
+        """
+        dialog.update_message(f"브랜치 '{branch}'로 체크아웃 중...")
+        return checkout_branch(self.local_repo_path, branch)
+    
+    def _on_checkout_done(self, branch: str, result: Tuple[bool, str]):
+        """
+        브랜치 체크아웃 완료 콜백
+        
+        Args:
+            branch (str): 체크아웃한 브랜치
+            result (Tuple[bool, str]): (성공 여부, 결과 메시지)
+        """
+        success, message = result
+        if success:
+            messagebox.showinfo("성공", f"브랜치 '{branch}'로 체크아웃되었습니다.")
+            
+            # 목록에 있던 브랜치면 git을 다시 실행하지 않고 현재 브랜치만 갱신
+            if branch in self._branches:
+                self._current_branch = branch
+                self._apply_branches()
+            else:
+                self._load_local_branches()  # 브랜치 정보 새로고침
+        else:
+            messagebox.showerror("오류", f"브랜치 체크아웃 실패: {message}")
+    
+    def _on_checkout_error(self, error):
+        """브랜치 체크아웃 오류 콜백"""
+        messagebox.showerror("오류", f"브랜치 체크아웃 중 오류 발생: {error}")
+    
     def _on_refresh_branches_clicked(self):
         """브랜치 새로고침 버튼 클릭 이벤트 핸들러"""
+        # 직접 새로고침할 때는 캐시된 브랜치 상태를 쓰지 않음
+        if self.local_repo_path:
+            invalidate_repo_state(self.local_repo_path)
         self._load_local_branches()
     
     def _on_create_branch_clicked(self):
@@ -571,28 +973,52 @@ class RepoDetailsView(ttk.Frame):
             messagebox.showerror("오류", "브랜치 이름을 입력하세요.")
             return
         
-        def task_func(dialog):
-            dialog.update_message(f"브랜치 '{branch_name}' 생성 중...")
-            success, result = checkout_branch(self.local_repo_path, branch_name, create=True)
-            return success, result
-        
-        def success_callback(result):
-            success, message = result
-            if success:
-                self.new_branch_entry.delete(0, tk.END)
-                messagebox.showinfo("성공", f"브랜치 '{branch_name}'이(가) 생성되었습니다.")
-                self._load_local_branches()  # 브랜치 정보 새로고침
-            else:
-                messagebox.showerror("오류", f"브랜치 생성 실패: {message}")
-        
-        def error_callback(error):
-            messagebox.showerror("오류", f"브랜치 생성 중 오류 발생: {error}")
-        
         show_progress_dialog(
             self, "브랜치 생성", f"브랜치 '{branch_name}' 생성 중...",
-            task_func, success_callback, error_callback
+            functools.partial(self._create_branch_task, branch_name=branch_name),
+            functools.partial(self._on_create_branch_done, branch_name),
+            self._on_create_branch_error
         )
     
+    def _create_branch_task(self, dialog, branch_name: str) -> Tuple[bool, str]:
+        """
+        새 브랜치 생성 작업 (작업자 스레드)
+        
+        Args:
+            dialog: 진행 대화상자
+            branch_name (str): 생성할 브랜치 이름
+        
+        Returns:
+            Tuple[bool, str]: (성공 여부, 결과 메시지)
+        """
+        dialog.update_message(f"브랜치 '{branch_name}' 생성 중...")
+        return checkout_branch(self.local_repo_path, branch_name, create=True)
+    
+    def _on_create_branch_done(self, branch_name: str, result: Tuple[bool, str]):
+        """
+        새 브랜치 생성 완료 콜백
+        
+        Args:
+            branch_name (str): 생성한 브랜치 이름
+            result (Tuple[bool, str]): (성공 여부, 결과 메시지)
+        """
+        success, message = result
+        if success:
+            self.new_branch_entry.delete(0, tk.END)
+            messagebox.showinfo("성공", f"브랜치 '{branch_name}'이(가) 생성되었습니다.")
+            
+            # 생성된 브랜치를 목록에 추가하고 현재 브랜치로 표시 (git을 다시 실행하지 않음)
+            if branch_name not in self._branches:
+                self._branches = self._branches + [branch_name]
+            self._current_branch = branch_name
+            self._apply_branches()
+        else:
+            messagebox.showerror("오류", f"브랜치 생성 실패: {message}")
+    
+    def _on_create_branch_error(self, error):
+        """새 브랜치 생성 오류 콜백"""
+        messagebox.showerror("오류", f"브랜치 생성 중 오류 발생: {error}")
+    
     def _on_refresh_commits_clicked(self):
         """커밋 새로고침 버튼 클릭 이벤트 핸들러"""
         if not self.local_repo_path:
@@ -604,46 +1030,237 @@ class RepoDetailsView(ttk.Frame):
             messagebox.showerror("오류", "브랜치를 선택하세요.")
             return
         
-        # 트리뷰 초기화
-        for item in self.commits_tree.get_children():
-            self.commits_tree.delete(item)
+        self._commit_query = (self.current_repo["full_name"], branch)
+        self._load_commits(1)
+    
+    def _on_more_commits_clicked(self):
+        """커밋 더 불러오기 버튼 클릭 이벤트 핸들러"""
+        if self._commit_query and self._commit_next_page:
+            self._load_commits(self._commit_next_page)
+    
+    def _prefetch_lists(self, repo_data: Dict[str, Any]):
+        """
+        커밋/PR 탭에 처음 표시할 페이지를 백그라운드에서 미리 불러옴
         
-        def task_func(dialog):
-            dialog.update_message(f"브랜치 '{branch}'의 커밋 로드 중...")
-            try:
-                # GitHub API를 통해 커밋 가져오기
-                commits = github_client.get_commits(
-                    self.current_repo["full_name"], branch=branch, max_count=30
-                )
-                return True, commits
-            except Exception as e:
-                return False, str(e)
+        Args:
+            repo_data (Dict[str, Any]): 리포지토리 정보
+        """
+        self._prefetch = {"commits": None, "prs": None}
+        full_name = repo_data.get("full_name", "")
+        if not full_name:
+            return
         
-        def success_callback(result):
-            success, data = result
-            if success:
-                commits = data
-                for commit in commits:
-                    self.commits_tree.insert(
-                        "", "end",
-                        values=(
-                            commit.get("sha", "")[:7],
-                            commit.get("commit", {}).get("message", "").split("\n")[0],
-                            commit.get("commit", {}).get("author", {}).get("name", ""),
-                            commit.get("commit", {}).get("author", {}).get("date", "")[:10]
-                        )
-                    )
-            else:
-                messagebox.showerror("오류", f"커밋 로드 실패: {data}")
+        def store(kind, query):
+            def on_success(rows):
+                # 그 사이 다른 리포지토리가 선택되었으면 버림
+                if self.current_repo is repo_data:
+                    self._prefetch[kind] = (query, time.monotonic(), rows)
+            return on_success
         
-        def error_callback(error):
-            messagebox.showerror("오류", f"커밋 로드 중 오류 발생: {error}")
+        def on_error(error):
+            logger.debug(f"커밋/PR 미리 불러오기 실패: {error}")
+        
+        # 커밋 탭은 로컬 리포지토리가 있을 때만 사용하므로 그때만 기본 브랜치 커밋을 불러옴
+        branch = repo_data.get("default_branch")
+        if self.local_repo_path and branch:
+            async_handler.submit_task(
+                lambda: _commit_rows(github_client.get_commits(
+                    full_name, branch=branch, max_count=LIST_PAGE_SIZE
+                )),
+                store("commits", (full_name, branch)), on_error
+            )
+        
+        state = self.pr_state_combobox.get() if 3 in self._tabs_initialized else "all"
+        async_handler.submit_task(
+            lambda: _pr_rows(github_client.get_pull_requests(
+                full_name, state=state, max_count=LIST_PAGE_SIZE
+            )),
+            store("prs", (full_name, state)), on_error
+        )
+    
+    def _take_prefetched(self, kind: str, query: Tuple[str, str]) -> Optional[List[Tuple]]:
+        """
+        조회 조건이 같고 아직 유효한 미리 불러온 첫 페이지를 꺼냄
+        
+        Args:
+            kind (str): "commits" 또는 "prs"
+            query (Tuple[str, str]): 조회 조건
+        
+        Returns:
+            Optional[List[Tuple]]: 행 목록 (사용할 수 없으면 None)
+        """
+        entry = self._prefetch.get(kind)
+        self._prefetch[kind] = None
+        if not entry:
+            return None
+        
+        prefetched_query, fetched_at, rows = entry
+        if prefetched_query != query or time.monotonic() - fetched_at > PREFETCH_TTL_SECONDS:
+            return None
+        return rows
+    
+    def _load_commits(self, page: int):
+        """
+        커밋 목록의 한 페이지를 불러와 트리뷰에 표시 (첫 페이지는 기존 목록을 교체)
+        
+        Args:
+            page (int): 페이지 번호 (1부터 시작)
+        """
+        query = self._commit_query
+        
+        # 첫 페이지면 트리뷰 초기화
+        if page == 1:
+            self._clear_tree(self.commits_tree)
+        self.more_commits_button.config(state=tk.DISABLED)
+        
+        # 미리 불러온 첫 페이지가 있으면 요청 없이 바로 표시
+        if page == 1:
+            rows = self._take_prefetched("commits", query)
+            if rows is not None:
+                self._show_commit_page(page, rows)
+                return
         
         show_progress_dialog(
-            self, "커밋 로드", f"브랜치 '{branch}'의 커밋 로드 중...",
-            task_func, success_callback, error_callback
+            self, "커밋 로드", f"브랜치 '{query[1]}'의 커밋 로드 중...",
+            functools.partial(self._commits_task, query=query, page=page),
+            functools.partial(self._on_commits_loaded, query, page),
+            self._on_commits_error
         )
     
+    def _commits_task(self, dialog, query: Tuple[str, str], page: int) -> Tuple[bool, Union[List[Tuple], str]]:
+        """
+        커밋 한 페이지를 가져와 행 값으로 변환 (작업자 스레드)
+        
+        Args:
+            dialog: 진행 대화상자
+            query (Tuple[str, str]): (리포지토리 전체 이름, 브랜치)
+            page (int): 페이지 번호
+        
+        Returns:
+            Tuple[bool, Union[List[Tuple], str]]: (성공 여부, 행 목록 또는 오류 메시지)
+        """
+        full_name, branch = query
+        dialog.update_message(f"브랜치 '{branch}'의 커밋 로드 중...")
+        try:
+            # GitHub API를 통해 커밋 가져오기 (표시할 행 값은 작업자 스레드에서 미리 계산)
+            commits = github_client.get_commits(
+                full_name, branch=branch, max_count=LIST_PAGE_SIZE, page=page,
+                on_wait=functools.partial(_show_rate_limit_wait, dialog)
+            )
+            return True, _commit_rows(commits)
+        except Exception as e:
+            return False, str(e)
+    
+    def _on_commits_loaded(self, query: Tuple[str, str], page: int,
+                           result: Tuple[bool, Union[List[Tuple], str]]):
+        """
+        커밋 페이지 로드 완료 콜백
+        
+        Args:
+            query (Tuple[str, str]): 요청한 조회 조건
+            page (int): 페이지 번호
+            result (Tuple[bool, Union[List[Tuple], str]]): (성공 여부, 행 목록 또는 오류 메시지)
+        """
+        success, data = result
+        if not success:
+            messagebox.showerror("오류", f"커밋 로드 실패: {data}")
+        elif query == self._commit_query:  # 그 사이 다른 목록을 요청했으면 버림
+            self._show_commit_page(page, data)
+    
+    def _on_commits_error(self, error):
+        """커밋 페이지 로드 오류 콜백"""
+        messagebox.showerror("오류", f"커밋 로드 중 오류 발생: {error}")
+    
+    def _show_commit_page(self, page: int, rows: List[Tuple]):
+        """
+        불러온 커밋 페이지를 트리뷰에 추가하고 더 불러오기 버튼 상태를 갱신
+        
+        Args:
+            page (int): 페이지 번호
+            rows (List[Tuple]): 행 목록
+        """
+        self._insert_rows(self.commits_tree, rows)
+        
+        # 한 페이지를 가득 채웠으면 다음 페이지가 있을 수 있음
+        self._commit_next_page = page + 1 if len(rows) >= LIST_PAGE_SIZE else None
+        if self._commit_next_page:
+            self.more_commits_button.config(state=tk.NORMAL)
+    
+    def _clear_tree(self, tree: ttk.Treeview):
+        """
+        트리뷰의 행과 보관 중인 전체 행 목록을 비움
+        
+        Args:
+            tree (ttk.Treeview): 대상 트리뷰
+        """
+        key = str(tree)
+        self._tree_rows[key] = []
+        self._tree_rendered[key] = 0
+        
+        # 행마다 delete를 호출하지 않고 한 번에 삭제 (빈 목록이면 호출하지 않음)
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+    
+    def _insert_rows(self, tree: ttk.Treeview, rows: List[Tuple]):
+        """
+        트리뷰의 전체 행 목록에 행을 추가
+        
+        트리뷰에는 화면을 채울 만큼만 추가하고, 나머지는 스크롤이 끝에 가까워질 때 추가합니다.
+        
+        Args:
+            tree (ttk.Treeview): 대상 트리뷰
+            rows (List[Tuple]): 행 값 목록
+        """
+        key = str(tree)
+        self._tree_rows.setdefault(key, []).extend(rows)
+        
+        rendered = self._tree_rendered.get(key, 0)
+        if rendered < TREE_RENDER_CHUNK or float(tree.yview()[1]) >= TREE_RENDER_THRESHOLD:
+            self._render_tree_more(tree)
+    
+    def _render_tree_more(self, tree: ttk.Treeview):
+        """
+        아직 추가하지 않은 행 중 다음 묶음을 Tcl 호출 한 번으로 트리뷰에 추가
+        
+        Args:
+            tree (ttk.Treeview): 대상 트리뷰
+        """
+        key = str(tree)
+        self._tree_render_pending.discard(key)
+        
+        rows = self._tree_rows.get(key, [])
+        start = self._tree_rendered.get(key, 0)
+        end = min(start + TREE_RENDER_CHUNK, len(rows))
+        
+        if start < end:
+            self.tk.call("apply", _TREE_INSERT_ROWS_LAMBDA, key, tuple(rows[start:end]))
+        self._tree_rendered[key] = end
+    
+    def _tree_yscroll_handler(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar) -> Callable:
+        """
+        스크롤바를 갱신하고 끝에 가까워지면 다음 묶음을 추가하는 yscrollcommand를 만듦
+        
+        Args:
+            tree (ttk.Treeview): 대상 트리뷰
+            scrollbar (ttk.Scrollbar): 트리뷰의 세로 스크롤바
+        
+        Returns:
+            Callable: yscrollcommand 콜백
+        """
+        key = str(tree)
+        
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            
+            if (float(last) >= TREE_RENDER_THRESHOLD
+                    and self._tree_rendered.get(key, 0) < len(self._tree_rows.get(key, []))
+                    and key not in self._tree_render_pending):
+                self._tree_render_pending.add(key)
+                self.after_idle(lambda: self._render_tree_more(tree))
+        
+        return on_yscroll
+    
     def _on_commit_double_clicked(self, event):
         """커밋 항목 더블 클릭 이벤트 핸들러"""
         selection = self.commits_tree.selection()
@@ -664,48 +1281,102 @@ class RepoDetailsView(ttk.Frame):
             messagebox.showerror("오류", "리포지토리가 선택되지 않았습니다.")
             return
         
-        state = self.pr_state_combobox.get()
-        
-        # 트리뷰 초기화
-        for item in self.pr_tree.get_children():
-            self.pr_tree.delete(item)
-        
-        def task_func(dialog):
-            dialog.update_message(f"풀 리퀘스트 로드 중...")
-            try:
-                prs = github_client.get_pull_requests(
-                    self.current_repo["full_name"], state=state
-                )
-                return True, prs
-            except Exception as e:
-                return False, str(e)
-        
-        def success_callback(result):
-            success, data = result
-            if success:
-                prs = data
-                for pr in prs:
-                    self.pr_tree.insert(
-                        "", "end",
-                        values=(
-                            pr.get("number", ""),
-                            pr.get("title", ""),
-                            pr.get("state", ""),
-                            pr.get("user", {}).get("login", ""),
-                            pr.get("updated_at", "")[:10]
-                        )
-                    )
-            else:
-                messagebox.showerror("오류", f"PR 로드 실패: {data}")
+        self._pr_query = (self.current_repo["full_name"], self.pr_state_combobox.get())
+        self._load_pull_requests(1)
+    
+    def _on_more_pr_clicked(self):
+        """PR 더 불러오기 버튼 클릭 이벤트 핸들러"""
+        if self._pr_query and self._pr_next_page:
+            self._load_pull_requests(self._pr_next_page)
+    
+    def _load_pull_requests(self, page: int):
+        """
+        PR 목록의 한 페이지를 불러와 트리뷰에 표시 (첫 페이지는 기존 목록을 교체)
         
-        def error_callback(error):
-            messagebox.showerror("오류", f"PR 로드 중 오류 발생: {error}")
+        Args:
+            page (int): 페이지 번호 (1부터 시작)
+        """
+        query = self._pr_query
+        
+        # 첫 페이지면 트리뷰 초기화
+        if page == 1:
+            self._clear_tree(self.pr_tree)
+        self.more_pr_button.config(state=tk.DISABLED)
+        
+        # 미리 불러온 첫 페이지가 있으면 요청 없이 바로 표시
+        if page == 1:
+            rows = self._take_prefetched("prs", query)
+            if rows is not None:
+                self._show_pr_page(page, rows)
+                return
         
         show_progress_dialog(
             self, "PR 로드", "풀 리퀘스트 로드 중...",
-            task_func, success_callback, error_callback
+            functools.partial(self._pull_requests_task, query=query, page=page),
+            functools.partial(self._on_pull_requests_loaded, query, page),
+            self._on_pull_requests_error
         )
     
+    def _pull_requests_task(self, dialog, query: Tuple[str, str],
+                            page: int) -> Tuple[bool, Union[List[Tuple], str]]:
+        """
+        PR 한 페이지를 가져와 행 값으로 변환 (작업자 스레드)
+        
+        Args:
+            dialog: 진행 대화상자
+            query (Tuple[str, str]): (리포지토리 전체 이름, PR 상태)
+            page (int): 페이지 번호
+        
+        Returns:
+            Tuple[bool, Union[List[Tuple], str]]: (성공 여부, 행 목록 또는 오류 메시지)
+        """
+        full_name, state = query
+        dialog.update_message(f"풀 리퀘스트 로드 중...")
+        try:
+            # 표시할 행 값은 작업자 스레드에서 미리 계산
+            prs = github_client.get_pull_requests(
+                full_name, state=state, max_count=LIST_PAGE_SIZE, page=page,
+                on_wait=functools.partial(_show_rate_limit_wait, dialog)
+            )
+            return True, _pr_rows(prs)
+        except Exception as e:
+            return False, str(e)
+    
+    def _on_pull_requests_loaded(self, query: Tuple[str, str], page: int,
+                                 result: Tuple[bool, Union[List[Tuple], str]]):
+        """
+        PR 페이지 로드 완료 콜백
+        
+        Args:
+            query (Tuple[str, str]): 요청한 조회 조건
+            page (int): 페이지 번호
+            result (Tuple[bool, Union[List[Tuple], str]]): (성공 여부, 행 목록 또는 오류 메시지)
+        """
+        success, data = result
+        if not success:
+            messagebox.showerror("오류", f"PR 로드 실패: {data}")
+        elif query == self._pr_query:  # 그 사이 다른 목록을 요청했으면 버림
+            self._show_pr_page(page, data)
+    
+    def _on_pull_requests_error(self, error):
+        """PR 페이지 로드 오류 콜백"""
+        messagebox.showerror("오류", f"PR 로드 중 오류 발생: {error}")
+    
+    def _show_pr_page(self, page: int, rows: List[Tuple]):
+        """
+        불러온 PR 페이지를 트리뷰에 추가하고 더 불러오기 버튼 상태를 갱신
+        
+        Args:
+            page (int): 페이지 번호
+            rows (List[Tuple]): 행 목록
+        """
+        self._insert_rows(self.pr_tree, rows)
+        
+        # 한 페이지를 가득 채웠으면 다음 페이지가 있을 수 있음
+        self._pr_next_page = page + 1 if len(rows) >= LIST_PAGE_SIZE else None
+        if self._pr_next_page:
+            self.more_pr_button.config(state=tk.NORMAL)
+    
     def _on_pr_double_clicked(self, event):
         """PR 항목 더블 클릭 이벤트 핸들러"""
         selection = self.pr_tree.selection()
@@ -727,17 +1398,19 @@ class RepoDetailsView(ttk.Frame):
             return
         
         # 로그 창 초기화
-        self.cicd_log_text.config(state=tk.NORMAL)
-        self.cicd_log_text.delete(1.0, tk.END)
-        self.cicd_log_text.insert(tk.END, "CI/CD 파이프라인 실행 중...\n\n")
-        self.cicd_log_text.config(state=tk.DISABLED)
+        with _editable(self.cicd_log_text):
+            self.cicd_log_text.delete(1.0, tk.END)
+            self.cicd_log_text.insert(tk.END, "CI/CD 파이프라인 실행 중...\n\n")
+        
+        # 실행하는 동안 버퍼에 쌓인 로그를 주기적으로 한 번에 반영
+        self._cicd_stream.start()
         
         def task_func(dialog):
             dialog.update_message("CI/CD 파이프라인 실행 중...")
             
             def log_callback(message):
-                # UI 스레드에서 로그 업데이트
-                self.after(0, lambda: self._append_to_cicd_log(message))
+                # 작업자 스레드에서는 버퍼에만 추가 (UI 반영은 메인 스레드에서)
+                self._cicd_stream.put(message)
             
             success, result = run_ci_cd_pipeline(
                 self.local_repo_path, log_callback=log_callback
@@ -745,28 +1418,33 @@ class RepoDetailsView(ttk.Frame):
             return success, result
         
         def success_callback(result):
+            self._cicd_stream.stop()
             success, message = result
-            self._append_to_cicd_log("\n" + "-" * 40 + "\n")
             
             if success:
-                self._append_to_cicd_log("✅ CI/CD 파이프라인 실행 성공\n")
+                summary = "✅ CI/CD 파이프라인 실행 성공\n"
             else:
-                self._append_to_cicd_log(f"❌ CI/CD 파이프라인 실행 실패: {message}\n")
+                summary = f"❌ CI/CD 파이프라인 실행 실패: {message}\n"
+            self._cicd_stream.append("\n" + "-" * 40 + "\n" + summary)
         
         def error_callback(error):
-            self._append_to_cicd_log(f"\n❌ CI/CD 파이프라인 실행 중 오류 발생: {error}\n")
+            self._cicd_stream.stop()
+            self._cicd_stream.append(f"\n❌ CI/CD 파이프라인 실행 중 오류 발생: {error}\n")
         
         show_progress_dialog(
             self, "CI/CD 실행", "CI/CD 파이프라인 실행 중...",
             task_func, success_callback, error_callback
         )
     
-    def _append_to_cicd_log(self, message):
-        """CI/CD 로그 텍스트에 메시지 추가"""
-        self.cicd_log_text.config(state=tk.NORMAL)
-        self.cicd_log_text.insert(tk.END, message)
-        self.cicd_log_text.see(tk.END)  # 스크롤을 항상 맨 아래로
-        self.cicd_log_text.config(state=tk.DISABLED)
+    def refresh_local_cache(self):
+        """클론 기본 경로와 로컬 리포지토리 디렉토리 목록을 다시 읽음"""
+        self._base_path = get_clone_base_path()
+        
+        try:
+            with os.scandir(self._base_path) as entries:
+                self._local_repo_names = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            self._local_repo_names = set()
     
     def clone_repository(self, repo_data):
         """
@@ -779,9 +1457,8 @@ class RepoDetailsView(ttk.Frame):
             return
         
         # 기본 클론 경로 가져오기
-        base_path = get_clone_base_path()
         repo_name = repo_data.get("name", "")
-        target_path = os.path.join(base_path, repo_name)
+        target_path = os.path.join(self._base_path, repo_name)
         
         # 경로가 이미 존재하는 경우
         if os.path.exists(target_path):
@@ -805,7 +1482,7 @@ class RepoDetailsView(ttk.Frame):
                             messagebox.showinfo("성공", "원격 저장소 URL이 업데이트되었습니다.")
                             self.local_repo_path = target_path
                             self.local_path_label.config(text=target_path)
-                            self.open_local_button.config(state=tk.NORMAL)
+                            self._apply_repo_state()
                             self._load_local_branches()
                         else:
                             messagebox.showerror("오류", f"원격 저장소 URL 업데이트 실패: {message}")
@@ -837,16 +1514,12 @@ class RepoDetailsView(ttk.Frame):
             success, message = result
             if success:
                 messagebox.showinfo("성공", f"리포지토리가 '{target_path}'에 클론되었습니다.")
+                self.refresh_local_cache()
                 self.local_repo_path = target_path
                 self.local_path_label.config(text=target_path)
-                self.open_local_button.config(state=tk.NORMAL)
                 
                 # UI 업데이트
-                self.checkout_button.config(state=tk.NORMAL)
-                self.refresh_branches_button.config(state=tk.NORMAL)
-                self.create_branch_button.config(state=tk.NORMAL)
-                self.refresh_commits_button.config(state=tk.NORMAL)
-                self.run_cicd_button.config(state=tk.NORMAL)
+                self._apply_repo_state()
                 
                 # 브랜치 정보 로드
                 self._load_local_branches()
@@ -882,12 +1555,15 @@ class RepoDetailsView(ttk.Frame):
                 
                 # GitHub에서 리포지토리 이름 변경
                 success, result = github_client.rename_repository(
-                    repo_data.get("full_name", ""), new_name
+                    repo_data.get("full_name", ""), new_name,
+                    on_wait=functools.partial(_show_rate_limit_wait, dialog)
                 )
                 
                 if not success:
                     return False, result
                 
+                api_cache.invalidate_prefix(repo_data.get("full_name", ""))
+                
                 # 로컬 리포지토리가 있으면 로컬 폴더도 이름 변경
                 local_rename_success = True
                 local_rename_msg = ""
@@ -917,6 +1593,7 @@ class RepoDetailsView(ttk.Frame):
                         "성공", 
                         f"리포지토리 이름이 '{current_name}'에서 '{data['new_name']}'으로 변경되었습니다."
                     )
+                    self.refresh_local_cache()
                     
                     # UI 업데이트
                     if self.local_repo_path:
@@ -962,8 +1639,11 @@ class RepoDetailsView(ttk.Frame):
                 
                 # GitHub에서 리포지토리 삭제
                 success, result = github_client.delete_repository(
-                    repo_data.get("full_name", "")
+                    repo_data.get("full_name", ""),
+                    on_wait=functools.partial(_show_rate_limit_wait, dialog)
                 )
+                if success:
+                    api_cache.invalidate_prefix(repo_data.get("full_name", ""))
                 
                 return success, result
             
@@ -977,6 +1657,7 @@ class RepoDetailsView(ttk.Frame):
                     )
                     
                     # 목록 새로고침 및 상세 뷰 초기화
+                    self.refresh_local_cache()
                     self.clear()
                     self.app.refresh_repos()
                 else:
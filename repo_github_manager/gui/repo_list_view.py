@@ -4,17 +4,39 @@
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple
 
 from utils.logger import setup_logger
 
 # 로거 설정
 logger = setup_logger(__name__)
 
+# 트리뷰에 한 번에 추가할 행 수 (스크롤이 끝에 가까워지면 다음 묶음을 추가)
+TREE_RENDER_CHUNK = 100
+
+# 스크롤 위치가 이 비율을 넘으면 다음 묶음을 추가
+TREE_RENDER_THRESHOLD = 0.9
+
+# 여러 행을 Tcl 호출 한 번으로 추가하는 스크립트 (apply 람다: 트리뷰 경로, 평탄화한 행 목록)
+_TREE_INSERT_LAMBDA = (
+    "{tree rows} {foreach {iid name desc priv tag} $rows "
+    "{$tree insert {} end -id $iid -values [list $name $desc $priv] -tags [list $tag]}}"
+)
+
+# 검색어 입력이 멈춘 뒤 필터링을 시작하기까지 기다리는 시간 (밀리초)
+SEARCH_DEBOUNCE_MS = 200
+
 
 class RepoListView(ttk.Frame):
     """리포지토리 목록을 표시하는 뷰"""
     
+    # 리포지토리 목록 컬럼 정의: (컬럼 ID, 제목, 너비, 정렬)
+    _COLUMNS = (
+        ("name", "이름", 150, tk.W),
+        ("description", "설명", 250, tk.W),
+        ("private", "비공개", 60, tk.CENTER),
+    )
+    
     def __init__(self, parent, on_select_callback: Callable[[Dict[str, Any]], None], **kwargs):
         """
         리포지토리 목록 뷰 초기화
@@ -29,6 +51,15 @@ class RepoListView(ttk.Frame):
         self.on_select_callback = on_select_callback
         self.repositories = []
         self.repo_id_map = {}  # id -> repository_data
+        self._filtered = []  # 검색 조건에 맞는 리포지토리 (표시 순서)
+        self._rendered = 0  # 현재 검색 결과 중 트리뷰에 표시된 행 수
+        self._search_index = []  # (리포지토리, 정규화한 이름, 정규화한 설명) - 목록 설정 시 한 번만 계산
+        self._row_cache: Dict[int, Tuple[str, str, str, str, str]] = {}  # id -> (항목 ID, 이름, 설명, 비공개, 태그)
+        self._inserted: Set[str] = set()  # 트리뷰에 만들어 둔 항목 ID (검색에서 빠지면 떼어 두었다가 재사용)
+        self._render_pending = False
+        self._search_after_id = None
+        self._right_click_repo: Optional[Dict[str, Any]] = None  # 컨텍스트 메뉴를 연 리포지토리
+        self._actions: Optional[Dict[str, Optional[Callable]]] = None  # 메뉴 동작 -> 상세 정보 뷰 메서드 (처음 사용할 때 구성)
         
         # 컨트롤 프레임
         self.control_frame = ttk.Frame(self)
@@ -41,6 +72,7 @@ class RepoListView(ttk.Frame):
         ttk.Label(self.control_frame, text="검색:").pack(side=tk.LEFT, padx=(0, 5))
         self.search_entry = ttk.Entry(self.control_frame, textvariable=self.search_var)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.search_entry.bind("<Return>", self._apply_search)  # Enter는 기다리지 않고 바로 검색
         
         # 새로고침 버튼
         self.refresh_button = ttk.Button(
@@ -49,25 +81,24 @@ class RepoListView(ttk.Frame):
         self.refresh_button.pack(side=tk.RIGHT, padx=5)
         
         # 목록 표시 TreeView
-        columns = ("name", "description", "private")
+        columns = tuple(column[0] for column in self._COLUMNS)
         self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
         
         # 컬럼 설정
-        self.tree.heading("name", text="이름")
-        self.tree.heading("description", text="설명")
-        self.tree.heading("private", text="비공개")
+        for column, title, width, anchor in self._COLUMNS:
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width, anchor=anchor)
         
-        self.tree.column("name", width=150, anchor=tk.W)
-        self.tree.column("description", width=250, anchor=tk.W)
-        self.tree.column("private", width=60, anchor=tk.CENTER)
+        # 태그 설정
+        self.tree.tag_configure("private", foreground="darkred")
         
-        # 스크롤바
-        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # 스크롤바 (스크롤 위치를 보고 남은 행을 이어서 추가)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         
         # 위젯 배치
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 5), pady=5)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 5), pady=5)
         
         # 이벤트 바인딩
         self.tree.bind("<<TreeviewSelect>>", self._on_repo_selected)
@@ -101,42 +132,117 @@ class RepoListView(ttk.Frame):
         """
         self.repositories = repositories
         self.repo_id_map = {repo["id"]: repo for repo in repositories}
-        self._refresh_tree()
+        self._search_index = []
+        self._row_cache = {}
+        for repo in repositories:
+            description = repo["description"] or ""
+            self._search_index.append((repo, repo["name"].casefold(), description.casefold()))
+            
+            # 트리뷰 행 값은 목록을 받을 때 한 번만 만들고 검색/스크롤 중에는 재사용
+            self._row_cache[repo["id"]] = (
+                str(repo["id"]),
+                repo["name"], description, "예" if repo["private"] else "아니오",
+                "private" if repo["private"] else "public",
+            )
+        
+        # 값이 바뀌었을 수 있으므로 떼어 둔 항목까지 모두 삭제
+        if self._inserted:
+            self.tree.delete(*self._inserted)
+            self._inserted.clear()
+        
+        self._apply_search()  # 대기 중인 검색도 이번 갱신에 반영
     
     def _refresh_tree(self):
-        """트리 뷰 갱신"""
-        # 기존 항목 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # 검색 필터링
-        search_text = self.search_var.get().lower()
-        filtered_repos = [
-            repo for repo in self.repositories
-            if (
-                search_text == "" or
-                search_text in repo["name"].lower() or
-                (repo["description"] and search_text in repo["description"].lower())
-            )
-        ]
+        """
+        트리 뷰 갱신
         
-        # 새 항목 추가
-        for repo in filtered_repos:
-            private_text = "예" if repo["private"] else "아니오"
-            description = repo["description"] if repo["description"] else ""
-            
-            self.tree.insert(
-                "", "end", 
-                values=(repo["name"], description, private_text),
-                tags=("private" if repo["private"] else "public",),
-                iid=str(repo["id"]),
-            )
+        전체 목록을 한 번에 추가하지 않고 첫 묶음만 추가한 뒤,
+        스크롤이 끝에 가까워질 때마다 다음 묶음을 추가합니다.
+        항목은 삭제하지 않고, 검색에서 빠진 항목은 떼어 두었다가 다시 맞으면 그대로 붙입니다.
+        """
+        # 검색 필터링 (이름/설명은 미리 정규화해 둔 값과 비교)
+        search_text = self.search_var.get().casefold()
+        if search_text:
+            self._filtered = [
+                repo for repo, name, description in self._search_index
+                if search_text in name or search_text in description
+            ]
+        else:
+            self._filtered = list(self.repositories)
+        self._rendered = 0
         
-        # 태그 설정
-        self.tree.tag_configure("private", foreground="darkred")
+        self._render_more()
+    
+    def _render_more(self):
+        """아직 추가하지 않은 리포지토리 중 다음 묶음을 트리뷰에 추가"""
+        self._render_pending = False
+        
+        start = self._rendered
+        end = min(start + TREE_RENDER_CHUNK, len(self._filtered))
+        
+        # 처음 표시하는 항목만 만들고, 행마다 tree.insert를 호출하지 않고 묶음 전체를 Tcl에 한 번에 전달
+        rows = []
+        reused = False
+        row_cache = self._row_cache
+        for repo in self._filtered[start:end]:
+            row = row_cache[repo["id"]]
+            if row[0] in self._inserted:
+                reused = True
+                continue
+            self._inserted.add(row[0])
+            rows.extend(row)
+        
+        if rows:
+            # 추가하는 동안 컬럼 너비 재계산을 멈췄다가 끝난 뒤 한 번에 복원
+            columns = self.tree["columns"]
+            for column in columns:
+                self.tree.column(column, stretch=False)
+            try:
+                self.tk.call("apply", _TREE_INSERT_LAMBDA, str(self.tree), tuple(rows))
+            finally:
+                for column in columns:
+                    self.tree.column(column, stretch=True)
+        
+        # 새 검색 결과이거나 떼어 둔 항목을 다시 쓰면, 보일 항목을 표시 순서대로 한 번에 지정
+        # (목록에 없는 항목은 삭제되지 않고 떼어짐)
+        if start == 0 or reused:
+            self.tree.set_children("", *(str(repo["id"]) for repo in self._filtered[:end]))
+        self._rendered = end
+    
+    def _on_tree_yscroll(self, first, last):
+        """
+        트리뷰 스크롤 위치 변경 이벤트 핸들러
+        
+        스크롤바를 갱신하고, 끝에 가까워졌으면 유휴 시점에 다음 묶음을 추가합니다.
+        휠, 키보드, 스크롤바 등 모든 스크롤 경로에서 호출됩니다.
+        
+        Args:
+            first: 보이는 영역의 시작 위치 (0.0 ~ 1.0)
+            last: 보이는 영역의 끝 위치 (0.0 ~ 1.0)
+        """
+        self.scrollbar.set(first, last)
+        
+        if (float(last) >= TREE_RENDER_THRESHOLD
+                and self._rendered < len(self._filtered)
+                and not self._render_pending):
+            self._render_pending = True
+            self.after_idle(self._render_more)
     
     def _on_search_changed(self, *args):
-        """검색 텍스트 변경 이벤트 핸들러"""
+        """
+        검색 텍스트 변경 이벤트 핸들러
+        
+        연속 입력 중에는 필터링을 미루고, 입력이 SEARCH_DEBOUNCE_MS 동안 멈추면 한 번만 갱신합니다.
+        """
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._apply_search)
+    
+    def _apply_search(self, event=None):
+        """대기 중인 검색어로 트리 뷰 갱신 (예약된 검색은 취소)"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         self._refresh_tree()
     
     def _on_refresh_clicked(self):
@@ -158,15 +264,15 @@ class RepoListView(ttk.Frame):
     def _on_repo_double_clicked(self, event):
         """리포지토리 더블 클릭 이벤트 핸들러"""
         # 더블 클릭 시 브라우저에서 열기
-        self._on_open_in_browser_clicked()
+        self._open_in_browser(self._get_selected_repo())
     
     def _on_right_click(self, event):
         """우클릭 이벤트 핸들러 (컨텍스트 메뉴 표시)"""
-        # 클릭된 항목 선택
+        # 클릭된 항목 선택 (선택 콜백은 <<TreeviewSelect>> 이벤트로 한 번만 호출됨)
         clicked_item = self.tree.identify_row(event.y)
         if clicked_item:
+            self._right_click_repo = self.repo_id_map.get(int(clicked_item))
             self.tree.selection_set(clicked_item)
-            self._on_repo_selected(None)  # 선택 콜백 호출
             self.context_menu.post(event.x_root, event.y_root)
     
     def _get_selected_repo(self) -> Optional[Dict[str, Any]]:
@@ -183,22 +289,53 @@ class RepoListView(ttk.Frame):
                 return self.repo_id_map[repo_id]
         return None
     
+    def _get_action(self, name: str) -> Optional[Callable]:
+        """
+        메뉴 동작에 해당하는 상세 정보 뷰 메서드 반환
+        
+        메인 윈도우의 상세 정보 뷰를 처음 찾았을 때 동작 표를 한 번만 구성하고 이후에는 재사용합니다.
+        
+        Args:
+            name (str): 동작 이름 ("clone", "rename", "delete")
+        
+        Returns:
+            Optional[Callable]: 리포지토리 정보를 받는 메서드 또는 None (상세 정보 뷰가 없는 경우)
+        """
+        if self._actions is None:
+            details_view = getattr(self.winfo_toplevel(), "repo_details_view", None)
+            if details_view is None:
+                return None
+            self._actions = {
+                "clone": getattr(details_view, "clone_repository", None),
+                "rename": getattr(details_view, "rename_repository", None),
+                "delete": getattr(details_view, "delete_repository", None),
+            }
+        return self._actions.get(name)
+    
     def _on_clone_clicked(self):
         """클론 메뉴 클릭 이벤트 핸들러"""
-        repo_data = self._get_selected_repo()
+        repo_data = self._right_click_repo
         if not repo_data:
             return
         
         # 부모 앱에 클론 요청
-        parent = self.winfo_toplevel()
-        if hasattr(parent, "repo_details_view") and hasattr(parent.repo_details_view, "clone_repository"):
-            parent.repo_details_view.clone_repository(repo_data)
+        action = self._get_action("clone")
+        if action:
+            action(repo_data)
     
     def _on_open_in_browser_clicked(self):
         """브라우저에서 열기 메뉴 클릭 이벤트 핸들러"""
+        self._open_in_browser(self._right_click_repo)
+    
+    def _open_in_browser(self, repo_data: Optional[Dict[str, Any]]):
+        """
+        리포지토리 페이지를 브라우저에서 엽니다.
+        
+        Args:
+            repo_data (Optional[Dict[str, Any]]): 리포지토리 정보
+        """
         import webbrowser
         
-        repo_data = self._get_selected_repo()
         if not repo_data or "html_url" not in repo_data:
             return
         
@@ -207,22 +344,22 @@ class RepoListView(ttk.Frame):
     
     def _on_rename_clicked(self):
         """이름 변경 메뉴 클릭 이벤트 핸들러"""
-        repo_data = self._get_selected_repo()
+        repo_data = self._right_click_repo
         if not repo_data:
             return
         
         # 부모 앱에 이름 변경 요청
-        parent = self.winfo_toplevel()
-        if hasattr(parent, "repo_details_view") and hasattr(parent.repo_details_view, "rename_repository"):
-            parent.repo_details_view.rename_repository(repo_data)
+        action = self._get_action("rename")
+        if action:
+            action(repo_data)
     
     def _on_delete_clicked(self):
         """삭제 메뉴 클릭 이벤트 핸들러"""
-        repo_data = self._get_selected_repo()
+        repo_data = self._right_click_repo
         if not repo_data:
             return
         
         # 부모 앱에 삭제 요청
-        parent = self.winfo_toplevel()
-        if hasattr(parent, "repo_details_view") and hasattr(parent.repo_details_view, "delete_repository"):
-            parent.repo_details_view.delete_repository(repo_data) 
\ No newline at end of file
+        action = self._get_action("delete")
+        if action:
+            action(repo_data) 
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+CI/CD 모듈 테스트 (공유 셸 종료 표식 처리, 단계 의존 관계 실행 순서)
+"""
+import os
+import threading
+import time
+
+import pytest
+
+from core import ci_cd
+from core.ci_cd import _PersistentShell, _run_steps_parallel
+
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="공유 셸은 POSIX 환경에서만 사용")
+
+
+@pytest.fixture
+def shell():
+    shell = _PersistentShell()
+    yield shell
+    shell.close()
+
+
+@posix_only
+def test_shell_returns_exit_code_and_separate_streams(shell, tmp_path):
+    return_code, stdout, stderr = shell.run(
+        "echo out; echo err >&2; exit 3", str(tmp_path), timeout=10
+    )
+    
+    assert return_code == 3
+    assert stdout == "out\n"
+    assert stderr == "err\n"
+
+
+@posix_only
+def test_shell_output_without_trailing_newline(shell, tmp_path):
+    return_code, stdout, stderr = shell.run("printf abc", str(tmp_path), timeout=10)
+    
+    assert return_code == 0
+    assert stdout == "abc"
+    assert stderr == ""
+
+
+@posix_only
+def test_shell_reuses_process_and_isolates_steps(shell, tmp_path):
+    (tmp_path / "sub").mkdir()
+    
+    shell.run("cd sub; FOO=1", str(tmp_path), timeout=10)
+    pid = shell.process.pid
+    return_code, stdout, _ = shell.run('pwd; echo "foo=${FOO:-unset}"', str(tmp_path), timeout=10)
+    
+    # 한 프로세스를 재사용하지만 디렉토리 이동과 변수 설정은 다음 단계에 남지 않음
+    assert shell.process.pid == pid
+    assert return_code == 0
+    assert stdout == f"{os.path.realpath(tmp_path)}\nfoo=unset\n"
+
+
+@posix_only
+def test_shell_ignores_marker_like_output(shell, tmp_path):
+    return_code, stdout, _ = shell.run(
+        "printf '__CI_STEP_END_ 0\\n'; printf '__CI_STEP_END_%s_1__ 0\\n' other; exit 4",
+        str(tmp_path), timeout=10
+    )
+    
+    assert return_code == 4
+    assert stdout == "__CI_STEP_END_ 0\n__CI_STEP_END_other_1__ 0\n"
+
+
+@posix_only
+def test_shell_ignores_previous_step_marker(shell, tmp_path):
+    shell.run("true", str(tmp_path), timeout=10)
+    previous_marker = f"__CI_STEP_END_{shell._token}_1__"
+    
+    # 이전 단계의 표식을 출력(표준 출력/오류 모두)해도 이번 단계의 결과로 오인하지 않음
+    lines = []
+    return_code, stdout, stderr = shell.run(
+        f"echo '{previous_marker} 0'; echo '{previous_marker}' >&2; exit 5",
+        str(tmp_path), timeout=10, line_callback=lines.append
+    )
+    
+    assert return_code == 5
+    assert stdout == f"{previous_marker} 0\n"
+    assert stderr == f"{previous_marker}\n"
+    assert sorted(lines) == sorted([f"{previous_marker} 0\n", f"{previous_marker}\n"])
+
+
+@posix_only
+def test_shell_line_callback_excludes_marker(shell, tmp_path):
+    lines = []
+    shell.run("echo one; echo two", str(tmp_path), timeout=10, line_callback=lines.append)
+    
+    assert lines == ["one\n", "two\n"]
+
+
+@posix_only
+def test_shell_timeout_kills_shell(shell, tmp_path):
+    with pytest.raises(ci_cd.subprocess.TimeoutExpired):
+        shell.run("sleep 5", str(tmp_path), timeout=0.2)
+    
+    assert shell.process is None
+    
+    # 다음 실행에서는 새 셸을 만들어 계속 사용할 수 있음
+    return_code, stdout, _ = shell.run("echo again", str(tmp_path), timeout=10)
+    assert (return_code, stdout) == (0, "again\n")
+
+
+def _make_steps(specs, events, lock):
+    """
+    (이름, 실행 시간, 의존 단계 인덱스, 성공 여부) 목록으로 _runner를 쓰는 단계 목록을 만듭니다.
+    """
+    def make_runner(name, duration, success):
+        def runner(repo_path, shell=None, log_callback=None):
+            with lock:
+                events.append(("start", name, time.monotonic()))
+            time.sleep(duration)
+            with lock:
+                events.append(("end", name, time.monotonic()))
+            return success, {"name": name, "success": success}
+        return runner
+    
+    return tuple(
+        {
+            "name": name,
+            "depends_on": tuple(depends_on),
+            "allow_failure": False,
+            "_runner": make_runner(name, duration, success),
+        }
+        for name, duration, depends_on, success in specs
+    )
+
+
+def _times(events, kind):
+    return {name: at for event, name, at in events if event == kind}
+
+
+def test_parallel_steps_respect_depends_on(tmp_path):
+    events, lock = [], threading.Lock()
+    steps = _make_steps([
+        ("lint", 0.2, [], True),
+        ("test", 0.3, [], True),
+        ("build", 0.1, [0, 1], True),
+        ("deploy", 0.05, [2], True),
+    ], events, lock)
+    
+    success, results = _run_steps_parallel(steps, str(tmp_path))
+    
+    starts, ends = _times(events, "start"), _times(events, "end")
+    assert success
+    assert [result["name"] for result in results] == ["lint", "test", "build", "deploy"]
+    assert starts["build"] >= max(ends["lint"], ends["test"])
+    assert starts["deploy"] >= ends["build"]
+    
+    # 의존 관계가 없는 단계는 동시에 실행됨
+    assert starts["test"] < ends["lint"]
+
+
+def test_independent_steps_overlap_regardless_of_cpu_count(tmp_path, monkeypatch):
+    monkeypatch.setattr(ci_cd.os, "cpu_count", lambda: 1)
+    events, lock = [], threading.Lock()
+    steps = _make_steps([(f"step{i}", 0.3, [], True) for i in range(3)], events, lock)
+    
+    started_at = time.monotonic()
+    success, _ = _run_steps_parallel(steps, str(tmp_path))
+    
+    assert success
+    assert time.monotonic() - started_at < 0.8
+
+
+def test_failed_step_stops_dependent_steps(tmp_path):
+    events, lock = [], threading.Lock()
+    steps = _make_steps([
+        ("lint", 0.05, [], False),
+        ("test", 0.2, [], True),
+        ("build", 0.05, [0, 1], True),
+    ], events, lock)
+    
+    success, results = _run_steps_parallel(steps, str(tmp_path))
+    
+    # 실패한 단계와 이미 실행 중이던 단계만 결과에 남고, 의존 단계는 시작하지 않음
+    assert not success
+    assert [result["name"] for result in results] == ["lint", "test"]
+    assert "build" not in _times(events, "start")
\ No newline at end of file
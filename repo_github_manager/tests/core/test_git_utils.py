@@ -0,0 +1,105 @@
+"""
+Git 유틸리티 모듈 테스트 (get_repo_state의 for-each-ref 출력 처리)
+"""
+import pytest
+
+from core import git_utils
+from core.git_utils import get_repo_state, invalidate_repo_state
+
+
+@pytest.fixture
+def git_output(monkeypatch):
+    """run_git_command가 돌려줄 출력을 지정하고 호출된 명령어를 기록"""
+    state = {"output": "", "success": True, "calls": []}
+    
+    def fake_run_git_command(command, cwd=None, timeout=60):
+        state["calls"].append(command)
+        return state["success"], state["output"]
+    
+    git_utils._REPO_STATE_CACHE.clear()
+    monkeypatch.setattr(git_utils, "check_git_repo", lambda path: True)
+    monkeypatch.setattr(git_utils, "run_git_command", fake_run_git_command)
+    yield state
+    git_utils._REPO_STATE_CACHE.clear()
+
+
+def test_parses_branches_and_current_branch(git_output, tmp_path):
+    git_output["output"] = "develop\t \nfeature/login\t \nmain\t*\n"
+    
+    success, (branches, current_branch) = get_repo_state(str(tmp_path))
+    
+    assert success
+    assert branches == ["develop", "feature/login", "main"]
+    assert current_branch == "main"
+    assert git_output["calls"] == [
+        ["git", "for-each-ref", "--format=%(refname:short)%09%(HEAD)", "refs/heads"]
+    ]
+
+
+def test_detached_head_has_no_current_branch(git_output, tmp_path):
+    git_output["output"] = "main\t \nrelease\t \n"
+    
+    success, (branches, current_branch) = get_repo_state(str(tmp_path))
+    
+    assert success
+    assert branches == ["main", "release"]
+    assert current_branch is None
+
+
+def test_empty_repository_has_no_branches(git_output, tmp_path):
+    git_output["output"] = ""
+    
+    assert get_repo_state(str(tmp_path)) == (True, ([], None))
+
+
+def test_result_is_cached_until_invalidated(git_output, tmp_path):
+    git_output["output"] = "main\t*\n"
+    get_repo_state(str(tmp_path))
+    
+    # 캐시된 목록을 호출자가 수정해도 캐시에는 영향 없음
+    _, (branches, _) = get_repo_state(str(tmp_path))
+    branches.append("changed")
+    assert get_repo_state(str(tmp_path)) == (True, (["main"], "main"))
+    assert len(git_output["calls"]) == 1
+    
+    invalidate_repo_state(str(tmp_path))
+    git_output["output"] = "dev\t*\nmain\t \n"
+    assert get_repo_state(str(tmp_path)) == (True, (["dev", "main"], "dev"))
+    assert len(git_output["calls"]) == 2
+
+
+def test_git_failure_is_returned(git_output, tmp_path):
+    git_output["success"] = False
+    git_output["output"] = "fatal: error"
+    
+    assert get_repo_state(str(tmp_path)) == (False, "fatal: error")
+
+
+def test_non_repository_path(monkeypatch, tmp_path):
+    git_utils._REPO_STATE_CACHE.clear()
+    monkeypatch.setattr(git_utils, "check_git_repo", lambda path: False)
+    
+    success, message = get_repo_state(str(tmp_path))
+    
+    assert not success
+    assert str(tmp_path) in message
+
+
+def test_real_repository(tmp_path):
+    git_utils._REPO_STATE_CACHE.clear()
+    run = lambda *args: git_utils.subprocess.run(
+        ["git", *args], cwd=tmp_path, check=True, capture_output=True
+    )
+    try:
+        run("init", "-q", "-b", "main")
+        run("-c", "user.name=t", "-c", "user.email=t@example.com",
+            "commit", "-q", "--allow-empty", "-m", "init")
+        run("branch", "feature")
+    except (OSError, git_utils.subprocess.CalledProcessError):
+        pytest.skip("git을 사용할 수 없습니다.")
+    
+    success, (branches, current_branch) = get_repo_state(str(tmp_path))
+    
+    assert success
+    assert branches == ["feature", "main"]
+    assert current_branch == "main"
\ No newline at end of file
@@ -0,0 +1,438 @@
+"""
+GitHub 클라이언트 모듈 테스트 (요청 한도 재시도, 토큰 풀, 조건부 요청 캐시, 리포지토리 목록 캐시)
+
+네트워크 대신 미리 정한 응답을 돌려주는 가짜 세션을 사용합니다.
+"""
+import json
+import sqlite3
+from contextlib import closing, contextmanager
+
+import pytest
+import requests
+
+from core import github_client as github_client_module
+from core.github_client import GitHubClient, _rate_limit_delay, _repo_info_from
+
+
+NOW = 1_000_000.0
+
+
+class _FakeSession:
+    """보낸 요청을 기록하고 미리 넣어 둔 응답을 차례로 돌려주는 requests.Session 대역"""
+    
+    def __init__(self):
+        self.headers = {}
+        self.responses = []
+        self.requests = []
+    
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append({"method": method, "url": url, "headers": dict(headers or {}), **kwargs})
+        return self.responses.pop(0)
+    
+    def close(self):
+        pass
+    
+    def tokens_used(self):
+        return [request["headers"].get("Authorization") for request in self.requests]
+
+
+class _CountingLimiter:
+    """대기하지 않고 acquire 횟수만 세는 RateLimiter 대역"""
+    
+    def __init__(self):
+        self.acquired = 0
+    
+    @contextmanager
+    def acquire(self):
+        self.acquired += 1
+        yield
+
+
+def _response(status, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+def _rate_limited(reset_in=5.0):
+    return _response(403, b"{}", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(NOW + reset_in)})
+
+
+def _secondary_limited():
+    return _response(403, b'{"message": "You have exceeded a secondary rate limit."}')
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(github_client_module.time, "time", lambda: NOW)
+    monkeypatch.setattr(github_client_module.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.fixture
+def make_client(monkeypatch, tmp_path, sleeps):
+    """토큰 목록으로 초기화하고 가짜 세션을 연결한 GitHubClient를 만듭니다."""
+    monkeypatch.setattr(github_client_module, "ETAG_CACHE_PATH", tmp_path / "etags.json")
+    monkeypatch.setattr(github_client_module, "REPO_CACHE_DB_PATH", tmp_path / "repo_cache.db")
+    clients = []
+    
+    def make(tokens=("token-a",)):
+        monkeypatch.setattr(github_client_module, "load_github_pats", lambda: list(tokens))
+        client = GitHubClient()
+        client._session.close()
+        client._session = _FakeSession()
+        client._rate_limiter = _CountingLimiter()
+        assert client.initialize()
+        clients.append(client)
+        return client
+    
+    yield make
+    for client in clients:
+        client._executor.shutdown(wait=False)
+
+
+def test_rate_limit_delay_prefers_retry_after(sleeps):
+    response = _response(429, headers={"Retry-After": "7", "X-RateLimit-Remaining": "0"})
+    
+    assert _rate_limit_delay(response, 0) == 7.0
+
+
+def test_rate_limit_delay_waits_for_primary_reset(sleeps):
+    assert _rate_limit_delay(_rate_limited(reset_in=10), 0) == 11.0
+    
+    # 이미 지난 초기화 시각이면 1초만 기다림
+    assert _rate_limit_delay(_rate_limited(reset_in=-30), 0) == 1.0
+
+
+def test_rate_limit_delay_backs_off_on_secondary_limit(sleeps):
+    for attempt in range(3):
+        delay = _rate_limit_delay(_secondary_limited(), attempt)
+        assert 2 ** attempt <= delay <= 2 ** attempt + 1
+
+
+@pytest.mark.parametrize("response", [
+    _response(403, b'{"message": "Resource not accessible by integration"}'),
+    _response(404),
+    _response(200, b"{}"),
+])
+def test_rate_limit_delay_ignores_other_responses(sleeps, response):
+    assert _rate_limit_delay(response, 0) is None
+
+
+def test_send_waits_and_retries(make_client, sleeps):
+    client = make_client()
+    client._session.responses = [_response(429, headers={"Retry-After": "2"}), _response(204)]
+    waits = []
+    
+    response = client._send("DELETE", "https://api.github.com/repos/o/r", on_wait=waits.append)
+    
+    assert response.status_code == 204
+    assert waits == sleeps == [2.0]
+    assert len(client._session.requests) == client._rate_limiter.acquired == 2
+
+
+def test_send_gives_up_after_max_retries(make_client, sleeps):
+    client = make_client()
+    retries = github_client_module.MAX_RATE_LIMIT_RETRIES
+    client._session.responses = [_response(429, headers={"Retry-After": "1"}) for _ in range(retries + 1)]
+    
+    response = client._send("DELETE", "https://api.github.com/repos/o/r")
+    
+    assert response.status_code == 429
+    assert len(sleeps) == retries
+    assert len(client._session.requests) == retries + 1
+
+
+def test_send_does_not_wait_past_max_wait(make_client, sleeps):
+    client = make_client()
+    wait = github_client_module.RATE_LIMIT_MAX_WAIT_SECONDS + 1
+    client._session.responses = [_response(429, headers={"Retry-After": str(wait)})]
+    
+    response = client._send("DELETE", "https://api.github.com/repos/o/r")
+    
+    assert response.status_code == 429
+    assert sleeps == []
+
+
+def test_repo_request_waits_when_only_token_is_rate_limited(make_client, sleeps):
+    client = make_client()
+    client._session.responses = [_rate_limited(reset_in=5), _response(200, [{"sha": "abc"}])]
+    waits = []
+    
+    data = client._get_json("/repos/o/r/commits", {"page": 1}, on_wait=waits.append)
+    
+    assert data == [{"sha": "abc"}]
+    assert waits == sleeps == [6.0]
+    assert client._session.tokens_used() == ["Bearer token-a", "Bearer token-a"]
+
+
+def test_repo_request_backs_off_on_secondary_limit(make_client, sleeps):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_secondary_limited(), _response(200, [])]
+    
+    assert client._get_json("/repos/o/r/pulls") == []
+    assert len(sleeps) == 1
+    assert len(client._session.requests) == 2
+
+
+def test_repo_request_waits_once_every_token_is_rate_limited(make_client, sleeps):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [
+        _rate_limited(reset_in=5), _rate_limited(reset_in=5), _response(200, []),
+    ]
+    
+    assert client._get_json("/repos/o/r/pulls") == []
+    
+    # 다른 토큰을 먼저 시도하고, 모든 토큰이 한도에 걸렸을 때만 기다림
+    assert client._session.tokens_used()[:2] == ["Bearer token-a", "Bearer token-b"]
+    assert sleeps == [6.0]
+
+
+def test_repo_request_returns_rate_limit_error_after_max_retries(make_client, sleeps):
+    client = make_client()
+    retries = github_client_module.MAX_RATE_LIMIT_RETRIES
+    client._session.responses = [_secondary_limited() for _ in range(retries + 1)]
+    
+    with pytest.raises(requests.HTTPError):
+        client._get_json("/repos/o/r/commits")
+    assert len(sleeps) == retries
+
+
+def test_every_repo_request_attempt_goes_through_rate_limiter(make_client, sleeps):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_rate_limited(), _response(200, {})]
+    
+    client._get_json("/repos/o/r")
+    
+    assert client._rate_limiter.acquired == len(client._session.requests) == 2
+
+
+def test_private_repo_404_falls_back_to_other_tokens(make_client):
+    client = make_client(("token-a", "token-b", "token-c"))
+    next(client._token_cycle)  # 라운드 로빈이 token-b부터 고르도록 한 칸 진행
+    client._session.responses = [_response(404), _response(200, {"id": 1})]
+    
+    assert client._get_json("/repos/o/private") == {"id": 1}
+    
+    # 기본 토큰부터 나머지 토큰을 시도하고, 성공한 토큰을 리포지토리에 고정
+    assert client._session.tokens_used() == ["Bearer token-b", "Bearer token-a"]
+    assert client._repo_token["o/private"] == 0
+
+
+def test_pinned_token_is_reused_for_the_repo(make_client):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_response(200, {"id": 1}), _response(200, []), _response(200, [])]
+    
+    client._get_json("/repos/o/r")
+    client._get_json("/repos/o/r/commits")
+    client._get_json("/repos/o/r/pulls", {"state": "open"})
+    
+    # 라운드 로빈과 관계없이 처음 성공한 토큰으로 같은 리포지토리 요청을 보냄
+    assert client._session.tokens_used() == ["Bearer token-a"] * 3
+
+
+def test_new_repos_are_spread_across_tokens(make_client):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_response(200, {"id": 1}), _response(200, {"id": 2})]
+    
+    client._get_json("/repos/o/one")
+    client._get_json("/repos/o/two")
+    
+    assert client._session.tokens_used() == ["Bearer token-a", "Bearer token-b"]
+    assert client._repo_token == {"o/one": 0, "o/two": 1}
+
+
+def test_404_on_pinned_token_is_not_retried(make_client):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_response(200, {"id": 1}), _response(404)]
+    client._get_json("/repos/o/r")
+    
+    with pytest.raises(requests.HTTPError):
+        client._get_json("/repos/o/r")
+    assert len(client._session.requests) == 2
+
+
+def test_404_on_every_token_is_returned(make_client):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_response(404), _response(404)]
+    
+    with pytest.raises(requests.HTTPError):
+        client._get_json("/repos/o/missing")
+    assert client._session.tokens_used() == ["Bearer token-a", "Bearer token-b"]
+    assert "o/missing" not in client._repo_token
+
+
+def test_rate_limited_token_is_skipped_until_reset(make_client, sleeps):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_rate_limited(reset_in=60), _response(200, {}), _response(200, {})]
+    
+    client._get_json("/repos/o/one")
+    client._get_json("/repos/o/two")
+    
+    # 한도에 걸린 token-a는 초기화 시각까지 건너뛰므로 기다리지 않고 token-b만 사용
+    assert client._session.tokens_used() == ["Bearer token-a", "Bearer token-b", "Bearer token-b"]
+    assert client._repo_token == {"o/one": 1, "o/two": 1}
+    assert sleeps == []
+
+
+def test_invalidate_repository_clears_pinned_token(make_client):
+    client = make_client(("token-a", "token-b"))
+    client._session.responses = [_response(200, {}), _response(200, {})]
+    client._get_json("/repos/o/one")
+    client._get_json("/repos/o/two")
+    
+    client.invalidate_repository("o/one")
+    assert client._repo_token == {"o/two": 1}
+    
+    client.invalidate_repository()
+    assert client._repo_token == {}
+
+
+def test_get_json_reuses_cached_body_on_304(make_client):
+    client = make_client()
+    client._session.responses = [
+        _response(200, [{"sha": "abc"}], {"ETag": 'W/"v1"'}),
+        _response(304),
+    ]
+    
+    first = client._get_json("/repos/o/r/commits", {"sha": "main", "page": 1})
+    second = client._get_json("/repos/o/r/commits", {"page": 1, "sha": "main"})
+    
+    assert first == second == [{"sha": "abc"}]
+    assert "If-None-Match" not in client._session.requests[0]["headers"]
+    assert client._session.requests[1]["headers"]["If-None-Match"] == 'W/"v1"'
+
+
+def test_get_json_keys_etags_by_query(make_client):
+    client = make_client()
+    client._session.responses = [
+        _response(200, [1], {"ETag": '"page1"'}),
+        _response(200, [2], {"ETag": '"page2"'}),
+    ]
+    
+    assert client._get_json("/repos/o/r/pulls", {"page": 1}) == [1]
+    assert client._get_json("/repos/o/r/pulls", {"page": 2}) == [2]
+    
+    # 다른 페이지 요청에는 앞 페이지의 ETag를 보내지 않음
+    assert "If-None-Match" not in client._session.requests[1]["headers"]
+
+
+def test_get_json_updates_cache_on_changed_response(make_client):
+    client = make_client()
+    client._session.responses = [
+        _response(200, {"name": "r"}, {"ETag": '"v1"'}),
+        _response(200, {"name": "r2"}, {"ETag": '"v2"'}),
+        _response(304),
+    ]
+    
+    client._get_json("/repos/o/r")
+    assert client._get_json("/repos/o/r") == {"name": "r2"}
+    assert client._get_json("/repos/o/r") == {"name": "r2"}
+    assert client._session.requests[2]["headers"]["If-None-Match"] == '"v2"'
+
+
+def test_get_json_without_etag_is_not_cached(make_client):
+    client = make_client()
+    client._session.responses = [_response(200, {"id": 1}), _response(200, {"id": 1})]
+    
+    client._get_json("/repos/o/r")
+    client._get_json("/repos/o/r")
+    
+    assert "If-None-Match" not in client._session.requests[1]["headers"]
+
+
+def test_etag_cache_evicts_least_recently_used(make_client, monkeypatch):
+    monkeypatch.setattr(github_client_module, "ETAG_CACHE_MAX", 2)
+    client = make_client()
+    client._session.responses = [
+        _response(200, {"id": 1}, {"ETag": '"1"'}),
+        _response(200, {"id": 2}, {"ETag": '"2"'}),
+        _response(304),
+        _response(200, {"id": 3}, {"ETag": '"3"'}),
+    ]
+    
+    client._get_json("/repos/o/one")
+    client._get_json("/repos/o/two")
+    client._get_json("/repos/o/one")  # 304로 재사용하면 가장 최근 항목이 됨
+    client._get_json("/repos/o/three")
+    
+    assert list(client._etag_cache) == [
+        "https://api.github.com/repos/o/one",
+        "https://api.github.com/repos/o/three",
+    ]
+
+
+def test_etag_cache_persists_only_repository_metadata(make_client, tmp_path):
+    client = make_client()
+    client._session.responses = [
+        _response(200, {"id": 1}, {"ETag": '"repo"'}),
+        _response(200, [], {"ETag": '"commits"'}),
+        _response(200, {"id": 1}, {"ETag": '"query"'}),
+    ]
+    client._get_json("/repos/o/r")
+    client._get_json("/repos/o/r/commits")
+    client._get_json("/repos/o/r", {"page": 1})
+    
+    client._save_etag_cache()
+    
+    stored = json.loads((tmp_path / "etags.json").read_text(encoding="utf-8"))
+    assert stored == {"https://api.github.com/repos/o/r": ['"repo"', {"id": 1}]}
+    
+    # 다음 실행(초기화)에서 저장된 ETag로 조건부 요청
+    restored = make_client()
+    restored._session.responses = [_response(304)]
+    assert restored._get_json("/repos/o/r") == {"id": 1}
+    assert restored._session.requests[0]["headers"]["If-None-Match"] == '"repo"'
+
+
+def _repo(full_name, repo_id):
+    owner, name = full_name.split("/")
+    return _repo_info_from({
+        "id": repo_id, "name": name, "full_name": full_name,
+        "html_url": f"https://github.com/{full_name}",
+        "clone_url": f"https://github.com/{full_name}.git",
+        "ssh_url": f"git@github.com:{full_name}.git",
+        "private": False, "fork": False, "owner": {"login": owner},
+    })
+
+
+def _stored_repo_names(tmp_path, user="o"):
+    with closing(sqlite3.connect(tmp_path / "repo_cache.db")) as conn:
+        row = conn.execute("SELECT payload FROM repos WHERE user = ?", (user,)).fetchone()
+    return None if row is None else [repo["full_name"] for repo in json.loads(row[0])]
+
+
+@pytest.fixture
+def cached_client(make_client):
+    """리포지토리 목록이 메모리와 디스크에 캐시된 클라이언트"""
+    client = make_client()
+    client._user_login = "o"
+    client._repo_list_result = [_repo("o/one", 1), _repo("o/two", 2)]
+    client._persist_repositories(client._repo_list_result)
+    return client
+
+
+def test_rename_replaces_cached_repository(cached_client, tmp_path):
+    cached_client._update_cached_repository("o/one", _repo("o/renamed", 1))
+    
+    assert [repo.full_name for repo in cached_client._repo_list_result] == ["o/renamed", "o/two"]
+    assert _stored_repo_names(tmp_path) == ["o/renamed", "o/two"]
+
+
+def test_delete_removes_cached_repository(cached_client, tmp_path):
+    cached_client._update_cached_repository("o/two", None)
+    
+    assert [repo.full_name for repo in cached_client._repo_list_result] == ["o/one"]
+    assert _stored_repo_names(tmp_path) == ["o/one"]
+
+
+def test_update_without_list_in_memory_drops_disk_cache(cached_client, tmp_path):
+    cached_client._repo_list_result = None
+    
+    cached_client._update_cached_repository("o/two", None)
+    
+    assert _stored_repo_names(tmp_path) is None
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+API 응답 캐시 모듈 테스트
+"""
+import pytest
+
+from utils import api_cache
+from utils.api_cache import TTLCache, ttl_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(api_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("key", "value")
+    
+    clock[0] += 9.9
+    assert cache.get("key") == "value"
+    
+    clock[0] += 0.1
+    assert cache.get("key") is None
+    assert cache.get("key", "default") == "default"
+
+
+def test_expired_entry_is_removed(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("key", "value")
+    
+    clock[0] += 10
+    cache.get("key")
+    
+    assert "key" not in cache._data
+
+
+def test_set_refreshes_expiry(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("key", "old")
+    clock[0] += 8
+    cache.set("key", "new")
+    clock[0] += 8
+    
+    assert cache.get("key") == "new"
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    # a를 읽으면 가장 최근에 사용한 항목이 되므로 b가 제거됨
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate_prefix_removes_matching_tuple_keys(clock):
+    cache = TTLCache(maxsize=8, ttl=10)
+    cache.set(("owner/repo", "readme"), 1)
+    cache.set(("owner/repo", "commits", "main"), 2)
+    cache.set(("owner/repo2", "readme"), 3)
+    cache.set("owner/repo", 4)
+    
+    cache.invalidate_prefix("owner/repo")
+    
+    assert cache.get(("owner/repo", "readme")) is None
+    assert cache.get(("owner/repo", "commits", "main")) is None
+    assert cache.get(("owner/repo2", "readme")) == 3
+    assert cache.get("owner/repo") == 4
+
+
+def test_invalidate_prefix_with_longer_prefix(clock):
+    cache = TTLCache(maxsize=8, ttl=10)
+    cache.set(("owner/repo", "commits", "main"), 1)
+    cache.set(("owner/repo", "commits", "dev"), 2)
+    
+    cache.invalidate_prefix("owner/repo", "commits", "main")
+    
+    assert cache.get(("owner/repo", "commits", "main")) is None
+    assert cache.get(("owner/repo", "commits", "dev")) == 2
+
+
+def test_pop_and_clear(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+    
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_get_or_fetch_skips_results_rejected_by_should_cache(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        return (False, "error")
+    
+    should_cache = lambda result: result[0]
+    assert cache.get_or_fetch("key", fetch, should_cache) == (False, "error")
+    assert cache.get_or_fetch("key", fetch, should_cache) == (False, "error")
+    assert len(calls) == 2
+
+
+def test_get_or_fetch_caches_none_values(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        return None
+    
+    cache.get_or_fetch("key", fetch)
+    cache.get_or_fetch("key", fetch)
+    
+    assert len(calls) == 1
+
+
+def test_ttl_cache_decorator_caches_per_arguments(clock):
+    calls = []
+    
+    @ttl_cache(ttl=10, maxsize=4)
+    def square(value, offset=0):
+        calls.append(value)
+        return value * value + offset
+    
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(3, offset=1) == 10
+    assert calls == [3, 3]
+    
+    clock[0] += 10
+    assert square(3) == 9
+    assert calls == [3, 3, 3]
+    assert isinstance(square.cache, TTLCache)
\ No newline at end of file
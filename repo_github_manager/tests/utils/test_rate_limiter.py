@@ -0,0 +1,107 @@
+"""
+요청 속도 제한 모듈 테스트
+"""
+import pytest
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter, backoff_delay
+
+
+class _FakeClock:
+    """time.monotonic/time.sleep을 대신하는 가짜 시계"""
+    
+    def __init__(self, advance_on_sleep: bool = True):
+        self.now = 100.0
+        self.sleeps = []
+        self.advance_on_sleep = advance_on_sleep
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        if self.advance_on_sleep:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_burst_passes_without_waiting(clock):
+    limiter = RateLimiter(rps=10, burst=3)
+    
+    for _ in range(3):
+        with limiter.acquire():
+            pass
+    
+    assert clock.sleeps == []
+
+
+def test_requests_after_burst_are_spaced_by_rate(clock):
+    limiter = RateLimiter(rps=10, burst=2)
+    
+    for _ in range(5):
+        with limiter.acquire():
+            pass
+    
+    # 버스트 2개 이후에는 1/rps 간격으로 대기
+    assert clock.sleeps == [0.1, 0.1, 0.1]
+
+
+def test_concurrent_waiters_reserve_increasing_delays(clock):
+    # 대기 중에 시간이 흐르지 않으면(동시에 도착한 요청) 예약한 순서대로 대기 시간이 늘어남
+    clock.advance_on_sleep = False
+    limiter = RateLimiter(rps=10, burst=1)
+    
+    for _ in range(4):
+        with limiter.acquire():
+            pass
+    
+    assert clock.sleeps == [0.1, 0.2, 0.3]
+
+
+def test_tokens_refill_while_idle(clock):
+    limiter = RateLimiter(rps=10, burst=2)
+    for _ in range(2):
+        with limiter.acquire():
+            pass
+    
+    # 버킷이 다시 찰 만큼 쉬면 대기 없이 버스트 가능
+    clock.now += 1.0
+    for _ in range(2):
+        with limiter.acquire():
+            pass
+    
+    assert clock.sleeps == []
+
+
+def test_tokens_do_not_exceed_burst(clock):
+    limiter = RateLimiter(rps=10, burst=2)
+    clock.now += 60.0
+    
+    for _ in range(3):
+        with limiter.acquire():
+            pass
+    
+    assert clock.sleeps == [0.1]
+
+
+@pytest.mark.parametrize("attempt", [0, 1, 2, 3, 4, 5])
+def test_backoff_delay_grows_exponentially_with_jitter(attempt):
+    delay = backoff_delay(attempt)
+    
+    assert 2 ** attempt <= delay <= 2 ** attempt + 1
+
+
+def test_backoff_delay_is_capped(monkeypatch):
+    monkeypatch.setattr(rate_limiter.random, "uniform", lambda low, high: high)
+    
+    assert backoff_delay(5) == 33
+    assert backoff_delay(6) == rate_limiter.MAX_BACKOFF_SECONDS
+    assert backoff_delay(30) == rate_limiter.MAX_BACKOFF_SECONDS
+    assert backoff_delay(3, cap=5.0) == 5.0
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+API 응답 캐시 모듈
+GitHub API 응답을 일정 시간 동안 메모리에 보관하여 반복 요청을 줄입니다.
+"""
+import time
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 캐시 유효 시간 (초)
+DEFAULT_TTL_SECONDS = 90
+
+# 기본 최대 항목 수
+DEFAULT_MAXSIZE = 512
+
+# 캐시에 없음을 나타내는 표식
+_MISSING = object()
+
+
+class TTLCache:
+    """유효 시간과 최대 크기가 있는 스레드 안전 캐시"""
+    
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL_SECONDS):
+        """
+        캐시 초기화
+        
+        Args:
+            maxsize (int, optional): 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+            ttl (float, optional): 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시된 값을 반환합니다.
+        
+        Args:
+            key (Hashable): 캐시 키
+            default (Any, optional): 항목이 없거나 만료되었을 때 반환할 값
+        
+        Returns:
+            Any: 캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        값을 캐시에 저장합니다.
+        
+        Args:
+            key (Hashable): 캐시 키
+            value (Any): 저장할 값
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 항목을 제거하고 값을 반환합니다.
+        
+        Args:
+            key (Hashable): 캐시 키
+            default (Any, optional): 항목이 없을 때 반환할 값
+        
+        Returns:
+            Any: 제거된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def invalidate_prefix(self, *prefix: Hashable) -> None:
+        """
+        튜플 키의 앞부분이 일치하는 항목을 모두 제거합니다.
+        예를 들어 invalidate_prefix("owner/repo")는 해당 리포지토리의 모든 응답을 제거합니다.
+        
+        Args:
+            *prefix (Hashable): 키 앞부분
+        """
+        size = len(prefix)
+        with self._lock:
+            for key in [k for k in self._data if isinstance(k, tuple) and k[:size] == prefix]:
+                del self._data[key]
+    
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._data.clear()
+    
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any],
+                     should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 fetch를 호출하여 결과를 저장합니다.
+        
+        Args:
+            key (Hashable): 캐시 키
+            fetch (Callable[[], Any]): 값을 가져올 함수
+            should_cache (Optional[Callable[[Any], bool]]): 결과 저장 여부를 판단할 함수
+                (예: 실패 결과는 저장하지 않기)
+        
+        Returns:
+            Any: 캐시된 값 또는 새로 가져온 값
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            logger.debug(f"API 캐시 적중: {key}")
+            return value
+        
+        value = fetch()
+        if should_cache is None or should_cache(value):
+            self.set(key, value)
+        return value
+
+
+def ttl_cache(ttl: float = DEFAULT_TTL_SECONDS, maxsize: int = DEFAULT_MAXSIZE) -> Callable:
+    """
+    함수 결과를 인자별로 ttl초 동안 캐시하는 데코레이터를 만듭니다.
+    데코레이트된 함수의 cache 속성으로 캐시에 접근할 수 있습니다.
+    
+    Args:
+        ttl (float, optional): 항목 유효 시간 (초)
+        maxsize (int, optional): 최대 항목 수
+    
+    Returns:
+        Callable: 데코레이터
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            return cache.get_or_fetch(key, lambda: func(*args, **kwargs))
+        
+        wrapper.cache = cache
+        return wrapper
+    
+    return decorator
+
+
+# 싱글톤 인스턴스 (UI에서 사용하는 GitHub API 응답 공용 캐시)
+api_cache = TTLCache()
\ No newline at end of file
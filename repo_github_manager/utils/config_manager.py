@@ -4,11 +4,24 @@ GitHub PAT와 같은 민감한 정보 및 애플리케이션 설정을 관리합
 """
 import os
 import json
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
+# orjson이 있으면 설정 파일 읽기/쓰기에 사용하고, 없으면 표준 json으로 대체
+try:
+    from orjson import loads as _json_loads, dumps as _orjson_dumps, OPT_INDENT_2
+    
+    def _json_dumps(data: Any) -> bytes:
+        return _orjson_dumps(data, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as _json_loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
@@ -23,9 +36,11 @@ DEFAULT_CONFIG = {
 CONFIG_PATH = Path.home() / ".github_repo_manager" / "config.json"
 
 
+@functools.lru_cache(maxsize=1)
 def load_github_pat() -> Optional[str]:
     """
     .env 파일에서 GitHub 개인 액세스 토큰을 로드합니다.
+    결과는 캐시되므로 토큰을 바꾼 뒤에는 reload_github_pat()를 호출해야 합니다.
     
     Returns:
         Optional[str]: GitHub PAT 또는 None (로드 실패 시)
@@ -42,17 +57,78 @@ def load_github_pat() -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def load_github_pats() -> Tuple[str, ...]:
+    """
+    여러 계정의 GitHub PAT 목록을 로드합니다.
+    GITHUB_PAT를 첫 번째(기본) 토큰으로 두고, GITHUB_PATS에 쉼표로 구분한 추가 토큰을 덧붙입니다.
+    
+    Returns:
+        Tuple[str, ...]: GitHub PAT 목록 (중복 제거, 없으면 빈 튜플)
+    """
+    tokens = []
+    primary = load_github_pat()
+    if primary:
+        tokens.append(primary)
+    
+    try:
+        for token in os.getenv("GITHUB_PATS", "").split(","):
+            token = token.strip()
+            if token and token not in tokens:
+                tokens.append(token)
+    except Exception as e:
+        logger.error(f"GITHUB_PATS 로드 중 오류 발생: {e}")
+    
+    return tuple(tokens)
+
+
+def _reset_pat_cache() -> None:
+    """
+    캐시된 GitHub PAT를 비워 다음 load_github_pat(s) 호출 시 .env 파일을 다시 읽도록 합니다.
+    """
+    load_github_pat.cache_clear()
+    load_github_pats.cache_clear()
+
+
+def reload_github_pat() -> Optional[str]:
+    """
+    .env 파일을 다시 읽어 캐시된 GitHub PAT를 갱신합니다.
+    이미 설정된 환경 변수도 .env 파일의 값으로 덮어씁니다.
+    
+    Returns:
+        Optional[str]: GitHub PAT 또는 None (로드 실패 시)
+    """
+    _reset_pat_cache()
+    try:
+        load_dotenv(override=True)
+    except Exception as e:
+        logger.error(f".env 파일 다시 로드 중 오류 발생: {e}")
+    return load_github_pat()
+
+
 def load_app_config() -> Dict[str, Any]:
     """
     애플리케이션 설정을 로드합니다. 설정 파일이 없으면 기본 설정을 반환합니다.
+    파일은 처음 한 번만 읽고, 이후에는 캐시된 설정의 복사본을 반환합니다.
+    
+    Returns:
+        Dict[str, Any]: 애플리케이션 설정 (호출자가 수정해도 캐시에는 영향 없음)
+    """
+    return dict(_read_app_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _read_app_config() -> Dict[str, Any]:
+    """
+    설정 파일을 읽어 기본 설정과 병합합니다.
+    결과는 캐시되며 save_app_config로 저장하면 비워집니다.
     
     Returns:
         Dict[str, Any]: 애플리케이션 설정
     """
     try:
         if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = _json_loads(CONFIG_PATH.read_bytes())
             # 기본 설정과 병합하여 누락된 설정이 있으면 기본값 사용
             merged_config = DEFAULT_CONFIG.copy()
             merged_config.update(config)
@@ -68,6 +144,7 @@ def load_app_config() -> Dict[str, Any]:
 def save_app_config(config: Dict[str, Any]) -> bool:
     """
     애플리케이션 설정을 저장합니다.
+    임시 파일에 먼저 쓴 뒤 교체하므로 저장 도중 종료되어도 기존 설정 파일이 손상되지 않습니다.
     
     Args:
         config (Dict[str, Any]): 저장할 설정
@@ -79,8 +156,13 @@ def save_app_config(config: Dict[str, Any]) -> bool:
         # 설정 디렉토리가 없으면 생성
         os.makedirs(CONFIG_PATH.parent, exist_ok=True)
         
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(config))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_PATH)
+        _read_app_config.cache_clear()  # 다음 로드 시 저장된 설정을 다시 읽음
         logger.info("설정이 저장되었습니다.")
         return True
     except Exception as e:
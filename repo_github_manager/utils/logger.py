@@ -3,51 +3,92 @@
 애플리케이션 전반에서 사용되는 로깅 시스템을 설정합니다.
 """
 import os
+import queue
+import atexit
 import logging
+import logging.handlers
+import functools
+import threading
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
-
-from utils.config_manager import load_app_config
 
 # 로그 파일이 저장될 디렉토리
 LOG_DIR = Path.home() / ".github_repo_manager" / "logs"
 
+# 자정마다 로그 파일을 교체하고 보관할 이전 로그 파일 수 (일)
+LOG_BACKUP_DAYS = 14
 
-def setup_logger(name: Optional[str] = None) -> logging.Logger:
+# 루트 로거 핸들러 설정을 직렬화하는 잠금 (lru_cache는 동시에 처음 호출되면 함수를 두 번 실행할 수 있음)
+_handlers_lock = threading.Lock()
+
+# 콘솔/파일 출력을 별도 스레드에서 처리하는 리스너 (루트 로거에는 큐 핸들러만 둠)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_log_level() -> int:
     """
-    로거를 설정하고 반환합니다.
+    설정에서 로그 레벨을 읽습니다.
+    프로세스당 한 번만 실행되고 이후에는 캐시된 값을 반환합니다.
     
-    Args:
-        name (Optional[str]): 로거 이름 (없으면 루트 로거 사용)
-        
     Returns:
-        logging.Logger: 설정된 로거
+        int: 로그 레벨
     """
-    # 로그 디렉토리 생성
-    os.makedirs(LOG_DIR, exist_ok=True)
-    
-    # 설정에서 로그 레벨 가져오기
+    # 설정에서 로그 레벨 가져오기 (config_manager와 서로 import하지 않도록 필요할 때 import)
+    from utils.config_manager import load_app_config
     config = load_app_config()
     log_level_str = config.get("log_level", "INFO")
-    log_level = getattr(logging, log_level_str, logging.INFO)
+    return getattr(logging, log_level_str, logging.INFO)
+
+
+class _LazyDirFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """로그 파일을 처음 열 때 로그 디렉토리를 만드는 파일 핸들러 (delay=True와 함께 사용)"""
     
-    # 로거 가져오기
-    logger = logging.getLogger(name)
-    logger.setLevel(log_level)
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_handlers() -> None:
+    """
+    루트 로거에 콘솔/파일 핸들러를 한 번만 설정합니다.
+    각 모듈의 로거는 기록을 루트로 전파하므로 한 기록이 핸들러마다 한 번씩만 포맷되고 출력됩니다.
+    """
+    log_level = _get_log_level()
     
-    # 이미 핸들러가 설정되어 있으면 추가 설정 안함
-    if logger.handlers:
-        return logger
+    with _handlers_lock:
+        root_logger = logging.getLogger()
+        root_logger.setLevel(log_level)
+        
+        # 이미 핸들러가 설정되어 있으면 추가 설정 안함
+        if root_logger.handlers:
+            return
+        
+        _add_root_handlers(root_logger, log_level)
+
+
+def _add_root_handlers(root_logger: logging.Logger, log_level: int) -> None:
+    """
+    루트 로거에 공용 콘솔/파일 핸들러를 추가합니다.
     
+    로거를 호출한 스레드(GUI 스레드 포함)는 기록을 큐에 넣기만 하고,
+    실제 콘솔/파일 쓰기는 QueueListener 스레드에서 처리합니다.
+    
+    Args:
+        root_logger (logging.Logger): 루트 로거
+        log_level (int): 로그 레벨
+    """
     # 콘솔 핸들러 설정
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     
-    # 파일 핸들러 설정 (날짜별 로그 파일)
-    today = datetime.now().strftime("%Y-%m-%d")
-    log_file = LOG_DIR / f"app_{today}.log"
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    # 파일 핸들러 설정 (자정마다 app.log.YYYY-MM-DD로 교체, 오래된 파일은 자동 삭제)
+    # 첫 기록 전에는 파일을 열지 않고, 로그 디렉토리도 그때 만듦
+    file_handler = _LazyDirFileHandler(
+        LOG_DIR / "app.log", when="midnight", backupCount=LOG_BACKUP_DAYS,
+        encoding="utf-8", delay=True
+    )
     file_handler.setLevel(log_level)
     
     # 포맷터 설정
@@ -57,9 +98,43 @@ def setup_logger(name: Optional[str] = None) -> logging.Logger:
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
     
-    # 핸들러 추가
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # 핸들러 추가 (루트 로거에는 큐 핸들러만 두고, 출력은 리스너 스레드에서 처리)
+    global _listener
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_stop_listener)
+    
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def _stop_listener() -> None:
+    """큐에 남은 기록을 모두 출력하고 리스너 스레드를 종료합니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+@functools.lru_cache(maxsize=None)
+def setup_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    로거를 설정하고 반환합니다.
+    같은 이름으로 다시 호출하면 이미 설정된 로거를 그대로 반환합니다.
+    
+    Args:
+        name (Optional[str]): 로거 이름 (없으면 루트 로거 사용)
+        
+    Returns:
+        logging.Logger: 설정된 로거
+    """
+    _configure_handlers()
+    
+    # 로거 가져오기 (핸들러는 루트 로거에만 두고 기록은 전파)
+    logger = logging.getLogger(name)
+    logger.setLevel(_get_log_level())
     
     return logger
 
@@ -3,6 +3,8 @@ macOS 시스템 유틸리티 모듈
 macOS 권한 확인 및 시스템 정보 관련 기능을 제공합니다.
 """
 import os
+import shutil
+import functools
 import subprocess
 import platform
 import logging
@@ -14,10 +16,16 @@ from utils.logger import setup_logger
 # 로거 설정
 logger = setup_logger(__name__)
 
+# 홈 디렉토리와 애플리케이션 설정 디렉토리 (실행 중에는 바뀌지 않으므로 모듈 로드 시 한 번만 계산)
+HOME_DIR = str(Path.home())
+CONFIG_DIR = os.path.join(HOME_DIR, ".github_repo_manager")
 
+
+@functools.lru_cache(maxsize=1)
 def check_macos_version() -> Tuple[bool, str]:
     """
     현재 실행 중인 macOS 버전을 확인합니다.
+    실행 중에는 바뀌지 않으므로 처음 한 번만 확인하고 결과를 캐시합니다.
     
     Returns:
         Tuple[bool, str]: (macOS 여부, 버전 정보)
@@ -34,12 +42,21 @@ def check_file_permission(path: str) -> bool:
     """
     지정된 경로에 파일 시스템 권한이 있는지 확인합니다.
     
+    access(2) 한 번으로 쓰기 권한을 확인합니다. 단, macOS 앱 샌드박스 안에서는
+    access(2)가 샌드박스 제한을 반영하지 않으므로 실제로 파일을 써서 확인합니다.
+    
     Args:
         path (str): 확인할 경로
         
     Returns:
         bool: 권한 여부
     """
+    if not os.environ.get("APP_SANDBOX_CONTAINER_ID"):
+        if os.access(path, os.W_OK):
+            return True
+        logger.warning(f"경로에 쓰기 권한이 없습니다: {path}")
+        return False
+    
     try:
         test_file = os.path.join(path, ".permission_test")
         with open(test_file, "w") as f:
@@ -55,13 +72,32 @@ def check_file_permission(path: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def is_git_installed() -> bool:
     """
     Git이 설치되어 있는지 확인합니다.
+    프로세스를 실행하지 않고 PATH에서 git 실행 파일만 찾으며, 결과를 캐시합니다.
     
     Returns:
         bool: Git 설치 여부
     """
+    git_path = shutil.which("git")
+    if git_path:
+        logger.info(f"Git 설치 확인: {git_path}")
+        return True
+    
+    logger.warning("Git이 설치되어 있지 않습니다.")
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def get_git_version() -> Optional[str]:
+    """
+    설치된 Git 버전 문자열을 가져옵니다. 필요할 때만 git 프로세스를 실행하고 결과를 캐시합니다.
+    
+    Returns:
+        Optional[str]: 버전 문자열 (예: "git version 2.39.2"), 확인할 수 없으면 None
+    """
     try:
         result = subprocess.run(
             ["git", "--version"],
@@ -72,37 +108,40 @@ def is_git_installed() -> bool:
         )
         
         if result.returncode == 0:
-            version = result.stdout.strip()
-            logger.info(f"Git 설치 확인: {version}")
-            return True
-        else:
-            logger.warning("Git이 설치되어 있지 않습니다.")
-            return False
+            return result.stdout.strip()
+        
+        logger.warning("Git 버전을 확인할 수 없습니다.")
+        return None
     except Exception as e:
-        logger.error(f"Git 설치 확인 중 오류 발생: {str(e)}")
-        return False
+        logger.error(f"Git 버전 확인 중 오류 발생: {str(e)}")
+        return None
+
+
+def _check_config_dir_permission() -> bool:
+    """
+    애플리케이션 설정 디렉토리를 만들고 쓰기 권한이 있는지 확인합니다.
+    
+    Returns:
+        bool: 권한 여부
+    """
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    return check_file_permission(CONFIG_DIR)
 
 
 def check_system_requirements() -> Dict[str, Any]:
     """
     애플리케이션 실행을 위한 시스템 요구사항을 확인합니다.
+    macOS 버전과 Git 설치 여부는 캐시된 결과를 사용하고, 바뀔 수 있는 쓰기 권한은 매번 확인합니다.
     
     Returns:
         Dict[str, Any]: 시스템 요구사항 충족 여부
     """
-    # macOS 버전 확인
+    # macOS 버전과 Git 설치 여부는 캐시된 값이고 권한 확인은 access(2) 한 번(샌드박스에서는 작은 파일 쓰기)이므로
+    # 스레드 풀을 만드는 비용이 더 커서 차례로 확인
     is_macos, macos_version = check_macos_version()
-    
-    # Git 설치 확인
     git_available = is_git_installed()
-    
-    # 설정 디렉토리 권한 확인
-    config_dir = Path.home() / ".github_repo_manager"
-    os.makedirs(config_dir, exist_ok=True)
-    config_permission = check_file_permission(str(config_dir))
-    
-    # 홈 디렉토리 권한 확인
-    home_permission = check_file_permission(str(Path.home()))
+    config_permission = _check_config_dir_permission()
+    home_permission = check_file_permission(HOME_DIR)
     
     return {
         "is_macos": is_macos,
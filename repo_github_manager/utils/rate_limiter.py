@@ -0,0 +1,86 @@
+"""
+요청 속도 제한 모듈
+토큰 버킷 방식으로 GitHub API 요청 속도를 조절하고, 요청 한도에 걸렸을 때의 재시도 대기 시간을 계산합니다.
+"""
+import time
+import random
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 초당 요청 수
+DEFAULT_RPS = 5.0
+
+# 기본 버스트 크기 (쉬고 있다가 연달아 보낼 수 있는 최대 요청 수)
+DEFAULT_BURST = 10
+
+# 지수 백오프 최대 대기 시간 (초)
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class RateLimiter:
+    """토큰 버킷 방식의 스레드 안전 요청 속도 제한기"""
+    
+    def __init__(self, rps: float = DEFAULT_RPS, burst: int = DEFAULT_BURST):
+        """
+        속도 제한기 초기화
+        
+        Args:
+            rps (float, optional): 초당 채워지는 토큰 수 (평균 초당 요청 수)
+            burst (int, optional): 버킷 크기 (한 번에 보낼 수 있는 최대 요청 수)
+        """
+        self.rps = rps
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        토큰 하나를 예약하고, 토큰이 모자라면 기다려야 할 시간을 반환합니다.
+        모자란 만큼 음수로 미리 가져가므로 동시에 기다리는 스레드는 도착 순서대로 간격을 두고 깨어납니다.
+        
+        Returns:
+            float: 대기 시간 (초, 바로 보낼 수 있으면 0)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rps)
+            self._updated_at = now
+            self._tokens -= 1
+            return -self._tokens / self.rps if self._tokens < 0 else 0.0
+    
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """
+        요청을 보낼 수 있을 때까지 기다린 뒤 블록을 실행합니다.
+        
+        사용 예:
+            with limiter.acquire():
+                response = session.get(url)
+        """
+        delay = self._reserve()
+        if delay > 0:
+            logger.debug(f"요청 속도 제한으로 {delay:.2f}초 대기")
+            time.sleep(delay)
+        yield
+
+
+def backoff_delay(attempt: int, cap: float = MAX_BACKOFF_SECONDS) -> float:
+    """
+    재시도 횟수에 따른 지수 백오프 대기 시간을 계산합니다.
+    여러 요청이 같은 순간에 다시 몰리지 않도록 최대 1초의 무작위 지터를 더합니다.
+    
+    Args:
+        attempt (int): 지금까지의 재시도 횟수 (0부터)
+        cap (float, optional): 최대 대기 시간 (초)
+    
+    Returns:
+        float: 대기 시간 (초)
+    """
+    return min(cap, 2 ** attempt + random.uniform(0, 1))
\ No newline at end of file